@@ -305,6 +305,7 @@ module.exports = class Exchange {
             this['has' + capitalize (k)] = !!this.has[k] // converts 'emulated' to true
         }
 
+        this.restApiCosts = {}
         if (this.api) {
             this.defineRestApi (this.api, 'request')
         }
@@ -434,12 +435,15 @@ module.exports = class Exchange {
         for (let i = 0; i < keys.length; i++) {
             const key = keys[i]
             const value = api[key]
-            if (Array.isArray (value)) {
+            // a list of paths, or the costs by path, { 'depth': { 'cost': 1, 'byLimit': [ [ 100, 1 ], [ 500, 5 ] ] }, 'time': 1 }
+            const costs = (!Array.isArray (value) && this.isHttpMethod (key)) ? value : undefined
+            if (Array.isArray (value) || (costs !== undefined)) {
                 const uppercaseMethod = key.toUpperCase ()
                 const lowercaseMethod = key.toLowerCase ()
                 const camelcaseMethod = this.capitalize (lowercaseMethod)
-                for (let k = 0; k < value.length; k++) {
-                    const path = value[k].trim ()
+                const endpoints = (costs !== undefined) ? Object.keys (costs) : value
+                for (let k = 0; k < endpoints.length; k++) {
+                    const path = endpoints[k].trim ()
                     const splitPath = path.split (/[^a-zA-Z0-9]/)
                     const camelcaseSuffix  = splitPath.map (this.capitalize).join ('')
                     const underscoreSuffix = splitPath.map ((x) => x.trim ().toLowerCase ()).filter ((x) => x.length > 0).join ('_')
@@ -448,6 +452,10 @@ module.exports = class Exchange {
                     const camelcase  = camelcasePrefix + camelcaseMethod + this.capitalize (camelcaseSuffix)
                     const underscore = underscorePrefix + '_' + lowercaseMethod + '_' + underscoreSuffix
                     const typeArgument = (paths.length > 1) ? paths : paths[0]
+                    if (costs !== undefined) {
+                        const config = costs[endpoints[k]]
+                        this.restApiCosts[this.restApiCostKey (typeArgument, uppercaseMethod, path)] = (typeof config === 'number') ? { 'cost': config } : config
+                    }
                     const partial = async (params) => this[methodName] (path, typeArgument, uppercaseMethod, params || {})
                     this[camelcase]  = partial
                     this[underscore] = partial
@@ -458,6 +466,38 @@ module.exports = class Exchange {
         }
     }
 
+    isHttpMethod (key) {
+        return [ 'get', 'post', 'put', 'delete', 'patch', 'head' ].includes (key.toLowerCase ())
+    }
+
+    restApiCostKey (type, method, path) {
+        return JSON.stringify ([ type, method, path ])
+    }
+
+    calculateRateLimiterCost (type, method, path, params) {
+        // the cost of a request declared in the api map, undefined for the tokenBucket defaultCost
+        const config = this.restApiCosts[this.restApiCostKey (type, method, path)]
+        if (config === undefined) {
+            return undefined
+        }
+        if ((config['noSymbol'] !== undefined) && ((params === undefined) || (params['symbol'] === undefined))) {
+            return config['noSymbol']
+        }
+        const byLimit = config['byLimit']
+        if ((byLimit !== undefined) && (params !== undefined) && (params['limit'] !== undefined)) {
+            const limit = parseFloat (params['limit'])
+            if (!isNaN (limit)) {
+                for (let i = 0; i < byLimit.length; i++) {
+                    if (limit <= byLimit[i][0]) {
+                        return byLimit[i][1]
+                    }
+                }
+                return byLimit[byLimit.length - 1][1]
+            }
+        }
+        return config['cost']
+    }
+
     print (... args) {
         console.log (... args)
     }
@@ -505,7 +545,7 @@ module.exports = class Exchange {
     async fetch2 (path, type = 'public', method = 'GET', params = {}, headers = undefined, body = undefined) {
 
         if (this.enableRateLimit) {
-            await this.throttle (this.rateLimit)
+            await this.throttle (this.rateLimit, this.calculateRateLimiterCost (type, method, path, params))
         }
 
         const request = this.sign (path, type, method, params, headers, body)
@@ -646,9 +686,14 @@ module.exports = class Exchange {
             this.currencies = deepExtend (indexBy (sortedCurrencies, 'code'), this.currencies)
         }
         this.currencies_by_id = indexBy (this.currencies, 'id')
+        this.onMarketsLoaded (values)
         return this.markets
     }
 
+    onMarketsLoaded (markets) {
+        // rebuilds the state an exchange derives from its list of markets
+    }
+
     async loadMarketsHelper (reload = false, params = {}) {
         if (!reload && this.markets) {
             if (!this.markets_by_id) {
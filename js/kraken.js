@@ -345,10 +345,13 @@ module.exports = class kraken extends Exchange {
             });
         }
         result = this.appendInactiveMarkets (result);
-        this.marketsByAltname = this.indexBy (result, 'altname');
         return result;
     }
 
+    onMarketsLoaded (markets) {
+        this.marketsByAltname = this.indexBy (markets, 'altname');
+    }
+
     safeCurrencyCode (currencyId, currency = undefined) {
         if (currencyId.length > 3) {
             if ((currencyId.indexOf ('X') === 0) || (currencyId.indexOf ('Z') === 0)) {
@@ -828,6 +828,7 @@ class Exchange {
         // }
 
         $this->defined_rest_api = array();
+        $this->rest_api_costs = array();
         $this->curl = null;
         $this->curl_options = array(); // overrideable by user, empty by default
         $this->curl_reset = true;
@@ -1076,7 +1077,9 @@ class Exchange {
 
     public function define_rest_api($api, $method_name, $paths = array()) {
         foreach ($api as $key => $value) {
-            if (static::is_associative($value)) {
+            // a list of paths, or the costs by path, array('depth' => array('cost' => 1, 'byLimit' => array(array(100, 1), array(500, 5))), 'time' => 1)
+            $costs = (static::is_associative($value) && static::is_http_method($key)) ? $value : null;
+            if (static::is_associative($value) && ($costs === null)) {
                 $copy = $paths;
                 array_push ($copy, $key);
                 $this->define_rest_api($value, $method_name, $copy);
@@ -1084,7 +1087,8 @@ class Exchange {
                 $uppercaseMethod = mb_strtoupper($key);
                 $lowercaseMethod = mb_strtolower($key);
                 $camelcaseMethod = static::capitalize($lowercaseMethod);
-                foreach ($value as $path) {
+                $endpoints = ($costs !== null) ? array_keys($costs) : $value;
+                foreach ($endpoints as $path) {
                     $splitPath = mb_split('[^a-zA-Z0-9]', $path);
                     $camelcaseSuffix = implode(array_map(get_called_class() . '::capitalize', $splitPath));
                     $lowercasePath = array_map('trim', array_map('strtolower', $splitPath));
@@ -1100,6 +1104,10 @@ class Exchange {
                     $camelcase = $camelcasePrefix . $camelcaseMethod . static::capitalize($camelcaseSuffix);
                     $underscore = $underscorePrefix . '_' . $lowercaseMethod . '_' . mb_strtolower($underscoreSuffix);
                     $apiArgument = (count($paths) > 1) ? $paths : $paths[0];
+                    if ($costs !== null) {
+                        $config = $costs[$path];
+                        $this->rest_api_costs[static::rest_api_cost_key($apiArgument, $uppercaseMethod, $path)] = is_numeric($config) ? array('cost' => $config) : $config;
+                    }
                     $this->defined_rest_api[$camelcase] = array($path, $apiArgument, $uppercaseMethod, $method_name);
                     $this->defined_rest_api[$underscore] = array($path, $apiArgument, $uppercaseMethod, $method_name);
                 }
@@ -1107,6 +1115,36 @@ class Exchange {
         }
     }
 
+    public static function is_http_method($key) {
+        return in_array(mb_strtolower($key), array('get', 'post', 'put', 'delete', 'patch', 'head'), true);
+    }
+
+    public static function rest_api_cost_key($api, $method, $path) {
+        return json_encode(array($api, $method, $path));
+    }
+
+    public function calculate_rate_limiter_cost($api, $method, $path, $params) {
+        // the cost of a request declared in the api map, null for the tokenBucket defaultCost
+        $key = static::rest_api_cost_key($api, $method, $path);
+        if (!array_key_exists($key, $this->rest_api_costs)) {
+            return null;
+        }
+        $config = $this->rest_api_costs[$key];
+        if (array_key_exists('noSymbol', $config) && (!is_array($params) || !isset($params['symbol']))) {
+            return $config['noSymbol'];
+        }
+        if (array_key_exists('byLimit', $config) && is_array($params) && array_key_exists('limit', $params) && is_numeric($params['limit'])) {
+            $limit = floatval($params['limit']);
+            foreach ($config['byLimit'] as $entry) {
+                if ($limit <= $entry[0]) {
+                    return $entry[1];
+                }
+            }
+            return $config['byLimit'][count($config['byLimit']) - 1][1];
+        }
+        return array_key_exists('cost', $config) ? $config['cost'] : null;
+    }
+
     public function underscore($camelcase) {
         // todo: write conversion fooBar10OHLCV2Candles → foo_bar10_ohlcv2_candles
         throw new NotSupported($this->id . ' underscore() not supported yet');
@@ -1209,11 +1247,14 @@ class Exchange {
         return static::binary_to_base58(static::base16_to_binary($signature->toHex()));
     }
 
-    public function throttle() {
+    public function throttle($cost = null) {
+        // a request of a cost waits for as many rateLimit intervals after the last request
+        $cost = ($cost === null) ? $this->tokenBucket['defaultCost'] : $cost;
         $now = $this->milliseconds();
         $elapsed = $now - $this->lastRestRequestTimestamp;
-        if ($elapsed < $this->rateLimit) {
-            $delay = $this->rateLimit - $elapsed;
+        $interval = $this->rateLimit * $cost;
+        if ($elapsed < $interval) {
+            $delay = $interval - $elapsed;
             usleep((int) ($delay * 1000.0));
         }
     }
@@ -1224,7 +1265,7 @@ class Exchange {
 
     public function fetch2($path, $api = 'public', $method = 'GET', $params = array(), $headers = null, $body = null) {
         if ($this->enableRateLimit) {
-            $this->throttle();
+            $this->throttle($this->calculate_rate_limiter_cost($api, $method, $path, $params));
         }
         $request = $this->sign($path, $api, $method, $params, $headers, $body);
         return $this->fetch($request['url'], $request['method'], $request['headers'], $request['body']);
@@ -1550,9 +1591,14 @@ class Exchange {
             $this->currencies = array_replace_recursive($currencies, $this->currencies);
         }
         $this->currencies_by_id = static::index_by(array_values($this->currencies), 'id');
+        $this->on_markets_loaded($values);
         return $this->markets;
     }
 
+    public function on_markets_loaded($markets) {
+        // rebuilds the state an exchange derives from its list of markets
+    }
+
     public function setMarkets($markets) {
         return $this->set_markets($markets);
     }
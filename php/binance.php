@@ -21,7 +21,17 @@ class binance extends Exchange {
             'id' => 'binance',
             'name' => 'Binance',
             'countries' => array( 'JP', 'MT' ), // Japan, Malta
-            'rateLimit' => 500,
+            'rateLimit' => 50,
+            'tokenBucket' => array(
+                'defaultCost' => 10, // the endpoints without a declared weight keep the pace of 500 ms they had
+            ),
+            'rateLimitHeaders' => array(
+                'retryAfter' => 'Retry-After',
+                'used' => 'x-mbx-used-weight-1m',
+                'limit' => 1200,
+                'window' => 60000,
+                'weight' => 1, // binance weights per token, the costs are weights
+            ),
             'certified' => true,
             'pro' => true,
             // new metainfo interface
@@ -252,25 +262,26 @@ class binance extends Exchange {
                     ),
                 ),
                 'dapiPublic' => array(
+                    // costs in the request weights of binance, the rateLimit of 50 ms is one weight, 1200 per minute
                     'get' => array(
-                        'ping',
-                        'time',
-                        'exchangeInfo',
-                        'depth',
-                        'trades',
-                        'historicalTrades',
-                        'aggTrades',
-                        'premiumIndex',
-                        'fundingRate',
-                        'klines',
-                        'continuousKlines',
-                        'indexPriceKlines',
-                        'markPriceKlines',
-                        'ticker/24hr',
-                        'ticker/price',
-                        'ticker/bookTicker',
-                        'allForceOrders',
-                        'openInterest',
+                        'ping' => 1,
+                        'time' => 1,
+                        'exchangeInfo' => 1,
+                        'depth' => array( 'cost' => 10, 'byLimit' => array( array( 50, 2 ), array( 100, 5 ), array( 500, 10 ), array( 1000, 20 ) ) ),
+                        'trades' => 1,
+                        'historicalTrades' => 20,
+                        'aggTrades' => 20,
+                        'premiumIndex' => 10,
+                        'fundingRate' => 1,
+                        'klines' => array( 'cost' => 2, 'byLimit' => array( array( 99, 1 ), array( 499, 2 ), array( 1000, 5 ), array( 1500, 10 ) ) ),
+                        'continuousKlines' => array( 'cost' => 2, 'byLimit' => array( array( 99, 1 ), array( 499, 2 ), array( 1000, 5 ), array( 1500, 10 ) ) ),
+                        'indexPriceKlines' => array( 'cost' => 2, 'byLimit' => array( array( 99, 1 ), array( 499, 2 ), array( 1000, 5 ), array( 1500, 10 ) ) ),
+                        'markPriceKlines' => array( 'cost' => 2, 'byLimit' => array( array( 99, 1 ), array( 499, 2 ), array( 1000, 5 ), array( 1500, 10 ) ) ),
+                        'ticker/24hr' => array( 'cost' => 1, 'noSymbol' => 40 ),
+                        'ticker/price' => array( 'cost' => 1, 'noSymbol' => 2 ),
+                        'ticker/bookTicker' => array( 'cost' => 1, 'noSymbol' => 2 ),
+                        'allForceOrders' => array( 'cost' => 20, 'noSymbol' => 50 ),
+                        'openInterest' => 1,
                     ),
                 ),
                 'dapiData' => array(
@@ -321,23 +332,24 @@ class binance extends Exchange {
                     ),
                 ),
                 'fapiPublic' => array(
+                    // costs in the request weights of binance, the rateLimit of 50 ms is one weight, 1200 per minute
                     'get' => array(
-                        'ping',
-                        'time',
-                        'exchangeInfo',
-                        'depth',
-                        'trades',
-                        'historicalTrades',
-                        'aggTrades',
-                        'klines',
-                        'fundingRate',
-                        'premiumIndex',
-                        'ticker/24hr',
-                        'ticker/price',
-                        'ticker/bookTicker',
-                        'allForceOrders',
-                        'openInterest',
-                        'indexInfo',
+                        'ping' => 1,
+                        'time' => 1,
+                        'exchangeInfo' => 1,
+                        'depth' => array( 'cost' => 10, 'byLimit' => array( array( 50, 2 ), array( 100, 5 ), array( 500, 10 ), array( 1000, 20 ) ) ),
+                        'trades' => 1,
+                        'historicalTrades' => 20,
+                        'aggTrades' => 20,
+                        'klines' => array( 'cost' => 2, 'byLimit' => array( array( 99, 1 ), array( 499, 2 ), array( 1000, 5 ), array( 1500, 10 ) ) ),
+                        'fundingRate' => 1,
+                        'premiumIndex' => 1,
+                        'ticker/24hr' => array( 'cost' => 1, 'noSymbol' => 40 ),
+                        'ticker/price' => array( 'cost' => 1, 'noSymbol' => 2 ),
+                        'ticker/bookTicker' => array( 'cost' => 1, 'noSymbol' => 2 ),
+                        'allForceOrders' => array( 'cost' => 20, 'noSymbol' => 50 ),
+                        'openInterest' => 1,
+                        'indexInfo' => 1,
                     ),
                 ),
                 'fapiData' => array(
@@ -399,43 +411,45 @@ class binance extends Exchange {
                     ),
                 ),
                 'public' => array(
+                    // costs in the request weights of binance, the rateLimit of 50 ms is one weight, 1200 per minute
                     'get' => array(
-                        'ping',
-                        'time',
-                        'depth',
-                        'trades',
-                        'aggTrades',
-                        'historicalTrades',
-                        'klines',
-                        'ticker/24hr',
-                        'ticker/price',
-                        'ticker/bookTicker',
-                        'exchangeInfo',
+                        'ping' => 1,
+                        'time' => 1,
+                        'depth' => array( 'cost' => 1, 'byLimit' => array( array( 100, 1 ), array( 500, 5 ), array( 1000, 10 ), array( 5000, 50 ) ) ),
+                        'trades' => 1,
+                        'aggTrades' => 1,
+                        'historicalTrades' => 5,
+                        'klines' => 1,
+                        'ticker/24hr' => array( 'cost' => 1, 'noSymbol' => 40 ),
+                        'ticker/price' => array( 'cost' => 1, 'noSymbol' => 2 ),
+                        'ticker/bookTicker' => array( 'cost' => 1, 'noSymbol' => 2 ),
+                        'exchangeInfo' => 10,
                     ),
                     'put' => array( 'userDataStream' ),
                     'post' => array( 'userDataStream' ),
                     'delete' => array( 'userDataStream' ),
                 ),
                 'private' => array(
+                    // costs in the request weights of binance, the rateLimit of 50 ms is one weight, 1200 per minute
                     'get' => array(
-                        'allOrderList', // oco
-                        'openOrderList', // oco
-                        'orderList', // oco
-                        'order',
-                        'openOrders',
-                        'allOrders',
-                        'account',
-                        'myTrades',
+                        'allOrderList' => 10, // oco
+                        'openOrderList' => 3, // oco
+                        'orderList' => 2, // oco
+                        'order' => 2,
+                        'openOrders' => array( 'cost' => 3, 'noSymbol' => 40 ),
+                        'allOrders' => 10,
+                        'account' => 10,
+                        'myTrades' => 10,
                     ),
                     'post' => array(
-                        'order/oco',
-                        'order',
-                        'order/test',
+                        'order/oco' => 1,
+                        'order' => 1,
+                        'order/test' => 1,
                     ),
                     'delete' => array(
-                        'openOrders', // added on 2020-04-25 for canceling all open orders per symbol
-                        'orderList', // oco
-                        'order',
+                        'openOrders' => 1, // added on 2020-04-25 for canceling all open orders per symbol
+                        'orderList' => 1, // oco
+                        'order' => 1,
                     ),
                 ),
             ),
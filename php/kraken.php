@@ -354,10 +354,13 @@ class kraken extends Exchange {
             );
         }
         $result = $this->append_inactive_markets($result);
-        $this->marketsByAltname = $this->index_by($result, 'altname');
         return $result;
     }
 
+    public function on_markets_loaded($markets) {
+        $this->marketsByAltname = $this->index_by($markets, 'altname');
+    }
+
     public function safe_currency_code($currencyId, $currency = null) {
         if (strlen($currencyId) > 3) {
             if ((mb_strpos($currencyId, 'X') === 0) || (mb_strpos($currencyId, 'Z') === 0)) {
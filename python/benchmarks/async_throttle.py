@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+"""Measures the CPU time the async rate limiter spends per 10k throttled calls, against the former polling loop"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.async_support.base.throttle import throttle  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--calls', type=int, default=10000, help='throttled calls in total')
+parser.add_argument('--instances', type=int, default=50, help='rate limiters sharing the event loop')
+parser.add_argument('--rate-limit', type=float, default=10, help='milliseconds between calls per instance')
+argv = parser.parse_args()
+
+# ------------------------------------------------------------------------------
+
+
+def polling_throttle(config):
+    """The former implementation, a 1 ms sleep loop running while anything is queued"""
+
+    cfg = {
+        'lastTimestamp': time.time(),
+        'numTokens': 0,
+        'running': False,
+        'queue': asyncio.Queue(),
+        'delay': 0.001,
+        'refillRate': 0.001,
+        'defaultCost': 1.000,
+        'capacity': 1.000,
+    }
+    cfg.update(config)
+
+    async def run():
+        if not cfg['running']:
+            cfg['running'] = True
+            while not cfg['queue'].empty():
+                now = time.time()
+                elapsed = (now - cfg['lastTimestamp'])
+                cfg['lastTimestamp'] = now
+                cfg['numTokens'] = min(cfg['capacity'], cfg['numTokens'] + elapsed * cfg['refillRate'] * 1000)
+                if cfg['numTokens'] > 0:
+                    if not cfg['queue'].empty():
+                        cost, future = cfg['queue'].get_nowait()
+                        cfg['numTokens'] -= (cost if cost else cfg['defaultCost'])
+                        if not future.done():
+                            future.set_result(None)
+                await asyncio.sleep(cfg['delay'])
+            cfg['running'] = False
+
+    def throttle(rate_limit, cost=None):
+        future = asyncio.Future()
+        cfg['refillRate'] = 1 / rate_limit
+        cfg['queue'].put_nowait((cost, future))
+        asyncio.ensure_future(run())
+        return future
+
+    return throttle
+
+
+async def run(factory):
+    limiters = [factory({'refillRate': 1 / argv.rate_limit}) for i in range(argv.instances)]
+    calls = argv.calls // argv.instances
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    await asyncio.gather(*[limiter(argv.rate_limit) for limiter in limiters for i in range(calls)])
+    return time.perf_counter() - wall, time.process_time() - cpu
+
+
+# ------------------------------------------------------------------------------
+
+print('{} calls over {} instances, one call per {} ms each'.format(argv.calls, argv.instances, argv.rate_limit))
+for name, factory in (('polling', polling_throttle), ('timer', throttle)):
+    wall, cpu = asyncio.get_event_loop().run_until_complete(run(factory))
+    print('  {:8} wall {:6.2f} s   cpu {:8.1f} ms per 10k calls'.format(name, wall, cpu * 1000 * 10000 / argv.calls))
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+"""Connections opened and request latency of many async instances polling a local server, with and without a shared connector"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+from aiohttp import web
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt.async_support as ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--instances', type=int, default=50, help='exchange instances on the event loop')
+parser.add_argument('--rounds', type=int, default=20, help='rounds of requests')
+parser.add_argument('--concurrency', type=int, default=4, help='requests per instance and round')
+parser.add_argument('--latency', type=float, default=10, help='milliseconds the server takes to respond')
+argv = parser.parse_args()
+
+# ------------------------------------------------------------------------------
+
+
+async def handler(request):
+    await asyncio.sleep(argv.latency / 1000)
+    return web.json_response({'serverTime': 1600000000000})
+
+
+async def run(url, config):
+    exchanges = [ccxt.Exchange(config) for i in range(argv.instances)]
+    start = asyncio.get_event_loop().time()
+    for i in range(argv.rounds):
+        await asyncio.gather(*[exchange.fetch(url) for exchange in exchanges for j in range(argv.concurrency)])
+    elapsed = asyncio.get_event_loop().time() - start
+    summaries = [exchange.connection_metrics.summary() for exchange in exchanges]
+    open_connections = summaries[0]['openConnections'] if config['connectionPool'].get('shared') else sum(summary['openConnections'] for summary in summaries)
+    for exchange in exchanges:
+        await exchange.close()
+    requests = sum(summary['requests'] for summary in summaries)
+    return {
+        'requests/s': requests / elapsed,
+        'created': sum(summary['connectionsCreated'] for summary in summaries),
+        'open': open_connections,
+        'average': sum(summary['latencyAverage'] * summary['requests'] for summary in summaries) / requests,
+        'max': max(summary['latencyMax'] for summary in summaries),
+    }
+
+
+async def main():
+    app = web.Application()
+    app.router.add_get('/time', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    url = 'http://127.0.0.1:' + str(site._server.sockets[0].getsockname()[1]) + '/time'
+    print('{} instances, {} rounds of {} concurrent requests each'.format(argv.instances, argv.rounds, argv.concurrency))
+    cases = (
+        ('own', {'connectionPool': {'metrics': True}}),
+        ('shared', {'connectionPool': {'metrics': True, 'shared': True}}),
+        ('shared/8', {'connectionPool': {'metrics': True, 'shared': True, 'limitPerHost': 8}}),
+    )
+    for name, config in cases:
+        result = await run(url, config)
+        print('  {:9} {:7.0f} requests/s   {:5} connections created   {:5} open at the end   latency avg {:6.2f} ms   max {:6.2f} ms'.format(
+            name, result['requests/s'], result['created'], result['open'], result['average'], result['max']))
+    await runner.cleanup()
+
+
+asyncio.get_event_loop().run_until_complete(main())
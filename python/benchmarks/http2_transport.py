@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+"""Bursts of concurrent requests to a local TLS server, over HTTP/1.1 by default and over HTTP/2 with the http2 option"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import ssl
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import urllib3
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+sys.path.append(os.path.join(root, 'test'))
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from h2_server import serve  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--rounds', type=int, default=20, help='bursts of requests')
+parser.add_argument('--concurrency', type=int, default=64, help='requests in flight per burst')
+parser.add_argument('--latency', type=float, default=20, help='milliseconds the server takes to respond')
+argv = parser.parse_args()
+
+urllib3.disable_warnings()
+
+# ------------------------------------------------------------------------------
+
+
+def server(latency, queue):
+    # in a process of its own, so that it does not compete with the clients for the GIL
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    instance, url, stats = loop.run_until_complete(serve(latency))
+    queue.put(url)
+    loop.run_forever()
+
+
+def connections(url):
+    # the connection of this request is counted too
+    context = ssl._create_unverified_context()
+    with urllib.request.urlopen(url + '/stats', context=context) as response:
+        summary = json.loads(response.read())
+    return sum(summary['connections'].values())
+
+
+def run_sync(url, config):
+    exchange = ccxt.Exchange(ccxt.Exchange.extend({'id': 'benchmark', 'verify': False}, config))
+    before = connections(url)
+    exchange.fetch(url + '/time')  # the first request negotiates the protocol, as load_markets() would
+    start = time.perf_counter()
+    with ThreadPoolExecutor(argv.concurrency) as executor:
+        for i in range(argv.rounds):
+            list(executor.map(lambda i: exchange.fetch(url + '/time'), range(argv.concurrency)))
+    elapsed = time.perf_counter() - start
+    return elapsed, connections(url) - before - 1
+
+
+async def run_async(url, config):
+    exchange = ccxt.async_support.Exchange(ccxt.Exchange.extend({'id': 'benchmark', 'verify': False}, config))
+    before = connections(url)
+    await exchange.fetch(url + '/time')
+    start = time.perf_counter()
+    for i in range(argv.rounds):
+        await asyncio.gather(*[exchange.fetch(url + '/time') for j in range(argv.concurrency)])
+    elapsed = time.perf_counter() - start
+    await exchange.close()
+    return elapsed, connections(url) - before - 1
+
+
+def main():
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=server, args=(argv.latency, queue), daemon=True)
+    process.start()
+    url = queue.get()
+    requests = argv.rounds * argv.concurrency
+    print('{} bursts of {} concurrent requests, {} ms of server latency'.format(argv.rounds, argv.concurrency, argv.latency))
+    cases = (
+        ('sync  http/1.1', lambda: run_sync(url, {})),
+        ('sync  http/2', lambda: run_sync(url, {'http2': True})),
+        ('async http/1.1', lambda: asyncio.get_event_loop().run_until_complete(run_async(url, {}))),
+        ('async http/2', lambda: asyncio.get_event_loop().run_until_complete(run_async(url, {'http2': True}))),
+    )
+    for name, run in cases:
+        elapsed, opened = run()
+        print('  {:15} {:7.0f} requests/s   {:5} connections opened'.format(name, requests / elapsed, opened))
+    process.terminate()
+
+
+if __name__ == '__main__':
+    main()
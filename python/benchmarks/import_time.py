@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+"""Measures the startup cost of importing ccxt with eager and lazy exchange loading"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--runs', type=int, default=10, help='number of fresh interpreters per mode')
+parser.add_argument('--package', type=str, default='ccxt', help='ccxt or ccxt.async_support')
+parser.add_argument('exchanges', type=str, nargs='*', default=['binance', 'okex'], help='exchange ids to touch after the import')
+argv = parser.parse_args()
+
+# ------------------------------------------------------------------------------
+
+script = '\n'.join([
+    'import time',
+    'start = time.perf_counter()',
+    'import ' + argv.package + ' as package',
+    'for id in ' + repr(argv.exchanges) + ':',
+    '    getattr(package, id)',
+    'print(time.perf_counter() - start)',
+])
+
+
+def measure(lazy):
+    env = dict(os.environ, PYTHONPATH=root, CCXT_LAZY_IMPORT='1' if lazy else '')
+    timings = []
+    for _ in range(argv.runs):
+        output = subprocess.check_output([sys.executable, '-c', script], env=env, cwd=root)
+        timings.append(float(output.decode().strip()))
+    timings.sort()
+    return timings[len(timings) // 2], timings[0]
+
+
+eager_median, eager_best = measure(False)
+lazy_median, lazy_best = measure(True)
+
+print('import ' + argv.package + ' + ' + ', '.join(argv.exchanges))
+print('eager  median {:8.1f} ms  best {:8.1f} ms'.format(eager_median * 1000, eager_best * 1000))
+print('lazy   median {:8.1f} ms  best {:8.1f} ms'.format(lazy_median * 1000, lazy_best * 1000))
+print('speedup {:.1f}x'.format(eager_median / lazy_median))
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+"""Measures the memory held by idle exchange instances"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--count', type=int, default=100, help='instances per exchange')
+parser.add_argument('exchanges', type=str, nargs='*', default=['binance', 'okex', 'bitget', 'phemex'], help='exchange ids')
+argv = parser.parse_args()
+
+# ------------------------------------------------------------------------------
+
+for id in argv.exchanges:
+    exchange_class = getattr(ccxt, id)
+    exchange_class()  # class-level work happens on the first instance
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [exchange_class({'apiKey': 'key' + str(i), 'secret': 'secret'}) for i in range(argv.count)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print('{:10} {:10.1f} KB per idle instance'.format(id, (after - before) / len(instances) / 1024))
+    del instances
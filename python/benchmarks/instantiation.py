@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+"""Measures how many exchange instances can be constructed per second"""
+
+import argparse
+import os
+import sys
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--duration', type=float, default=2.0, help='seconds to spend on each exchange')
+parser.add_argument('exchanges', type=str, nargs='*', default=['okex', 'bitget', 'phemex'], help='exchange ids')
+argv = parser.parse_args()
+
+# ------------------------------------------------------------------------------
+
+for id in argv.exchanges:
+    exchange_class = getattr(ccxt, id)
+    start = time.perf_counter()
+    exchange_class({'apiKey': 'key', 'secret': 'secret'})
+    first = time.perf_counter() - start
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0
+    while elapsed < argv.duration:
+        exchange_class({'apiKey': 'key' + str(count), 'secret': 'secret'})
+        count += 1
+        elapsed = time.perf_counter() - start
+    print('{:10} first {:8.2f} ms   then {:8.1f} instances/s ({:.3f} ms each)'.format(id, first * 1000, count / elapsed, elapsed * 1000 / count))
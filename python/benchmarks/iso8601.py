@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""Time of Exchange.parse8601() and Exchange.iso8601(), and of parsing the candles of bitmex and the trades of binance"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--number', type=int, default=10000, help='timestamps per call')
+parser.add_argument('--repeat', type=int, default=5)
+argv = parser.parse_args()
+
+# ------------------------------------------------------------------------------
+
+
+def main():
+    random.seed(1)
+    exchange = ccxt.Exchange()
+    start = 1601556386932
+    # a burst of trades, a few in each second, and timestamps spread over years
+    burst = [start + i * 137 for i in range(argv.number)]
+    spread = [random.randint(0, 4102444800000) for i in range(argv.number)]
+    strings = [exchange.iso8601(timestamp) for timestamp in burst]
+    cases = [
+        ('iso8601, a burst', lambda: [exchange.iso8601(timestamp) for timestamp in burst]),
+        ('iso8601, spread', lambda: [exchange.iso8601(timestamp) for timestamp in spread]),
+        ('parse8601, .mmmZ', lambda: [exchange.parse8601(string) for string in strings]),
+        ('parse8601, Z', lambda: [exchange.parse8601(string[:19] + 'Z') for string in strings]),
+        ('parse8601, +hh:mm', lambda: [exchange.parse8601(string[:19] + '+02:00') for string in strings]),
+        ('parse8601, YYYYMMDD hhmmss', lambda: [exchange.parse8601(string[:19].replace('-', '').replace('T', ' ')) for string in strings]),
+    ]
+    # as returned by GET /trade/bucketed and GET /api/v3/trades
+    bitmex = ccxt.bitmex()
+    candles = [{'timestamp': string, 'symbol': 'XBTUSD', 'open': 237.45, 'high': 237.45, 'low': 237.45, 'close': 237.45, 'trades': 0, 'volume': 0} for string in strings]
+    binance = ccxt.binance()
+    binance.set_markets([{'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'spot': True, 'future': False, 'delivery': False}])
+    market = binance.market('BTC/USDT')
+    trades = [{'id': i, 'price': '4.00000100', 'qty': '12.00000000', 'time': timestamp, 'isBuyerMaker': True, 'isBestMatch': True} for i, timestamp in enumerate(burst)]
+    cases += [
+        ('bitmex parse_ohlcvs', lambda: bitmex.parse_ohlcvs(candles)),
+        ('binance parse_trades', lambda: binance.parse_trades(trades, market)),
+    ]
+    for name, function in cases:
+        elapsed = min(timeit.repeat(function, number=1, repeat=argv.repeat)) / argv.number
+        print('{:28} {:8.3f} us per timestamp'.format(name, elapsed * 1000000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""Compares parse_json() decode times per JSON codec on recorded or generated payloads"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.json_codec import codecs, get_codec  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--duration', type=float, default=2.0, help='seconds to spend on each payload and codec')
+parser.add_argument('payloads', type=str, nargs='*', help='files with recorded response bodies, generated ones by default')
+argv = parser.parse_args()
+
+# ------------------------------------------------------------------------------
+
+
+def order_book(levels=5000):
+    """Shaped like a binance /api/v3/depth?limit=5000 response"""
+    price = 40000.0
+
+    def side(direction):
+        return [['%.8f' % (price + direction * (i + 1) * 0.01), '%.8f' % random.uniform(0.0001, 10)] for i in range(levels)]
+    return {'lastUpdateId': 1027024, 'bids': side(-1), 'asks': side(1)}
+
+
+def tickers(count=2000):
+    """Shaped like a binance /api/v3/ticker/24hr response"""
+    result = []
+    for i in range(count):
+        last = random.uniform(0.0001, 50000)
+        result.append({
+            'symbol': 'SYM' + str(i) + 'USDT',
+            'priceChange': '%.8f' % (last * 0.01),
+            'priceChangePercent': '1.000',
+            'weightedAvgPrice': '%.8f' % last,
+            'prevClosePrice': '%.8f' % last,
+            'lastPrice': '%.8f' % last,
+            'lastQty': '%.8f' % random.uniform(0, 100),
+            'bidPrice': '%.8f' % last,
+            'bidQty': '%.8f' % random.uniform(0, 100),
+            'askPrice': '%.8f' % last,
+            'askQty': '%.8f' % random.uniform(0, 100),
+            'openPrice': '%.8f' % last,
+            'highPrice': '%.8f' % last,
+            'lowPrice': '%.8f' % last,
+            'volume': '%.8f' % random.uniform(0, 1e6),
+            'quoteVolume': '%.8f' % random.uniform(0, 1e6),
+            'openTime': 1600000000000 + i,
+            'closeTime': 1600086400000 + i,
+            'firstId': i * 1000,
+            'lastId': i * 1000 + 999,
+            'count': 1000,
+        })
+    return result
+
+
+if argv.payloads:
+    payloads = []
+    for path in argv.payloads:
+        with open(path, 'rb') as file:
+            payloads.append((os.path.basename(path), file.read()))
+else:
+    random.seed(0)
+    payloads = [
+        ('order book 5000', json.dumps(order_book()).encode('utf-8')),
+        ('tickers 2000', json.dumps(tickers()).encode('utf-8')),
+    ]
+
+for name, payload in payloads:
+    print('{} ({:.2f} MB)'.format(name, len(payload) / 1e6))
+    for codec in codecs:
+        if get_codec(codec).name != codec:
+            print('  {:8} not installed'.format(codec))
+            continue
+        exchange = ccxt.Exchange({'jsonCodec': codec})
+        count = 0
+        start = time.perf_counter()
+        elapsed = 0
+        while elapsed < argv.duration:
+            exchange.parse_json(payload)
+            count += 1
+            elapsed = time.perf_counter() - start
+        print('  {:8} {:8.2f} ms per decode'.format(codec, elapsed * 1000 / count))
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+"""Time and memory of the trades of binance parsed as dicts, as LazyStructure and as LazyStructure without their info"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--trades', type=int, default=100000)
+parser.add_argument('--repeat', type=int, default=3)
+argv = parser.parse_args()
+
+# ------------------------------------------------------------------------------
+
+
+def main():
+    # as returned by GET /api/v3/myTrades
+    body = json.dumps([{
+        'symbol': 'BTCUSDT', 'id': 28457 + i, 'orderId': 100234 + i // 3, 'orderListId': -1, 'price': '%.8f' % (4 + i * 1e-6),
+        'qty': '12.00000000', 'quoteQty': '48.000012', 'commission': '10.10000000', 'commissionAsset': 'BNB',
+        'time': 1499865549590 + i * 137, 'isBuyer': True, 'isMaker': False, 'isBestMatch': True,
+    } for i in range(argv.trades)])
+    cases = [
+        ('dict', {}),
+        ('lazy', {'lazyStructures': True}),
+        ('lazy, no info', {'lazyStructures': {'info': False}}),
+    ]
+    print('{} trades'.format(argv.trades))
+    for name, config in cases:
+        exchange = ccxt.binance(config)
+        exchange.set_markets([{'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'spot': True, 'future': False, 'delivery': False}])
+        market = exchange.market('BTC/USDT')
+        timings = []
+        for i in range(argv.repeat):
+            trades = json.loads(body)
+            start = time.perf_counter()
+            exchange.parse_trades(trades, market)
+            timings.append(time.perf_counter() - start)
+        del trades
+        # held once the response is gone, as after a fetch_my_trades()
+        gc.collect()
+        tracemalloc.start()
+        result = exchange.parse_trades(json.loads(body), market)
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del result
+        print('  {:14} {:8.1f} ms   {:7.2f} MB held, {:5.0f} bytes per trade'.format(name, min(timings) * 1000, size / 1000000, size / argv.trades))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+"""Time and memory of parse_ohlcvs() with each ohlcvFormat, on generated klines of binance and candles of bitfinex"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import ohlcv_columns  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--candles', type=int, default=200000)
+parser.add_argument('--repeat', type=int, default=3)
+argv = parser.parse_args()
+
+# ------------------------------------------------------------------------------
+
+
+def generate(count):
+    # as returned by GET /api/v3/klines, then decoded
+    random.seed(1)
+    start = 1591478520000
+    return [[start + i * 60000] + ['%.8f' % random.uniform(1, 2) for j in range(5)] + [start + i * 60000 + 59999, '%.8f' % random.uniform(1, 2), 40, '1.5', '1.5', '0'] for i in range(count)]
+
+
+def best(function, repeat):
+    timings = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def held(function):
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    rows = generate(argv.candles)
+    try:
+        ohlcv_columns.require_numpy()  # numpy is imported on first use
+    except ccxt.NotSupported:
+        pass
+    formats = ['list', 'array'] if ohlcv_columns.numpy is None else ['list', 'array', 'numpy']
+    cases = [
+        ('binance', rows),
+        ('binance', rows[::-1]),  # newest first, reversed instead of sorted
+        ('bitfinex', [row[:6] for row in rows]),  # open, close, high, low
+    ]
+    print('{} candles'.format(argv.candles))
+    for exchange_id, data in cases:
+        print('  {}{}'.format(exchange_id, ', newest first' if data[0][0] > data[-1][0] else ''))
+        for ohlcv_format in formats:
+            exchange = getattr(ccxt, exchange_id)({'ohlcvFormat': ohlcv_format})
+            result, size = held(lambda: exchange.parse_ohlcvs(data))
+            del result
+            elapsed = best(lambda: exchange.parse_ohlcvs(data), argv.repeat)
+            print('    {:6} {:9.1f} ms   {:8.2f} MB held, {:5.1f} bytes per candle'.format(ohlcv_format, elapsed * 1000, size / 1000000, size / len(data)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+"""Time and memory of parsing, sorting and aggregating order books with each orderBookFormat"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import numeric_book  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--levels', type=int, nargs='+', default=[5000, 100000], help='levels per side')
+parser.add_argument('--repeat', type=int, default=5)
+argv = parser.parse_args()
+
+# ------------------------------------------------------------------------------
+
+
+def generate(levels):
+    # as returned by GET /api/v3/depth, then decoded, the bids in reverse to be sorted
+    random.seed(1)
+    return {
+        'bids': [['%.2f' % (50000 - i * 0.01), '%.8f' % random.uniform(0, 10)] for i in range(levels)][::-1],
+        'asks': [['%.2f' % (50000.01 + i * 0.01), '%.8f' % random.uniform(0, 10)] for i in range(levels)],
+    }
+
+
+def best(function, repeat):
+    timings = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def held(function):
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    try:
+        numeric_book.require_numpy()  # numpy is imported on first use
+    except ccxt.NotSupported:
+        pass
+    formats = ['list', 'array'] if numeric_book.numpy is None else ['list', 'array', 'numpy']
+    for levels in argv.levels:
+        raw = generate(levels)
+        print('{} levels per side'.format(levels))
+        for orderbook_format in formats:
+            exchange = ccxt.Exchange({'orderBookFormat': orderbook_format})
+            book, size = held(lambda: exchange.parse_order_book(raw))
+            parse = best(lambda: exchange.parse_order_book(raw), argv.repeat)
+            l2 = best(lambda: exchange.sort_by(exchange.aggregate(book['bids']), 0, True), argv.repeat)
+            print('  {:6} parse {:8.2f} ms   aggregate and sort {:8.2f} ms   {:8.2f} MB held, {:5.1f} bytes per level'.format(
+                orderbook_format, parse * 1000, l2 * 1000, size / 1000000, size / (2 * levels)))
+
+
+if __name__ == '__main__':
+    main()
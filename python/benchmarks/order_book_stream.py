@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""Peak memory and time of fetching and parsing a large order book, read whole or streamed with streamingJson
+
+Each case runs in a fresh process, the book is served by another process.
+By default the book is a generated 5 MB binance depth response, --file
+takes a recorded one instead.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from multiprocessing import Process, Queue
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--file', help='a recorded order book response, a JSON file')
+parser.add_argument('--size', type=float, default=5, help='megabytes of the generated book')
+parser.add_argument('--gzip', action='store_true', help='serve the book compressed')
+parser.add_argument('--case', help=argparse.SUPPRESS)
+parser.add_argument('--url', help=argparse.SUPPRESS)
+argv = parser.parse_args()
+
+# ------------------------------------------------------------------------------
+
+
+def generate(size):
+    # as returned by GET /api/v3/depth?limit=5000, with more levels
+    random.seed(1)
+    levels = int(size * 1000000 / 60)
+    return json.dumps({
+        'lastUpdateId': 1027024,
+        'bids': [['%.8f' % (50000 - i * 0.01), '%.8f' % random.uniform(0, 10)] for i in range(levels)],
+        'asks': [['%.8f' % (50000.01 + i * 0.01), '%.8f' % random.uniform(0, 10)] for i in range(levels)],
+    }, separators=(',', ':')).encode()
+
+
+def serve(body, compressed, queue):
+    payload = gzip.compress(body) if compressed else body
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json;charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+            if compressed:
+                self.send_header('Content-Encoding', 'gzip')
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    queue.put('http://127.0.0.1:' + str(server.server_address[1]))
+    server.serve_forever()
+
+
+def rss():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * resource.getpagesize()
+
+
+def case(name, url):
+    import ccxt  # noqa: E402
+    config = {
+        'json': {},
+        'orjson': {'jsonCodec': 'orjson'},
+        'streamed': {'streamingJson': True},
+    }[name]
+    exchange = ccxt.Exchange(ccxt.Exchange.extend({'id': 'benchmark', 'lean': True}, config))
+    exchange.fetch(url)  # connections, imports and caches, not measured
+    baseline = rss()
+    start = time.perf_counter()
+    orderbook = exchange.parse_order_book(exchange.fetch(url))
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # kilobytes on linux
+    print(json.dumps({'peak': peak - baseline, 'elapsed': elapsed, 'levels': len(orderbook['bids']) + len(orderbook['asks'])}))
+
+
+def main():
+    if argv.file:
+        with open(argv.file, 'rb') as f:
+            body = f.read()
+    else:
+        body = generate(argv.size)
+    queue = Queue()
+    server = Process(target=serve, args=(body, argv.gzip, queue), daemon=True)
+    server.start()
+    url = queue.get()
+    print('{:.2f} MB order book{}'.format(len(body) / 1000000, ', gzipped' if argv.gzip else ''))
+    for name in ('json', 'orjson', 'streamed'):
+        output = subprocess.run([sys.executable, __file__, '--case', name, '--url', url], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if output.returncode:
+            print('  {:9} {}'.format(name, output.stderr.decode().strip().split('\n')[-1]))
+            continue
+        result = json.loads(output.stdout)
+        print('  {:9} peak {:7.2f} MB above the baseline   {:7.1f} ms   {} levels'.format(name, result['peak'] / 1000000, result['elapsed'] * 1000, result['levels']))
+    server.terminate()
+
+
+if __name__ == '__main__':
+    if argv.case:
+        case(argv.case, argv.url)
+    else:
+        main()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""Measures the memory kept by instances after fetching a large order book, with and without lean mode"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--instances', type=int, default=20, help='number of exchange instances')
+parser.add_argument('--levels', type=int, default=5000, help='order book levels per side')
+argv = parser.parse_args()
+
+# ------------------------------------------------------------------------------
+
+random.seed(0)
+book = {
+    'lastUpdateId': 1027024,
+    'bids': [['%.8f' % (40000 - i * 0.01), '%.8f' % random.uniform(0.0001, 10)] for i in range(argv.levels)],
+    'asks': [['%.8f' % (40000 + i * 0.01), '%.8f' % random.uniform(0.0001, 10)] for i in range(argv.levels)],
+}
+payload = json.dumps(book).encode('utf-8')
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+server = HTTPServer(('127.0.0.1', 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = 'http://127.0.0.1:' + str(server.server_port) + '/api/v3/depth'
+
+# ------------------------------------------------------------------------------
+
+print('{} instances, {:.2f} MB order book'.format(argv.instances, len(payload) / 1e6))
+for lean in (False, True):
+    gc.collect()
+    tracemalloc.start()
+    exchanges = [ccxt.Exchange({'lean': lean}) for i in range(argv.instances)]
+    for exchange in exchanges:
+        exchange.fetch(url)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('  lean={:5}  retained {:8.2f} MB   peak {:8.2f} MB'.format(str(lean), current / 1e6, peak / 1e6))
+    del exchanges
+
+server.shutdown()
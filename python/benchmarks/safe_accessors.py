@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+"""Time of the safe_* accessors and of the parse methods of binance built on them"""
+
+import argparse
+import os
+import sys
+import timeit
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--number', type=int, default=100000, help='calls per accessor, parse calls are a tenth of it')
+parser.add_argument('--repeat', type=int, default=5)
+argv = parser.parse_args()
+
+# ------------------------------------------------------------------------------
+
+# as returned by binance
+aggregate_trade = {'a': 26129, 'p': '0.01633102', 'q': '4.70443515', 'f': 27781, 'l': 27781, 'T': 1498793709153, 'm': True, 'M': True}
+private_trade = {'symbol': 'BNBBTC', 'id': 28457, 'orderId': 100234, 'price': '4.00000100', 'qty': '12.00000000', 'commission': '10.10000000', 'commissionAsset': 'BNB', 'time': 1499865549590, 'isBuyer': True, 'isMaker': False, 'isBestMatch': True}
+ticker = {
+    'symbol': 'ETHBTC', 'priceChange': '0.00068700', 'priceChangePercent': '2.075', 'weightedAvgPrice': '0.03342681',
+    'prevClosePrice': '0.03310300', 'lastPrice': '0.03378900', 'lastQty': '0.07700000', 'bidPrice': '0.03378900',
+    'bidQty': '7.16800000', 'askPrice': '0.03379000', 'askQty': '24.00000000', 'openPrice': '0.03310200',
+    'highPrice': '0.03388900', 'lowPrice': '0.03306900', 'volume': '205478.41000000', 'quoteVolume': '6868.48826294',
+    'openTime': 1601469986932, 'closeTime': 1601556386932, 'firstId': 196098772, 'lastId': 196186315, 'count': 87544,
+}
+order = {
+    'symbol': 'BTCUSDT', 'orderId': 28, 'orderListId': -1, 'clientOrderId': '6gCrw2kRUAF9CvJDGP16IP', 'transactTime': 1507725176595,
+    'price': '0.00000000', 'origQty': '10.00000000', 'executedQty': '10.00000000', 'cummulativeQuoteQty': '10.00000000',
+    'status': 'FILLED', 'timeInForce': 'GTC', 'type': 'MARKET', 'side': 'SELL',
+    'fills': [
+        {'price': '4000.00000000', 'qty': '1.00000000', 'commission': '4.00000000', 'commissionAsset': 'USDT'},
+        {'price': '3999.00000000', 'qty': '5.00000000', 'commission': '19.99500000', 'commissionAsset': 'USDT'},
+    ],
+}
+kline = [1591478520000, '0.02501300', '0.02501800', '0.02500000', '0.02500000', '22.19000000', 1591478579999, '0.55490906', 40, '10.92900000', '0.27336462', '0']
+
+
+def main():
+    exchange = ccxt.binance()
+    exchange.set_markets([
+        {'id': 'BNBBTC', 'symbol': 'BNB/BTC', 'base': 'BNB', 'quote': 'BTC', 'spot': True, 'future': False, 'delivery': False},
+        {'id': 'ETHBTC', 'symbol': 'ETH/BTC', 'base': 'ETH', 'quote': 'BTC', 'spot': True, 'future': False, 'delivery': False},
+        {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'spot': True, 'future': False, 'delivery': False, 'precision': {'amount': 8, 'price': 8}},
+    ])
+    market = exchange.market('BNB/BTC')
+    cases = [
+        ('safe_float, a dict', lambda: exchange.safe_float(ticker, 'lastPrice')),
+        ('safe_float, missing', lambda: exchange.safe_float(ticker, 'missing')),
+        ('safe_string', lambda: exchange.safe_string(ticker, 'symbol')),
+        ('safe_integer', lambda: exchange.safe_integer(ticker, 'closeTime')),
+        ('safe_value', lambda: exchange.safe_value(order, 'fills')),
+        ('safe_string_lower', lambda: exchange.safe_string_lower(order, 'side')),
+        ('safe_float_2, second key', lambda: exchange.safe_float_2(private_trade, 'p', 'price')),
+        ('safe_integer_2, second key', lambda: exchange.safe_integer_2(private_trade, 'T', 'time')),
+        ('safe_timestamp', lambda: exchange.safe_timestamp(ticker, 'closeTime')),
+        ('safe_float, a list', lambda: exchange.safe_float(kline, 1)),
+    ]
+    parses = [
+        ('parse_trade, aggregate', lambda: exchange.parse_trade(aggregate_trade, market)),
+        ('parse_trade, private', lambda: exchange.parse_trade(private_trade)),
+        ('parse_ticker', lambda: exchange.parse_ticker(ticker)),
+        ('parse_order', lambda: exchange.parse_order(order)),
+    ]
+    for cases, number in ((cases, argv.number), (parses, argv.number // 10)):
+        for name, function in cases:
+            elapsed = min(timeit.repeat(function, number=number, repeat=argv.repeat)) / number
+            print('{:28} {:8.3f} us'.format(name, elapsed * 1000000))
+
+
+if __name__ == '__main__':
+    main()
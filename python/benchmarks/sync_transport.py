@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+"""Requests per second and connections opened by threads polling a local server in bursts through shared exchange instances"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.connection_pool import close_shared_adapters  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--threads', type=int, default=32, help='threads sending requests')
+parser.add_argument('--instances', type=int, default=2, help='exchange instances shared by the threads')
+parser.add_argument('--requests', type=int, default=50, help='bursts, each thread sends one request per burst')
+parser.add_argument('--latency', type=float, default=10, help='milliseconds the server takes to respond, like a network round trip')
+argv = parser.parse_args()
+
+# ------------------------------------------------------------------------------
+
+payload = b'{"serverTime":1600000000000}'
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def setup(self):
+        with self.server.connections.get_lock():
+            self.server.connections.value += 1
+        BaseHTTPRequestHandler.setup(self)
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(port, connections, latency):
+    """Runs in a process of its own, so that the server does not compete with the clients for the GIL"""
+    ThreadingHTTPServer.request_queue_size = 1024
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.connections = connections
+    server.latency = latency
+    port.value = server.server_port
+    server.serve_forever()
+
+
+port = multiprocessing.Value('i', 0)
+connections = multiprocessing.Value('i', 0)
+process = multiprocessing.Process(target=serve, args=(port, connections, argv.latency / 1000), daemon=True)
+process.start()
+while not port.value:
+    time.sleep(0.01)
+url = 'http://127.0.0.1:' + str(port.value) + '/api/v3/time'
+
+# ------------------------------------------------------------------------------
+
+
+def run(config):
+    exchanges = [ccxt.Exchange(config) for i in range(argv.instances)]
+
+    # all the threads poll at once, like a loop fetching many symbols every few seconds
+    burst = threading.Barrier(argv.threads)
+
+    def worker(exchange):
+        for i in range(argv.requests):
+            burst.wait()
+            exchange.fetch(url)
+
+    threads = [threading.Thread(target=worker, args=(exchanges[i % argv.instances],)) for i in range(argv.threads)]
+    connections.value = 0
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return argv.threads * argv.requests / elapsed, connections.value
+
+
+# the urllib3 warnings about discarded connections are the point of the default case
+import logging  # noqa: E402
+logging.getLogger('urllib3').setLevel(logging.ERROR)
+
+print('{} threads over {} instances, {} requests each'.format(argv.threads, argv.instances, argv.requests))
+cases = (
+    ('default', {}),
+    ('sized', {'connectionPool': {'poolMaxsize': argv.threads}}),
+    ('shared', {'connectionPool': {'poolMaxsize': argv.threads, 'shared': True}}),
+)
+for name, config in cases:
+    rate, opened = run(config)
+    print('  {:8} {:8.0f} requests/s   {:6} connections opened'.format(name, rate, opened))
+close_shared_adapters()
+process.terminate()
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+"""aiohttp connectors shared by the async exchange instances of an event loop, and metrics of their connections"""
+
+# -----------------------------------------------------------------------------
+
+import time
+import weakref
+
+import aiohttp
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'ConnectionMetrics',
+    'acquire_connector',
+    'create_connector',
+    'release_connector',
+]
+
+# -----------------------------------------------------------------------------
+
+
+def create_connector(config, ssl, loop):
+    """A TCPConnector configured by the connectionPool config of an exchange"""
+    return aiohttp.TCPConnector(
+        ssl=ssl,
+        loop=loop,
+        limit=config.get('limit', 100),  # connections open at once, 0 for no limit
+        limit_per_host=config.get('limitPerHost', 0),
+        use_dns_cache=True,
+        ttl_dns_cache=config.get('ttlDnsCache', 10),  # seconds, None to cache forever
+        keepalive_timeout=config.get('keepaliveTimeout', 15),  # seconds an idle connection is kept
+        enable_cleanup_closed=True,
+    )
+
+
+class SharedConnector(object):
+
+    __slots__ = ('connector', 'references')
+
+    def __init__(self, connector):
+        self.connector = connector
+        self.references = 0
+
+
+# event loop → {settings: SharedConnector}, connectors cannot be used across loops
+registry = weakref.WeakKeyDictionary()
+
+
+def connector_key(config, verify, cafile):
+    return (
+        verify,
+        cafile,
+        config.get('limit', 100),
+        config.get('limitPerHost', 0),
+        config.get('ttlDnsCache', 10),
+        config.get('keepaliveTimeout', 15),
+    )
+
+
+def acquire_connector(config, ssl, verify, cafile, loop):
+    """Returns the connector shared by the instances of a loop with the same settings, references it once more"""
+    connectors = registry.setdefault(loop, {})
+    key = connector_key(config, verify, cafile)
+    shared = connectors.get(key)
+    if shared is None or shared.connector.closed:
+        shared = SharedConnector(create_connector(config, ssl, loop))
+        connectors[key] = shared
+    shared.references += 1
+    return shared.connector
+
+
+async def release_connector(connector, loop):
+    """Drops a reference to a shared connector, closes it with the last one"""
+    connectors = registry.get(loop, {})
+    for key, shared in list(connectors.items()):
+        if shared.connector is connector:
+            shared.references -= 1
+            if shared.references <= 0:
+                del connectors[key]
+                await connector.close()
+            return
+
+
+class ConnectionMetrics(object):
+    """Counts the connections and times the requests of a ClientSession through an aiohttp TraceConfig"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.dns_cache_hits = 0
+        self.dns_cache_misses = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.connector = None
+
+    def trace_config(self):
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self.on_request_start)
+        trace_config.on_request_end.append(self.on_request_end)
+        trace_config.on_request_exception.append(self.on_request_exception)
+        trace_config.on_connection_create_end.append(self.on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(self.on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(self.on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(self.on_dns_cache_miss)
+        return trace_config
+
+    async def on_request_start(self, session, context, params):
+        context.start = time.perf_counter()
+
+    async def on_request_end(self, session, context, params):
+        # up to the response headers, the body is read afterwards
+        latency = time.perf_counter() - context.start
+        self.requests += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    async def on_request_exception(self, session, context, params):
+        self.errors += 1
+
+    async def on_connection_create_end(self, session, context, params):
+        self.connections_created += 1
+
+    async def on_connection_reuseconn(self, session, context, params):
+        self.connections_reused += 1
+
+    async def on_dns_cache_hit(self, session, context, params):
+        self.dns_cache_hits += 1
+
+    async def on_dns_cache_miss(self, session, context, params):
+        self.dns_cache_misses += 1
+
+    def open_connections(self):
+        """Connections currently open in the connector, shared ones included, in use or idle"""
+        connector = self.connector
+        if connector is None or connector.closed:
+            return 0
+        acquired = getattr(connector, '_acquired', ())
+        idle = getattr(connector, '_conns', {})
+        return len(acquired) + sum(len(connections) for connections in idle.values())
+
+    def summary(self):
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'connectionsCreated': self.connections_created,
+            'connectionsReused': self.connections_reused,
+            'openConnections': self.open_connections(),
+            'dnsCacheHits': self.dns_cache_hits,
+            'dnsCacheMisses': self.dns_cache_misses,
+            'latencyAverage': self.latency_total / self.requests * 1000 if self.requests else None,  # milliseconds
+            'latencyMax': self.latency_max * 1000,
+        }
@@ -7,23 +7,22 @@ __version__ = '1.38.20'
 # -----------------------------------------------------------------------------
 
 import asyncio
-import concurrent
-import socket
 import certifi
 import aiohttp
+import inspect
 import ssl
 import sys
-import yarl
 
 # -----------------------------------------------------------------------------
 
 from ccxt.async_support.base.throttle import throttle
+from ccxt.async_support.base.connector_pool import ConnectionMetrics, acquire_connector, create_connector, release_connector
+from ccxt.async_support.base.transport import AiohttpTransport
 
 # -----------------------------------------------------------------------------
 
+from ccxt.base.errors import BaseError
 from ccxt.base.errors import ExchangeError
-from ccxt.base.errors import ExchangeNotAvailable
-from ccxt.base.errors import RequestTimeout
 from ccxt.base.errors import NotSupported
 
 # -----------------------------------------------------------------------------
@@ -42,6 +41,9 @@ __all__ = [
 
 class Exchange(BaseExchange):
 
+    connection_metrics = None  # with connectionPool['metrics'], see ConnectionMetrics.summary()
+    shared_connector = None
+
     def __init__(self, config={}):
         if 'asyncio_loop' in config:
             self.asyncio_loop = config['asyncio_loop']
@@ -51,17 +53,18 @@ class Exchange(BaseExchange):
         self.own_session = 'session' not in config
         self.cafile = config.get('cafile', certifi.where())
         super(Exchange, self).__init__(config)
-        self.init_rest_rate_limiter()
         self.markets_loading = None
         self.reloading_markets = False
 
     def init_rest_rate_limiter(self):
         self.throttle = throttle(self.extend({
             'loop': self.asyncio_loop,
+            'bucket': self.rate_limit_bucket(),
+            'rateLimit': self.rateLimit,
         }, self.tokenBucket))
 
     def __del__(self):
-        if self.session is not None:
+        if self.session is not None or self.http2_client is not None:
             self.logger.warning(self.id + " requires to release all resources with an explicit call to the .close() coroutine. If you are using the exchange instance with async coroutines, add exchange.close() to your code into a place when you're done with the exchange and don't need the exchange instance anymore (at the end of your async coroutine).")
 
     if sys.version_info >= (3, 5):
@@ -73,85 +76,120 @@ class Exchange(BaseExchange):
             await self.close()
 
     def open(self):
+        if self.http2:
+            if self.http2_client is None:
+                from ccxt.base.http2 import acquire_async_client, create_async_client  # only with the http2 option
+                config = self.http2_config()
+                if config.get('shared'):
+                    self.http2_client = acquire_async_client(config, self.verify, self.aiohttp_proxy, self.asyncio_loop)
+                else:
+                    self.http2_client = create_async_client(config, self.verify, self.aiohttp_proxy)
+            return
         if self.own_session and self.session is None:
             # Create our SSL context object with our CA cert file
             context = ssl.create_default_context(cafile=self.cafile) if self.verify else self.verify
             # Pass this SSL context to aiohttp and create a TCPConnector
-            connector = aiohttp.TCPConnector(ssl=context, loop=self.asyncio_loop, enable_cleanup_closed=True)
-            self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector, trust_env=self.aiohttp_trust_env)
+            config = self.connectionPool or {}
+            shared = bool(config.get('shared'))
+            if shared:
+                # one connector per event loop and settings, with its pools and dns cache
+                connector = acquire_connector(config, context, self.verify, self.cafile, self.asyncio_loop)
+                self.shared_connector = connector
+            elif config:
+                connector = create_connector(config, context, self.asyncio_loop)
+            else:
+                connector = aiohttp.TCPConnector(ssl=context, loop=self.asyncio_loop, enable_cleanup_closed=True)
+            trace_configs = None
+            if config.get('metrics'):
+                self.connection_metrics = ConnectionMetrics()
+                self.connection_metrics.connector = connector
+                trace_configs = [self.connection_metrics.trace_config()]
+            self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector, connector_owner=not shared, trace_configs=trace_configs, trust_env=self.aiohttp_trust_env)
 
     async def close(self):
+        if self.http2_client is not None:
+            if self.http2_shared():
+                from ccxt.base.http2 import release_async_client
+                await release_async_client(self.http2_client, self.asyncio_loop)
+            else:
+                await self.http2_client.aclose()
+            self.http2_client = None
         if self.session is not None:
             if self.own_session:
                 await self.session.close()
+                if self.shared_connector is not None:
+                    await release_connector(self.shared_connector, self.asyncio_loop)
+                    self.shared_connector = None
             self.session = None
 
     async def fetch2(self, path, api='public', method='GET', params={}, headers=None, body=None):
         """A better wrapper over request for deferred signing"""
         if self.enableRateLimit:
-            await self.throttle(self.rateLimit)
+            cost = self.calculate_rate_limiter_cost(api, method, path, params)
+            await self.throttle(self.rateLimit, cost, self.throttle_priority(api, method, params))
+        if 'throttlePriority' in params:
+            params = self.omit(params, 'throttlePriority')
         self.lastRestRequestTimestamp = self.milliseconds()
         request = self.sign(path, api, method, params, headers, body)
         return await self.fetch(request['url'], request['method'], request['headers'], request['body'])
 
     async def fetch(self, url, method='GET', headers=None, body=None):
         """Perform a HTTP request and return decoded JSON data"""
-        request_headers = self.prepare_request_headers(headers)
-        url = self.proxy + url
-
-        if self.verbose:
-            self.print("\nRequest:", method, url, headers, body)
-        self.logger.debug("%s %s, Request: %s %s", method, url, headers, body)
-
-        request_body = body
-        encoded_body = body.encode() if body else None
-        self.open()
-        session_method = getattr(self.session, method.lower())
-
-        http_response = None
-        http_status_code = None
-        http_status_text = None
+        request = self.prepare_request(url, method, headers, body)
+        if self.transport is None:
+            self.open()
         json_response = None
         try:
-            async with session_method(yarl.URL(url, encoded=True),
-                                      data=encoded_body,
-                                      headers=request_headers,
-                                      timeout=(self.timeout / 1000),
-                                      proxy=self.aiohttp_proxy) as response:
-                http_response = await response.text()
-                http_status_code = response.status
-                http_status_text = response.reason
-                json_response = self.parse_json(http_response)
-                headers = response.headers
-                if self.enableLastHttpResponse:
-                    self.last_http_response = http_response
-                if self.enableLastResponseHeaders:
-                    self.last_response_headers = headers
-                if self.enableLastJsonResponse:
-                    self.last_json_response = json_response
-                if self.verbose:
-                    self.print("\nResponse:", method, url, http_status_code, headers, http_response)
-                self.logger.debug("%s %s, Response: %s %s %s", method, url, http_status_code, headers, http_response)
-
-        except socket.gaierror as e:
-            raise ExchangeNotAvailable(method + ' ' + url)
-
-        except concurrent.futures._base.TimeoutError as e:
-            raise RequestTimeout(method + ' ' + url)
-
-        except aiohttp.client_exceptions.ClientConnectionError as e:
-            raise ExchangeNotAvailable(method + ' ' + url)
-
-        except aiohttp.client_exceptions.ClientError as e:  # base exception class
-            raise ExchangeError(method + ' ' + url)
-
-        self.handle_errors(http_status_code, http_status_text, url, method, headers, http_response, json_response, request_headers, request_body)
-        self.handle_http_status_code(http_status_code, http_status_text, url, method, http_response)
-        if json_response is not None:
-            return json_response
-        if self.is_text_response(headers):
-            return http_response
-        return response.content
+            response = self.get_transport().send(request)
+            if inspect.isawaitable(response):
+                response = await response
+            if response.chunks is not None:
+                json_response = await self.read_json_stream(response)
+        except BaseError as e:
+            raise self.wrap_transport_error(e) from e
+        return self.handle_rest_response(request, response, body, json_response)
+
+    def handle_unmapped_http_status_code(self, http_status_code, http_status_text, url, method):
+        # the async client returns the body of the error statuses left by handle_errors() and httpExceptions, as aiohttp did
+        pass
+
+    async def read_json_stream(self, response):
+        parser = self.json_stream_parser()
+        try:
+            if hasattr(response.chunks, '__aiter__'):
+                async for chunk in response.chunks:
+                    parser.feed(chunk)
+            else:
+                for chunk in response.chunks:
+                    parser.feed(chunk)
+            return parser.close()
+        except ValueError:
+            return None
+        finally:
+            if hasattr(response.chunks, 'aclose'):
+                await response.chunks.aclose()
+            elif hasattr(response.chunks, 'close'):
+                response.chunks.close()
+            response.body = parser.head
+
+    def prepare_request(self, url, method='GET', headers=None, body=None):
+        request = super(Exchange, self).prepare_request(url, method, headers, body)
+        request.proxy = self.aiohttp_proxy
+        return request
+
+    def get_transport(self):
+        if self.transport is not None:
+            return self.transport
+        client = self.http2_client if self.http2 else self.session
+        transport = self.default_transport
+        if transport is None or transport.client is not client:
+            if self.http2:
+                from ccxt.base.http2 import AsyncHttp2Transport  # only with the http2 option
+                transport = AsyncHttp2Transport(client)
+            else:
+                transport = AiohttpTransport(client)
+            self.default_transport = transport
+        return transport
 
     async def load_markets_helper(self, reload=False, params={}):
         if not reload:
@@ -159,11 +197,20 @@ class Exchange(BaseExchange):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            if self.shareMarkets:
+                markets = self.load_shared_markets()
+                if markets is not None:
+                    return markets
+            cached = self.load_cached_markets(params)
+            if cached is not None:
+                return self.set_shared_markets(*cached)
         currencies = None
         if self.has['fetchCurrencies']:
             currencies = await self.fetch_currencies()
         markets = await self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        # set_markets() extends the market structures in place, store them as fetched
+        self.save_cached_markets(markets, currencies, params)
+        return self.set_shared_markets(markets, currencies)
 
     async def load_markets(self, reload=False, params={}):
         if (reload and not self.reloading_markets) or not self.markets_loading:
@@ -1,62 +1,105 @@
 # -*- coding: utf-8 -*-
 
-from asyncio import Queue, sleep, Future, ensure_future, get_event_loop
-from time import time
+from asyncio import get_event_loop
+from collections import deque
+
+from ccxt.base.throttle import TokenBucket
 
 __all__ = [
+    'Throttle',
     'throttle',
 ]
 
 
-def throttle(config=None):
+class Throttle(object):
+    """Releases queued requests by priority, sleeping exactly until the bucket has the tokens for the next one
+
+    Each priority has its own FIFO lane, higher lanes are served first, unless
+    the request at the head of a lower lane has waited for starvationTimeout
+    milliseconds, then the one that waited longest goes first.
 
-    cfg = {
-        'lastTimestamp': time(),
-        'numTokens': 0,
-        'running': False,
-        'queue': Queue(),
-        'loop': get_event_loop(),
-        'delay': 0.001,
-        'refillRate': 0.001,
-        'defaultCost': 1.000,
-        'capacity': 1.000,
-    }
-
-    cfg.update(config)
-
-    async def run():
-        if not cfg['running']:
-            future = None
-            try:
-                cfg['running'] = True
-                while not cfg['queue'].empty():
-                    now = time()
-                    elapsed = (now - cfg['lastTimestamp'])
-                    cfg['lastTimestamp'] = now
-                    cfg['numTokens'] = min(cfg['capacity'], cfg['numTokens'] + elapsed * cfg['refillRate'] * 1000)
-                    if cfg['numTokens'] > 0:
-                        if not cfg['queue'].empty():
-                            cost, future = cfg['queue'].get_nowait()
-                            cfg['numTokens'] -= (cost if cost else cfg['defaultCost'])
-                            if not future.done():
-                                future.set_result(None)
-                    await sleep(cfg['delay'])
-            except BaseException as excp:
-                if future is not None:
-                    if not future.done():
-                        future.set_exception(excp)
-                while not cfg['queue'].empty():
-                    _, future = cfg['queue'].get_nowait()
-                    if not future.done():
-                        future.set_exception(excp)
-            finally:
-                cfg['running'] = False
-
-    def throttle(rate_limit, cost=None):
-        future = Future()
-        cfg['refillRate'] = 1 / rate_limit
-        cfg['queue'].put_nowait((cost, future))
-        ensure_future(run())
+    At most one timer is pending at a time, it belongs to the request that was
+    released last, which has already reserved its tokens. A request cancelled
+    while queued is skipped, one cancelled while holding its reservation gives
+    the tokens back and lets the next request go right away.
+    """
+
+    def __init__(self, config=None):
+        config = config or {}
+        self.loop = config.get('loop') or get_event_loop()
+        self.bucket = config.get('bucket') or TokenBucket(config)
+        self.priorities = config.get('priorities', ['trading', 'account', 'market'])  # highest first
+        self.starvation_timeout = config.get('starvationTimeout', 5000) / 1000
+        self.lanes = dict((priority, deque()) for priority in self.priorities)
+        self.timer = None
+        self.head = None
+        self.rate_limit = config.get('rateLimit')
+
+    def __call__(self, rate_limit=None, cost=None, priority=None):
+        if rate_limit is not None and rate_limit != self.rate_limit:
+            # tokenBucket was made for the rateLimit of the config, later changes of exchange.rateLimit apply
+            if self.rate_limit is not None:
+                self.bucket.refill_rate = 1 / rate_limit if rate_limit > 0 else float('inf')
+            self.rate_limit = rate_limit
+        future = self.loop.create_future()
+        lane = self.lanes[priority if priority in self.lanes else self.priorities[-1]]
+        lane.append((cost, future, self.loop.time()))
+        if self.timer is None:
+            self.release()
         return future
 
-    return throttle
+    def next(self):
+        """Pops the request to release next, O(number of priorities)"""
+        now = self.loop.time()
+        chosen = None
+        starving = None
+        for priority in self.priorities:
+            lane = self.lanes[priority]
+            while lane and lane[0][1].done():
+                lane.popleft()
+            if not lane:
+                continue
+            if chosen is None:
+                chosen = lane
+            elif now - lane[0][2] >= self.starvation_timeout and (starving is None or lane[0][2] < starving[0][2]):
+                starving = lane
+        if starving is not None and starving[0][2] < chosen[0][2]:
+            chosen = starving
+        return chosen.popleft() if chosen is not None else None
+
+    def release(self):
+        while True:
+            request = self.next()
+            if request is None:
+                return
+            cost, future, queued = request
+            delay = self.bucket.reserve(cost)
+            if delay > 0:
+                self.head = (cost, future)
+                self.timer = self.loop.call_later(delay, self.wake)
+                future.add_done_callback(self.cancelled)
+                return
+            future.set_result(None)
+
+    def wake(self):
+        cost, future = self.head
+        self.head = None
+        self.timer = None
+        if not future.done():
+            future.set_result(None)
+        self.release()
+
+    def cancelled(self, future):
+        if self.head is not None and self.head[1] is future and future.cancelled():
+            self.timer.cancel()
+            self.bucket.refund(self.head[0])
+            self.head = None
+            self.timer = None
+            self.release()
+
+    def pending(self):
+        return sum(len(lane) for lane in self.lanes.values())
+
+
+def throttle(config=None):
+    return Throttle(config)
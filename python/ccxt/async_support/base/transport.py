@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""The default transport of the async Exchange, over an aiohttp ClientSession"""
+
+# -----------------------------------------------------------------------------
+
+import asyncio
+import socket
+
+import aiohttp
+import yarl
+
+from ccxt.base.errors import ExchangeError
+from ccxt.base.errors import ExchangeNotAvailable
+from ccxt.base.errors import RequestTimeout
+from ccxt.base.transport import CHUNK_SIZE, Response, Transport, streams
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'AiohttpTransport',
+]
+
+# -----------------------------------------------------------------------------
+
+
+def aiohttp_error(e, details):
+    """The ccxt exception for an exception of aiohttp"""
+    if isinstance(e, socket.gaierror):
+        return ExchangeNotAvailable(details)
+    if isinstance(e, asyncio.TimeoutError):
+        return RequestTimeout(details)
+    if isinstance(e, aiohttp.ClientConnectionError):
+        return ExchangeNotAvailable(details)
+    return ExchangeError(details)  # base exception class
+
+
+class AiohttpTransport(Transport):
+
+    def __init__(self, session):
+        self.client = session
+
+    async def send(self, request):
+        details = request.method + ' ' + request.url
+        try:
+            response = await self.client.request(request.method,
+                                                 yarl.URL(request.url, encoded=True),
+                                                 data=request.body,
+                                                 headers=request.headers,
+                                                 timeout=aiohttp.ClientTimeout(total=request.timeout),
+                                                 proxy=request.proxy)
+        except (socket.gaierror, asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise aiohttp_error(e, details) from e
+        if streams(request, response.status, response.headers):
+            return Response(response.status, response.reason, response.headers, None, self.chunks(response, details))
+        try:
+            body = await response.read()
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise aiohttp_error(e, details) from e
+        finally:
+            response.release()
+        return Response(response.status, response.reason, response.headers, body)
+
+    async def chunks(self, response, details):
+        try:
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                yield chunk
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            raise aiohttp_error(e, details) from e
+        finally:
+            response.release()
+
+    async def close(self):
+        await self.client.close()
@@ -363,9 +363,11 @@ class kraken(Exchange):
                 },
             })
         result = self.append_inactive_markets(result)
-        self.marketsByAltname = self.index_by(result, 'altname')
         return result
 
+    def on_markets_loaded(self, markets):
+        self.marketsByAltname = self.index_by(markets, 'altname')
+
     def safe_currency_code(self, currencyId, currency=None):
         if len(currencyId) > 3:
             if (currencyId.find('X') == 0) or (currencyId.find('Z') == 0):
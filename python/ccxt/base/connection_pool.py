@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+"""Sized and optionally shared urllib3 connection pools for the requests sessions of the synchronous Exchange"""
+
+# -----------------------------------------------------------------------------
+
+import threading
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'SharedHTTPAdapter',
+    'close_shared_adapters',
+    'pooled_session',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class SharedHTTPAdapter(HTTPAdapter):
+    """An adapter mounted on the sessions of many instances, closing one of them keeps the pools open"""
+
+    def close(self):
+        pass
+
+    def close_pools(self):
+        HTTPAdapter.close(self)
+
+
+lock = threading.Lock()
+shared_adapters = {}
+
+
+def adapter_settings(config):
+    return (
+        config.get('poolConnections', 10),  # number of hosts with a pool of their own
+        config.get('poolMaxsize', 10),  # connections kept alive per host
+        config.get('poolBlock', False),  # wait for a free connection rather than open one that is not kept
+    )
+
+
+def shared_adapter(config):
+    settings = adapter_settings(config)
+    with lock:
+        adapter = shared_adapters.get(settings)
+        if adapter is None:
+            adapter = SharedHTTPAdapter(pool_connections=settings[0], pool_maxsize=settings[1], pool_block=settings[2])
+            shared_adapters[settings] = adapter
+        return adapter
+
+
+def pooled_session(config):
+    """Returns a Session whose connection pools are sized by the connectionPool config of an exchange"""
+    session = Session()
+    if config.get('shared'):
+        adapter = shared_adapter(config)
+    else:
+        settings = adapter_settings(config)
+        adapter = HTTPAdapter(pool_connections=settings[0], pool_maxsize=settings[1], pool_block=settings[2])
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def close_shared_adapters():
+    """Closes the connections kept by the shared pools, they are reopened on demand"""
+    with lock:
+        adapters = list(shared_adapters.values())
+        shared_adapters.clear()
+    for adapter in adapters:
+        adapter.close_pools()
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""Per-instance views over settings shared by all instances of an exchange class"""
+
+# -----------------------------------------------------------------------------
+
+import copy
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'CopyOnWriteDict',
+    'SharedSetting',
+]
+
+# -----------------------------------------------------------------------------
+
+
+def private_copy(value):
+    """Returns a copy of a shared value that can be mutated without touching the original"""
+    if type(value) is dict:
+        return CopyOnWriteDict(value)
+    if type(value) is list:
+        return [private_copy(element) for element in value]
+    return value
+
+
+class CopyOnWriteDict(dict):
+    """A shallow copy of a shared dict, nested dicts and lists are copied when first reached
+
+    Keys holding shared containers are tracked in _shared, reading one of them
+    replaces the value with a private copy, so writes at any depth never leak
+    into the shared original, and untouched branches are never copied at all.
+    """
+
+    __slots__ = ('_shared',)
+
+    def __init__(self, shared=None):
+        dict.__init__(self, shared or {})
+        self._shared = set(key for key, value in dict.items(self) if type(value) in (dict, list))
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if key in self._shared:
+            value = private_copy(value)
+            dict.__setitem__(self, key, value)
+            self._shared.discard(key)
+        return value
+
+    def __iter__(self):
+        # overriding __iter__ makes dict(), dict.update() and {**d} read through __getitem__
+        return dict.__iter__(self)
+
+    def __setitem__(self, key, value):
+        self._shared.discard(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._shared.discard(key)
+        dict.__delitem__(self, key)
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self.items()), memo)
+
+    def __reduce__(self):
+        return (dict, (dict(self.items()),))
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *args):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        if key in self._shared:
+            self._shared.discard(key)
+            value = private_copy(value)
+        return key, value
+
+    def clear(self):
+        self._shared.clear()
+        dict.clear(self)
+
+    def update(self, *args, **kwargs):
+        if args:
+            other = args[0]
+            if hasattr(other, 'keys'):
+                for key in other.keys():
+                    self[key] = other[key]
+            else:
+                for key, value in other:
+                    self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def unshare(self):
+        for key in list(self._shared):
+            self[key]
+
+    def values(self):
+        self.unshare()
+        return dict.values(self)
+
+    def items(self):
+        self.unshare()
+        return dict.items(self)
+
+    def copy(self):
+        result = CopyOnWriteDict(self)
+        result._shared = set(self._shared)
+        return result
+
+
+class SharedSetting(object):
+    """A class-level dict or list setting handed to each instance as a private copy on first access
+
+    This is a non-data descriptor, once the copy is stored in the instance __dict__
+    further lookups never reach it, assignments go straight to the instance
+    """
+
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.value
+        value = private_copy(self.value)
+        instance.__dict__[self.name] = value
+        return value
@@ -8,8 +8,8 @@ __version__ = '1.38.20'
 
 # -----------------------------------------------------------------------------
 
+from ccxt.base.errors import BaseError
 from ccxt.base.errors import ExchangeError
-from ccxt.base.errors import NetworkError
 from ccxt.base.errors import NotSupported
 from ccxt.base.errors import AuthenticationError
 from ccxt.base.errors import DDoSProtection
@@ -28,6 +28,24 @@ from ccxt.base.decimal_to_precision import number_to_string
 
 # -----------------------------------------------------------------------------
 
+from ccxt.base.copy_on_write import SharedSetting
+from ccxt.base.market_store import market_store
+from ccxt.base.markets_cache import FileMarketsCache
+from ccxt.base.json_codec import get_codec, plain as plain_json
+from ccxt.base.response_headers import get_response_headers, set_response_headers
+from ccxt.base.throttle import throttle
+from ccxt.base.shared_throttle import FileBucketStore
+from ccxt.base.connection_pool import pooled_session
+from ccxt.base.transport import Request, RequestsTransport
+from ccxt.base.json_stream import JsonStreamParser
+from ccxt.base.numeric_book import NumericBookSide
+from ccxt.base.ohlcv_columns import OHLCVColumns, infer_indexes as infer_ohlcv_indexes
+from ccxt.base.iso8601 import format_iso8601, parse_iso8601
+from ccxt.base.lazy_structure import LazyStructure
+from ccxt.base.records import Order, Record, Trade
+
+# -----------------------------------------------------------------------------
+
 # rsa jwt signing
 from cryptography.hazmat import backends
 from cryptography.hazmat.primitives import hashes
@@ -54,6 +72,7 @@ __all__ = [
 
 # Python 2 & 3
 import types
+import array
 import logging
 import base64
 import calendar
@@ -64,6 +83,7 @@ import functools
 import gzip
 import hashlib
 import hmac
+import inspect
 import io
 import json
 import math
@@ -71,9 +91,7 @@ from numbers import Number
 import re
 from requests import Session
 from requests.utils import default_user_agent
-from requests.exceptions import HTTPError, Timeout, TooManyRedirects, RequestException, ConnectionError as requestsConnectionError
 # import socket
-from ssl import SSLError
 # import sys
 import time
 import uuid
@@ -127,6 +145,11 @@ class Exchange(object):
     aiohttp_proxy = None
     aiohttp_trust_env = False
     session = None  # Session () by default
+    connectionPool = None  # {'poolConnections': 10, 'poolMaxsize': 10, 'poolBlock': False, 'shared': False}
+    http2 = None  # True or {'maxConnections': 100, 'maxKeepaliveConnections': 20, 'keepaliveExpiry': 15, 'shared': False}
+    http2_client = None
+    transport = None  # a Transport of your own, see ccxt.base.transport
+    default_transport = None
     verify = True  # SSL verification
     logger = None  # logging.getLogger(__name__) by default
     userAgent = None
@@ -174,6 +197,12 @@ class Exchange(object):
     twofa = None
     marketsById = None
     markets_by_id = None
+    shareMarkets = False  # share loaded markets with all instances of the same exchange, api type and urls
+    markets_version = None
+    _rest_api_costs = None  # endpoint cost configs from the api map by (api, method, path)
+    marketsCache = None  # {'directory': ..., 'ttl': milliseconds} or a cache object
+    # the options read by fetch_markets() and fetch_currencies(), the markets cache keeps an entry per their values
+    marketsCacheOptions = ['defaultType', 'type', 'fetchMarkets', 'fetchMarketsMethod', 'fetch_markets_from_api', 'fetch_markets_from_open_api', 'limits', 'fees', 'precision', 'defaultPrecision', 'fiatCurrencies', 'promotionalMarkets', 'quoteIds', 'tradingFeesByQuoteCurrency', 'venueId']
     currencies_by_id = None
     precision = None
     exceptions = None
@@ -310,9 +339,28 @@ class Exchange(object):
     enableLastHttpResponse = True
     enableLastJsonResponse = True
     enableLastResponseHeaders = True
+    lean = False  # keep no last responses on the instance, see last_response_headers
+    sharedRateLimit = None  # True, {'directory': ...} or a store with bucket(key, config), see rate_limit_bucket()
+    adaptiveRateLimit = False  # resync the rate limiter from the rateLimitHeaders of every response
+    rateLimitHeaders = {
+        'retryAfter': 'Retry-After',  # seconds to hold all requests back
+        'remaining': 'X-RateLimit-Remaining',  # budget left in the current window
+        'reset': 'X-RateLimit-Reset',  # end of the current window, in seconds from now or as a timestamp
+        # 'used': 'x-mbx-used-weight-1m',  # budget used in the current window, out of 'limit'
+        # 'limit': 1200,
+        # 'window': 60000,  # length of clock-aligned windows in milliseconds, when there is no reset header
+        # 'weight': 10,  # units of the budget per token, per request of the default cost, 1 by default
+    }
     last_http_response = None
     last_json_response = None
-    last_response_headers = None
+    _last_response_headers = None
+    jsonCodec = 'json'  # 'json', 'orjson', 'ujson' or a codec object with loads() and dumps()
+    streamingJson = None  # True or {'threshold': 1048576, 'numericKeys': ['bids', 'asks']}, parse large responses as they arrive
+    orderBookFormat = 'list'  # 'list' of [price, amount] pairs, 'array' or 'numpy' for a NumericBookSide per side
+    ohlcvFormat = 'list'  # 'list' of candles, 'array' or 'numpy' for OHLCVColumns
+    ohlcvColumns = None  # the indexes of the timestamp, open, high, low, close and volume in the rows of the exchange, inferred when None
+    lazyStructures = None  # True or {'info': False}, trades, orders, transactions and ledger entries as LazyStructure, without their 'datetime' string and, with 'info': False, their 'info'
+    structureRecords = None  # True or {'info': False}, trades and orders as Trade and Order records with __slots__, read as dicts, before lazyStructures
 
     requiresWeb3 = False
     requiresEddsa = False
@@ -332,18 +380,14 @@ class Exchange(object):
 
     def __init__(self, config={}):
 
-        self.precision = dict() if self.precision is None else self.precision
-        self.limits = dict() if self.limits is None else self.limits
-        self.exceptions = dict() if self.exceptions is None else self.exceptions
-        self.headers = dict() if self.headers is None else self.headers
-        self.balance = dict() if self.balance is None else self.balance
-        self.orderbooks = dict() if self.orderbooks is None else self.orderbooks
-        self.tickers = dict() if self.tickers is None else self.tickers
-        self.trades = dict() if self.trades is None else self.trades
-        self.transactions = dict() if self.transactions is None else self.transactions
-        self.ohlcvs = dict() if self.ohlcvs is None else self.ohlcvs
-        self.currencies = dict() if self.currencies is None else self.currencies
-        self.options = dict() if self.options is None else self.options  # Python does not allow to define properties in run-time with setattr
+        # the describe() tree is merged once per class and shared by all instances
+        cls = type(self)
+        if '_shared_settings' not in cls.__dict__:
+            self.define_shared_settings()
+
+        for key in ('precision', 'limits', 'exceptions', 'headers', 'balance', 'orderbooks', 'tickers', 'trades', 'transactions', 'ohlcvs', 'currencies', 'options'):
+            if getattr(cls, key) is None:
+                setattr(self, key, {})  # Python does not allow to define properties in run-time with setattr
         self.decimal_to_precision = decimal_to_precision
         self.number_to_string = number_to_string
 
@@ -353,44 +397,51 @@ class Exchange(object):
         # }
 
         self.origin = self.uuid()
-        self.userAgent = default_user_agent()
-
-        settings = self.deep_extend(self.describe(), config)
-
-        for key in settings:
-            if hasattr(self, key) and isinstance(getattr(self, key), dict):
-                setattr(self, key, self.deep_extend(getattr(self, key), settings[key]))
-            else:
-                setattr(self, key, settings[key])
-
-        if self.api:
-            self.define_rest_api(self.api, 'request')
+        if 'userAgent' not in cls._shared_settings:
+            self.userAgent = default_user_agent()
+
+        # only the settings overridden by the config are copied into the instance
+        for key in config:
+            value = getattr(self, key, None)
+            setattr(self, key, self.deep_extend(value, config[key]) if isinstance(value, dict) else self.deep_extend(config[key]))
+
+        # generated methods and camelcase aliases live on the class
+        # they are only rebuilt when the config brings its own api
+        if ('api' in config) or not cls.__dict__.get('_rest_api_defined'):
+            api = self.api if 'api' in config else getattr(cls, 'api')
+            if api:
+                self.define_rest_api(api, 'request')
+            cls._rest_api_defined = True
+            self.define_camelcase_aliases()
+
+        # underscored config keys unknown to the class get a camelcase copy on the instance
+        for key in config:
+            camelcase = self.camelcase_alias(key)
+            if camelcase and camelcase not in cls._camelcase_attributes:
+                setattr(self, camelcase, getattr(self, key))
 
         if self.markets:
             self.set_markets(self.markets)
 
-        # convert all properties from underscore notation foo_bar to camelcase notation fooBar
-        cls = type(self)
-        for name in dir(self):
-            if name[0] != '_' and name[-1] != '_' and '_' in name:
-                parts = name.split('_')
-                # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
-                exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE'}
-                camelcase = parts[0] + ''.join(exceptions.get(i, self.capitalize(i)) for i in parts[1:])
-                attr = getattr(self, name)
-                if isinstance(attr, types.MethodType):
-                    setattr(cls, camelcase, getattr(cls, name))
-                else:
-                    setattr(self, camelcase, attr)
-
         self.tokenBucket = self.extend({
             'refillRate': 1.0 / self.rateLimit if self.rateLimit > 0 else float('inf'),
             'delay': 0.001,
             'capacity': 1.0,
             'defaultCost': 1.0,
         }, getattr(self, 'tokenBucket', {}))
+        self.init_rest_rate_limiter()
+
+        if self.lean:
+            self.enableLastHttpResponse = False
+            self.enableLastJsonResponse = False
+            self.enableLastResponseHeaders = False
+
+        if self.jsonCodec != Exchange.jsonCodec:
+            # request bodies are encoded by the instance codec, Exchange.json() stays on the standard library
+            self.json = self.dump_json
 
-        self.session = self.session if self.session or self.asyncio_loop else Session()
+        if not self.session and not self.asyncio_loop:
+            self.session = pooled_session(self.connectionPool) if self.connectionPool else Session()
         self.logger = self.logger if self.logger else logging.getLogger(__name__)
 
         if self.requiresWeb3 and Web3 and not Exchange.web3:
@@ -399,6 +450,26 @@ class Exchange(object):
     def __del__(self):
         if self.session:
             self.session.close()
+        if self.http2_client is not None and not self.http2_shared():
+            self.http2_client.close()
+
+    def __getattr__(self, name):
+        # camelcase aliases of data attributes (lastHttpResponse → last_http_response)
+        attribute = type(self).__dict__.get('_camelcase_attributes', {}).get(name)
+        if attribute is None:
+            raise AttributeError("'" + type(self).__name__ + "' object has no attribute '" + name + "'")
+        return getattr(self, attribute)
+
+    @property
+    def last_response_headers(self):
+        """With enableLastResponseHeaders off these are the headers of the latest call from the current thread or task"""
+        if self.enableLastResponseHeaders:
+            return self._last_response_headers
+        return get_response_headers(self)
+
+    @last_response_headers.setter
+    def last_response_headers(self, headers):
+        self._last_response_headers = headers
 
     def __repr__(self):
         return 'ccxt.' + ('async_support.' if self.asyncio_loop else '') + self.id + '()'
@@ -421,66 +492,198 @@ class Exchange(object):
             del self.urls['api_backup']
 
     @classmethod
-    def define_rest_api(cls, api, method_name, paths=[]):
+    def define_rest_api_endpoint(cls, method_name, key, path, paths, config=None):
         delimiters = re.compile('[^a-zA-Z0-9]')
         entry = getattr(cls, method_name)  # returns a function (instead of a bound method)
+        uppercase_method = key.upper()
+        lowercase_method = key.lower()
+        camelcase_method = lowercase_method.capitalize()
+        path = path.strip()
+        split_path = delimiters.split(path)
+        lowercase_path = [x.strip().lower() for x in split_path]
+        camelcase_suffix = ''.join([Exchange.capitalize(x) for x in split_path])
+        underscore_suffix = '_'.join([x for x in lowercase_path if len(x)])
+        camelcase_prefix = ''
+        underscore_prefix = ''
+        if len(paths):
+            camelcase_prefix = paths[0]
+            underscore_prefix = paths[0]
+            if len(paths) > 1:
+                camelcase_prefix += ''.join([Exchange.capitalize(x) for x in paths[1:]])
+                underscore_prefix += '_' + '_'.join([x.strip() for p in paths[1:] for x in delimiters.split(p)])
+                api_argument = paths
+            else:
+                api_argument = paths[0]
+        camelcase = camelcase_prefix + camelcase_method + Exchange.capitalize(camelcase_suffix)
+        underscore = underscore_prefix + '_' + lowercase_method + '_' + underscore_suffix.lower()
+
+        if config is not None:
+            if '_rest_api_costs' not in cls.__dict__:
+                cls._rest_api_costs = dict(cls._rest_api_costs or {})
+            api_key = tuple(api_argument) if isinstance(api_argument, list) else api_argument
+            cls._rest_api_costs[(api_key, uppercase_method, path)] = config
+
+        def partialer():
+            outer_kwargs = {'path': path, 'api': api_argument, 'method': uppercase_method}
+
+            @functools.wraps(entry)
+            def inner(_self, params=None):
+                """
+                Inner is called when a generated method (publicGetX) is called.
+                _self is a reference to self created by function.__get__(exchange, type(exchange))
+                https://en.wikipedia.org/wiki/Closure_(computer_programming) equivalent to functools.partial
+                """
+                inner_kwargs = dict(outer_kwargs)  # avoid mutation
+                if params is not None:
+                    inner_kwargs['params'] = params
+                return entry(_self, **inner_kwargs)
+            return inner
+        to_bind = partialer()
+        setattr(cls, camelcase, to_bind)
+        setattr(cls, underscore, to_bind)
+
+    @classmethod
+    def define_rest_api(cls, api, method_name, paths=[]):
         for key, value in api.items():
             if isinstance(value, list):
-                uppercase_method = key.upper()
-                lowercase_method = key.lower()
-                camelcase_method = lowercase_method.capitalize()
                 for path in value:
-                    path = path.strip()
-                    split_path = delimiters.split(path)
-                    lowercase_path = [x.strip().lower() for x in split_path]
-                    camelcase_suffix = ''.join([Exchange.capitalize(x) for x in split_path])
-                    underscore_suffix = '_'.join([x for x in lowercase_path if len(x)])
-                    camelcase_prefix = ''
-                    underscore_prefix = ''
-                    if len(paths):
-                        camelcase_prefix = paths[0]
-                        underscore_prefix = paths[0]
-                        if len(paths) > 1:
-                            camelcase_prefix += ''.join([Exchange.capitalize(x) for x in paths[1:]])
-                            underscore_prefix += '_' + '_'.join([x.strip() for p in paths[1:] for x in delimiters.split(p)])
-                            api_argument = paths
-                        else:
-                            api_argument = paths[0]
-                    camelcase = camelcase_prefix + camelcase_method + Exchange.capitalize(camelcase_suffix)
-                    underscore = underscore_prefix + '_' + lowercase_method + '_' + underscore_suffix.lower()
-
-                    def partialer():
-                        outer_kwargs = {'path': path, 'api': api_argument, 'method': uppercase_method}
-
-                        @functools.wraps(entry)
-                        def inner(_self, params=None):
-                            """
-                            Inner is called when a generated method (publicGetX) is called.
-                            _self is a reference to self created by function.__get__(exchange, type(exchange))
-                            https://en.wikipedia.org/wiki/Closure_(computer_programming) equivalent to functools.partial
-                            """
-                            inner_kwargs = dict(outer_kwargs)  # avoid mutation
-                            if params is not None:
-                                inner_kwargs['params'] = params
-                            return entry(_self, **inner_kwargs)
-                        return inner
-                    to_bind = partialer()
-                    setattr(cls, camelcase, to_bind)
-                    setattr(cls, underscore, to_bind)
+                    cls.define_rest_api_endpoint(method_name, key, path, paths)
+            elif key.lower() in ('get', 'post', 'put', 'delete', 'patch', 'head') and isinstance(value, dict):
+                # {'depth': {'cost': 1, 'byLimit': [[100, 1], [500, 5], [1000, 10], [5000, 50]]}, 'time': 1}
+                for path, config in value.items():
+                    if isinstance(config, Number):
+                        config = {'cost': config}
+                    elif not isinstance(config, dict):
+                        raise NotSupported(str(cls.id) + ' define_rest_api() API leafs must be lists of paths, or dicts of costs or cost configs by path')
+                    cls.define_rest_api_endpoint(method_name, key, path, paths, config)
             else:
                 cls.define_rest_api(value, method_name, paths + [key])
 
-    def throttle(self):
-        now = float(self.milliseconds())
-        elapsed = now - self.lastRestRequestTimestamp
-        if elapsed < self.rateLimit:
-            delay = self.rateLimit - elapsed
-            time.sleep(delay / 1000.0)
+    def define_shared_settings(self):
+        """Merges describe() over the class defaults once, instances get copy-on-write views of the result"""
+        cls = type(self)
+        settings = {}
+        for key, value in self.describe().items():
+            default = None
+            for klass in cls.__mro__:
+                if key in klass.__dict__ and not isinstance(klass.__dict__[key], SharedSetting):
+                    default = klass.__dict__[key]
+                    break
+            value = self.deep_extend(default, value) if isinstance(default, dict) else self.deep_extend(value)
+            setattr(cls, key, SharedSetting(key, value) if isinstance(value, (dict, list)) else value)
+            settings[key] = value
+        cls._shared_settings = settings
+
+    @staticmethod
+    def camelcase_alias(name):
+        if name[0] != '_' and name[-1] != '_' and '_' in name:
+            parts = name.split('_')
+            # fetch_ohlcv → fetchOHLCV (not fetchOhlcv!)
+            exceptions = {'ohlcv': 'OHLCV', 'le': 'LE', 'be': 'BE'}
+            return parts[0] + ''.join(exceptions.get(i, Exchange.capitalize(i)) for i in parts[1:])
+        return None
+
+    def define_camelcase_aliases(self):
+        """Convert all properties from underscore notation foo_bar to camelcase notation fooBar, once per class"""
+        cls = type(self)
+        attributes = {}
+        for name in dir(self):
+            camelcase = self.camelcase_alias(name)
+            if camelcase is None:
+                continue
+            static = inspect.getattr_static(cls, name, None)
+            if isinstance(static, (staticmethod, classmethod)):
+                setattr(cls, camelcase, static)
+            elif isinstance(getattr(self, name), types.MethodType):
+                setattr(cls, camelcase, getattr(cls, name))
+            elif camelcase not in cls.__dict__:
+                attributes[camelcase] = name
+        cls._camelcase_attributes = attributes
+
+    def init_rest_rate_limiter(self):
+        # a token bucket per instance, shared by all the threads using it
+        self.throttle = throttle(self.extend(self.tokenBucket, {'bucket': self.rate_limit_bucket(), 'rateLimit': self.rateLimit}))
+
+    def rate_limit_key(self):
+        """Instances with the same key share their budget, that of an api key or, without one, of the host ip"""
+        credential = self.hash(self.encode(self.apiKey), 'sha256')[0:16] if self.apiKey else 'ip'
+        return self.id + '-' + credential
+
+    def rate_limit_bucket(self):
+        """The token bucket shared with other processes if sharedRateLimit is set, None for one of its own"""
+        store = self.sharedRateLimit
+        if not store:
+            return None
+        if store is True:
+            store = FileBucketStore()
+        elif isinstance(store, dict):
+            store = FileBucketStore(**store)
+        return store.bucket(self.rate_limit_key(), self.tokenBucket)
+
+    def calculate_rate_limiter_cost(self, api, method, path, params):
+        """The cost of a request declared in the api map, None for the tokenBucket defaultCost"""
+        if not self._rest_api_costs:
+            return None
+        config = self._rest_api_costs.get((tuple(api) if isinstance(api, list) else api, method, path))
+        if config is None:
+            return None
+        if 'noSymbol' in config and (not params or params.get('symbol') is None):
+            return config['noSymbol']
+        by_limit = config.get('byLimit')
+        if by_limit and params and ('limit' in params):
+            limit = self.safe_float(params, 'limit')
+            if limit is not None:
+                for entry in by_limit:
+                    if limit <= entry[0]:
+                        return entry[1]
+                return by_limit[-1][1]
+        return config.get('cost')
+
+    def handle_rate_limit_headers(self, headers):
+        """Resyncs the token bucket with the budget reported by the response headers declared in rateLimitHeaders"""
+        bucket = getattr(self.throttle, 'bucket', None)
+        if not headers or bucket is None:
+            return
+        config = self.rateLimitHeaders or {}
+        retry_after = self.safe_float(headers, config.get('retryAfter'))
+        if retry_after is not None and retry_after > 0:
+            bucket.pause(retry_after)
+        remaining = self.safe_float(headers, config.get('remaining'))
+        if remaining is None:
+            used = self.safe_float(headers, config.get('used'))
+            limit = config.get('limit')
+            if used is None or limit is None:
+                return
+            remaining = limit - used
+        remaining = remaining / (config.get('weight') or 1)  # in tokens
+        now = self.milliseconds()
+        reset = self.safe_float(headers, config.get('reset'))
+        if reset is not None:
+            if reset > 1e12:  # a timestamp in milliseconds
+                reset = (reset - now) / 1000
+            elif reset > 1e9:  # a timestamp in seconds
+                reset = reset - now / 1000
+        elif config.get('window'):
+            window = config['window']
+            reset = (window - now % window) / 1000
+        bucket.resync(remaining, max(reset, 0) if reset is not None else None)
+
+    def throttle_priority(self, api, method, params):
+        """The lane of a request in the async throttle, the throttlePriority param or trading, account or market by api"""
+        priority = self.safe_string(params, 'throttlePriority')
+        if priority is not None:
+            return priority
+        name = '.'.join(api) if isinstance(api, list) else str(api)
+        if 'public' in name.lower():
+            return 'market'
+        return 'account' if method == 'GET' else 'trading'
 
     def fetch2(self, path, api='public', method='GET', params={}, headers=None, body=None):
         """A better wrapper over request for deferred signing"""
         if self.enableRateLimit:
-            self.throttle()
+            self.throttle(self.calculate_rate_limiter_cost(api, method, path, params), self.rateLimit)
+        if 'throttlePriority' in params:
+            params = self.omit(params, 'throttlePriority')
         self.lastRestRequestTimestamp = self.milliseconds()
         request = self.sign(path, api, method, params, headers, body)
         return self.fetch(request['url'], request['method'], request['headers'], request['body'])
@@ -541,93 +744,139 @@ class Exchange(object):
 
     def fetch(self, url, method='GET', headers=None, body=None):
         """Perform a HTTP request and return decoded JSON data"""
+        request = self.prepare_request(url, method, headers, body)
+        json_response = None
+        try:
+            response = self.get_transport().send(request)
+            if response.chunks is not None:
+                json_response = self.read_json_stream(response)
+        except BaseError as e:
+            raise self.wrap_transport_error(e) from e
+        return self.handle_rest_response(request, response, body, json_response)
+
+    def wrap_transport_error(self, e):
+        """The error of a transport with the exchange id in its message, as the ccxt error class it is or derives from"""
+        error_class = next(cls for cls in type(e).__mro__ if cls.__module__ == BaseError.__module__)
+        return error_class(' '.join(filter(None, [self.id, str(e)])))
+
+    def prepare_request(self, url, method='GET', headers=None, body=None):
+        """The Request object of a call, with the headers, proxy and settings of the instance"""
         request_headers = self.prepare_request_headers(headers)
         url = self.proxy + url
-
         if self.verbose:
             self.print("\nRequest:", method, url, request_headers, body)
         self.logger.debug("%s %s, Request: %s %s", method, url, request_headers, body)
+        stream = None
+        if self.streamingJson:
+            stream = self.streaming_json_config().get('threshold', 1048576)
+        return Request(method, url, request_headers, body.encode() if body else None, self.timeout / 1000, self.verify, self.proxies, stream)
 
-        request_body = body
-        if body:
-            body = body.encode()
+    def streaming_json_config(self):
+        return self.streamingJson if isinstance(self.streamingJson, dict) else {}
 
-        self.session.cookies.clear()
+    def json_stream_parser(self):
+        return JsonStreamParser(self.streaming_json_config().get('numericKeys', ('bids', 'asks')))
 
-        http_response = None
-        http_status_code = None
-        http_status_text = None
-        json_response = None
+    def read_json_stream(self, response):
+        """Parses the chunks of a streamed response as they are read, keeps the first kilobyte as its body"""
+        parser = self.json_stream_parser()
         try:
-            response = self.session.request(
-                method,
-                url,
-                data=body,
-                headers=request_headers,
-                timeout=int(self.timeout / 1000),
-                proxies=self.proxies,
-                verify=self.verify
-            )
-            # does not try to detect encoding
-            response.encoding = 'utf-8'
-            http_response = response.text
-            http_status_code = response.status_code
-            http_status_text = response.reason
-            json_response = self.parse_json(http_response)
-            headers = response.headers
-            # FIXME remove last_x_responses from subclasses
-            if self.enableLastHttpResponse:
-                self.last_http_response = http_response
-            if self.enableLastJsonResponse:
-                self.last_json_response = json_response
-            if self.enableLastResponseHeaders:
-                self.last_response_headers = headers
-            if self.verbose:
-                self.print("\nResponse:", method, url, http_status_code, headers, http_response)
-            self.logger.debug("%s %s, Response: %s %s %s", method, url, http_status_code, headers, http_response)
-            response.raise_for_status()
-
-        except Timeout as e:
-            details = ' '.join([self.id, method, url])
-            raise RequestTimeout(details) from e
-
-        except TooManyRedirects as e:
-            details = ' '.join([self.id, method, url])
-            raise ExchangeError(details) from e
-
-        except SSLError as e:
-            details = ' '.join([self.id, method, url])
-            raise ExchangeError(details) from e
-
-        except HTTPError as e:
-            details = ' '.join([self.id, method, url])
-            self.handle_errors(http_status_code, http_status_text, url, method, headers, http_response, json_response, request_headers, request_body)
-            self.handle_http_status_code(http_status_code, http_status_text, url, method, http_response)
-            raise ExchangeError(details) from e
-
-        except requestsConnectionError as e:
-            error_string = str(e)
-            details = ' '.join([self.id, method, url])
-            if 'Read timed out' in error_string:
-                raise RequestTimeout(details) from e
-            else:
-                raise NetworkError(details) from e
-
-        except RequestException as e:  # base exception class
-            error_string = str(e)
-            details = ' '.join([self.id, method, url])
-            if any(x in error_string for x in ['ECONNRESET', 'Connection aborted.', 'Connection broken:']):
-                raise NetworkError(details) from e
-            else:
-                raise ExchangeError(details) from e
-
-        self.handle_errors(http_status_code, http_status_text, url, method, headers, http_response, json_response, request_headers, request_body)
+            for chunk in response.chunks:
+                parser.feed(chunk)
+            return parser.close()
+        except ValueError:
+            return None
+        finally:
+            if hasattr(response.chunks, 'close'):
+                response.chunks.close()  # releases the connection of a document that did not parse
+            response.body = parser.head
+
+    def handle_rest_response(self, request, response, request_body=None, json_response=None):
+        """Bookkeeping and error handling common to all transports, returns the decoded response
+
+        A streamed response comes parsed already, its http_response is only the
+        first kilobyte of the body.
+        """
+        method = request.method
+        url = request.url
+        http_status_code = response.status
+        http_status_text = response.reason
+        headers = response.headers
+        # the codecs that read bytes parse the body as received, its text is only made if something reads it
+        binary = getattr(get_codec(self.jsonCodec), 'binary', False)
+        http_response = None if binary else response.text()
+        if response.chunks is None:
+            json_response = self.parse_json(response.body if binary else http_response)
+        if http_response is None and self.reads_response_text(http_status_code, json_response):
+            http_response = response.text()
+        if self.adaptiveRateLimit:
+            self.handle_rate_limit_headers(headers)
+        # FIXME remove last_x_responses from subclasses
+        if self.enableLastHttpResponse:
+            self.last_http_response = http_response
+        if self.enableLastJsonResponse:
+            self.last_json_response = json_response
+        if self.enableLastResponseHeaders:
+            self.last_response_headers = headers
+        else:
+            set_response_headers(self, headers)
+        if self.verbose:
+            self.print("\nResponse:", method, url, http_status_code, headers, http_response)
+        self.logger.debug("%s %s, Response: %s %s %s", method, url, http_status_code, headers, http_response)
+        self.handle_errors(http_status_code, http_status_text, url, method, headers, http_response, json_response, request.headers, request_body)
+        self.handle_http_status_code(http_status_code, http_status_text, url, method, http_response)
+        if http_status_code >= 400:
+            self.handle_unmapped_http_status_code(http_status_code, http_status_text, url, method)
         if json_response is not None:
             return json_response
         elif self.is_text_response(headers):
             return http_response
         else:
-            return response.content
+            return response.body
+
+    def reads_response_text(self, http_status_code, json_response):
+        """Whether the text of a response body is used, by last_http_response, the logs, the error handling or as the result of a non-JSON response"""
+        return (
+            json_response is None or
+            http_status_code >= 400 or
+            str(http_status_code) in self.httpExceptions or
+            self.enableLastHttpResponse or
+            self.verbose or
+            self.logger.isEnabledFor(logging.DEBUG) or
+            type(self).handle_errors is not Exchange.handle_errors
+        )
+
+    def get_transport(self):
+        """The transport property if set, else the default transport over the http client of the instance"""
+        if self.transport is not None:
+            return self.transport
+        client = self.open_http2_client() if self.http2 else self.session
+        transport = self.default_transport
+        if transport is None or transport.client is not client:
+            # rebuilt when the session is replaced
+            if self.http2:
+                from ccxt.base.http2 import Http2Transport  # only with the http2 option
+                transport = Http2Transport(client)
+            else:
+                transport = RequestsTransport(client)
+            self.default_transport = transport
+        return transport
+
+    def http2_config(self):
+        return self.http2 if isinstance(self.http2, dict) else {}
+
+    def http2_shared(self):
+        return bool(self.http2_config().get('shared'))
+
+    def open_http2_client(self):
+        if self.http2_client is None:
+            from ccxt.base.http2 import ThreadClients, shared_client  # only with the http2 option
+            config = self.http2_config()
+            if config.get('shared'):
+                self.http2_client = shared_client(config, self.verify, self.proxies)
+            else:
+                self.http2_client = ThreadClients(config, self.verify, self.proxies)
+        return self.http2_client
 
     def handle_http_status_code(self, http_status_code, http_status_text, url, method, body):
         string_code = str(http_status_code)
@@ -635,13 +884,24 @@ class Exchange(object):
             Exception = self.httpExceptions[string_code]
             raise Exception(' '.join([self.id, method, url, string_code, http_status_text, body]))
 
+    def handle_unmapped_http_status_code(self, http_status_code, http_status_text, url, method):
+        """An error status left by handle_errors() and httpExceptions, raised as requests' raise_for_status() did"""
+        raise ExchangeError(' '.join([self.id, method, url, str(http_status_code), http_status_text]))
+
     def parse_json(self, http_response):
         try:
-            if Exchange.is_json_encoded_object(http_response):
-                return json.loads(http_response)
+            if isinstance(http_response, bytes):
+                # raw response bodies are decoded without going through str first
+                if http_response[:1] in (b'{', b'['):
+                    return get_codec(self.jsonCodec).loads(http_response)
+            elif Exchange.is_json_encoded_object(http_response):
+                return get_codec(self.jsonCodec).loads(http_response)
         except ValueError:  # superclass of JsonDecodeError (python2)
             pass
 
+    def dump_json(self, data, params=None):
+        return get_codec(self.jsonCodec).dumps(data)
+
     def is_text_response(self, headers):
         # https://github.com/ccxt/ccxt/issues/5302
         content_type = headers.get('Content-Type', '')
@@ -660,43 +920,81 @@ class Exchange(object):
             return dictionary[key] is not None
         return False
 
+    # the safe_* accessors are the hot path of parsing, the dicts and lists of the responses are read
+    # inline, with a single lookup, the other containers go through key_exists() in safe_value()
+
     @staticmethod
     def safe_float(dictionary, key, default_value=None):
-        value = default_value
+        if type(dictionary) is dict and key is not None:
+            value = dictionary.get(key)
+        elif type(dictionary) is list and type(key) is int:
+            value = dictionary[key] if 0 <= key < len(dictionary) else None
+        else:
+            value = Exchange.safe_value(dictionary, key)
+        if value is None:
+            return default_value
         try:
-            if Exchange.key_exists(dictionary, key):
-                value = float(dictionary[key])
-        except ValueError as e:
-            value = default_value
-        return value
+            return float(value)
+        except ValueError:
+            return default_value
 
     @staticmethod
     def safe_string(dictionary, key, default_value=None):
-        return str(dictionary[key]) if Exchange.key_exists(dictionary, key) else default_value
+        if type(dictionary) is dict and key is not None:
+            value = dictionary.get(key)
+        elif type(dictionary) is list and type(key) is int:
+            value = dictionary[key] if 0 <= key < len(dictionary) else None
+        else:
+            value = Exchange.safe_value(dictionary, key)
+        return default_value if value is None else str(value)
 
     @staticmethod
     def safe_string_lower(dictionary, key, default_value=None):
-        return str(dictionary[key]).lower() if Exchange.key_exists(dictionary, key) else default_value
+        if type(dictionary) is dict and key is not None:
+            value = dictionary.get(key)
+        elif type(dictionary) is list and type(key) is int:
+            value = dictionary[key] if 0 <= key < len(dictionary) else None
+        else:
+            value = Exchange.safe_value(dictionary, key)
+        return default_value if value is None else str(value).lower()
 
     @staticmethod
     def safe_string_upper(dictionary, key, default_value=None):
-        return str(dictionary[key]).upper() if Exchange.key_exists(dictionary, key) else default_value
+        if type(dictionary) is dict and key is not None:
+            value = dictionary.get(key)
+        elif type(dictionary) is list and type(key) is int:
+            value = dictionary[key] if 0 <= key < len(dictionary) else None
+        else:
+            value = Exchange.safe_value(dictionary, key)
+        return default_value if value is None else str(value).upper()
 
     @staticmethod
     def safe_integer(dictionary, key, default_value=None):
-        if not Exchange.key_exists(dictionary, key):
+        if type(dictionary) is dict and key is not None:
+            value = dictionary.get(key)
+        elif type(dictionary) is list and type(key) is int:
+            value = dictionary[key] if 0 <= key < len(dictionary) else None
+        else:
+            value = Exchange.safe_value(dictionary, key)
+        if value is None:
             return default_value
-        value = dictionary[key]
+        if type(value) is int:
+            return value
         if isinstance(value, Number) or (isinstance(value, basestring) and value.isnumeric()):
             return int(value)
         return default_value
 
     @staticmethod
     def safe_integer_product(dictionary, key, factor, default_value=None):
-        if not Exchange.key_exists(dictionary, key):
+        if type(dictionary) is dict and key is not None:
+            value = dictionary.get(key)
+        elif type(dictionary) is list and type(key) is int:
+            value = dictionary[key] if 0 <= key < len(dictionary) else None
+        else:
+            value = Exchange.safe_value(dictionary, key)
+        if value is None:
             return default_value
-        value = dictionary[key]
-        if isinstance(value, Number):
+        if type(value) is int or type(value) is float or isinstance(value, Number):
             return int(value * factor)
         elif isinstance(value, basestring):
             try:
@@ -711,30 +1009,43 @@ class Exchange(object):
 
     @staticmethod
     def safe_value(dictionary, key, default_value=None):
-        return dictionary[key] if Exchange.key_exists(dictionary, key) else default_value
+        if type(dictionary) is dict:
+            value = dictionary.get(key) if key is not None else None
+        elif type(dictionary) is list and type(key) is int:
+            value = dictionary[key] if 0 <= key < len(dictionary) else None
+        elif Exchange.key_exists(dictionary, key):
+            return dictionary[key]
+        else:
+            return default_value
+        return default_value if value is None else value
 
     # we're not using safe_floats with a list argument as we're trying to save some cycles here
     # we're not using safe_float_3 either because those cases are too rare to deserve their own optimization
 
     @staticmethod
     def safe_float_2(dictionary, key1, key2, default_value=None):
-        return Exchange.safe_either(Exchange.safe_float, dictionary, key1, key2, default_value)
+        value = Exchange.safe_float(dictionary, key1)
+        return value if value is not None else Exchange.safe_float(dictionary, key2, default_value)
 
     @staticmethod
     def safe_string_2(dictionary, key1, key2, default_value=None):
-        return Exchange.safe_either(Exchange.safe_string, dictionary, key1, key2, default_value)
+        value = Exchange.safe_string(dictionary, key1)
+        return value if value is not None else Exchange.safe_string(dictionary, key2, default_value)
 
     @staticmethod
     def safe_string_lower_2(dictionary, key1, key2, default_value=None):
-        return Exchange.safe_either(Exchange.safe_string_lower, dictionary, key1, key2, default_value)
+        value = Exchange.safe_string_lower(dictionary, key1)
+        return value if value is not None else Exchange.safe_string_lower(dictionary, key2, default_value)
 
     @staticmethod
     def safe_string_upper_2(dictionary, key1, key2, default_value=None):
-        return Exchange.safe_either(Exchange.safe_string_upper, dictionary, key1, key2, default_value)
+        value = Exchange.safe_string_upper(dictionary, key1)
+        return value if value is not None else Exchange.safe_string_upper(dictionary, key2, default_value)
 
     @staticmethod
     def safe_integer_2(dictionary, key1, key2, default_value=None):
-        return Exchange.safe_either(Exchange.safe_integer, dictionary, key1, key2, default_value)
+        value = Exchange.safe_integer(dictionary, key1)
+        return value if value is not None else Exchange.safe_integer(dictionary, key2, default_value)
 
     @staticmethod
     def safe_integer_product_2(dictionary, key1, key2, factor, default_value=None):
@@ -747,7 +1058,8 @@ class Exchange(object):
 
     @staticmethod
     def safe_value_2(dictionary, key1, key2, default_value=None):
-        return Exchange.safe_either(Exchange.safe_value, dictionary, key1, key2, default_value)
+        value = Exchange.safe_value(dictionary, key1)
+        return value if value is not None else Exchange.safe_value(dictionary, key2, default_value)
 
     @staticmethod
     def safe_either(method, dictionary, key1, key2, default_value=None):
@@ -815,7 +1127,7 @@ class Exchange(object):
     def deep_extend(*args):
         result = None
         for arg in args:
-            if isinstance(arg, dict):
+            if isinstance(arg, (dict, Record)):
                 if not isinstance(result, dict):
                     result = {}
                 for key in arg:
@@ -851,7 +1163,7 @@ class Exchange(object):
     @staticmethod
     def index_by(array, key):
         result = {}
-        if type(array) is dict:
+        if isinstance(array, dict):
             array = Exchange.keysort(array).values()
         is_int_key = isinstance(key, int)
         for element in array:
@@ -862,6 +1174,8 @@ class Exchange(object):
 
     @staticmethod
     def sort_by(array, key, descending=False):
+        if isinstance(array, NumericBookSide):
+            return array.sorted(key, descending)
         return sorted(array, key=lambda k: k[key] if k[key] is not None else "", reverse=descending)
 
     @staticmethod
@@ -909,8 +1223,8 @@ class Exchange(object):
 
     @staticmethod
     def omit(d, *args):
-        if isinstance(d, dict):
-            result = d.copy()
+        if isinstance(d, (dict, Record)):
+            result = dict(d) if isinstance(d, Record) else d.copy()
             for arg in args:
                 if type(arg) is list:
                     for key in arg:
@@ -944,6 +1258,8 @@ class Exchange(object):
 
     @staticmethod
     def aggregate(bidasks):
+        if isinstance(bidasks, NumericBookSide):
+            return bidasks.aggregate()
         ordered = Exchange.ordered({})
         for [price, volume, *_] in bidasks:
             if volume > 0:
@@ -980,18 +1296,7 @@ class Exchange(object):
 
     @staticmethod
     def iso8601(timestamp=None):
-        if timestamp is None:
-            return timestamp
-        if not isinstance(timestamp, (int, long)):
-            return None
-        if int(timestamp) < 0:
-            return None
-
-        try:
-            utc = datetime.datetime.utcfromtimestamp(timestamp // 1000)
-            return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + "{:03d}".format(int(timestamp) % 1000) + 'Z'
-        except (TypeError, OverflowError, OSError):
-            return None
+        return format_iso8601(timestamp)
 
     @staticmethod
     def rfc2616(self, timestamp=None):
@@ -1035,36 +1340,7 @@ class Exchange(object):
 
     @staticmethod
     def parse8601(timestamp=None):
-        if timestamp is None:
-            return timestamp
-        yyyy = '([0-9]{4})-?'
-        mm = '([0-9]{2})-?'
-        dd = '([0-9]{2})(?:T|[\\s])?'
-        h = '([0-9]{2}):?'
-        m = '([0-9]{2}):?'
-        s = '([0-9]{2})'
-        ms = '(\\.[0-9]{1,3})?'
-        tz = '(?:(\\+|\\-)([0-9]{2})\\:?([0-9]{2})|Z)?'
-        regex = r'' + yyyy + mm + dd + h + m + s + ms + tz
-        try:
-            match = re.search(regex, timestamp, re.IGNORECASE)
-            if match is None:
-                return None
-            yyyy, mm, dd, h, m, s, ms, sign, hours, minutes = match.groups()
-            ms = ms or '.000'
-            ms = (ms + '00')[0:4]
-            msint = int(ms[1:])
-            sign = sign or ''
-            sign = int(sign + '1') * -1
-            hours = int(hours or 0) * sign
-            minutes = int(minutes or 0) * sign
-            offset = datetime.timedelta(hours=hours, minutes=minutes)
-            string = yyyy + mm + dd + h + m + s + ms + 'Z'
-            dt = datetime.datetime.strptime(string, "%Y%m%d%H%M%S.%fZ")
-            dt = dt + offset
-            return calendar.timegm(dt.utctimetuple()) * 1000 + msint
-        except (TypeError, OverflowError, OSError, ValueError):
-            return None
+        return parse_iso8601(timestamp)
 
     @staticmethod
     def hash(request, algorithm='md5', digest='hex'):
@@ -1212,7 +1488,7 @@ class Exchange(object):
 
     @staticmethod
     def json(data, params=None):
-        return json.dumps(data, separators=(',', ':'))
+        return json.dumps(data, separators=(',', ':'), default=plain_json)
 
     @staticmethod
     def is_json_encoded_object(input):
@@ -1230,7 +1506,7 @@ class Exchange(object):
 
     @staticmethod
     def to_array(value):
-        return list(value.values()) if type(value) is dict else value
+        return list(value.values()) if isinstance(value, dict) else value
 
     def nonce(self):
         return Exchange.seconds()
@@ -1294,7 +1570,7 @@ class Exchange(object):
         return self.decimal_to_precision(fee, ROUND, self.currencies[currency]['precision'], self.precisionMode, self.paddingMode)
 
     def set_markets(self, markets, currencies=None):
-        values = list(markets.values()) if type(markets) is dict else markets
+        values = list(markets.values()) if isinstance(markets, dict) else markets
         for i in range(0, len(values)):
             values[i] = self.extend(
                 self.fees['trading'],
@@ -1336,19 +1612,82 @@ class Exchange(object):
             currencies = self.sort_by(base_currencies + quote_currencies, 'code')
             self.currencies = self.deep_extend(self.index_by(currencies, 'code'), self.currencies)
         self.currencies_by_id = self.index_by(list(self.currencies.values()), 'id')
+        self.on_markets_loaded(values)
         return self.markets
 
+    def on_markets_loaded(self, markets):
+        """Rebuilds the state an exchange derives from its list of markets, also for markets shared by another instance or read from the markets cache"""
+        pass
+
+    def market_store_key(self):
+        api_type = self.safe_string(self.options, 'defaultType')
+        urls = self.json(self.urls['api']) if self.urls and ('api' in self.urls) else None
+        return (self.id, api_type, urls)
+
+    def load_shared_markets(self):
+        """Attaches to markets already loaded by another instance, returns None if there are none"""
+        snapshot = market_store.attach(self.market_store_key(), self)
+        return self.markets if snapshot is not None else None
+
+    def set_shared_markets(self, markets, currencies=None):
+        self.set_markets(markets, currencies)
+        if self.shareMarkets:
+            market_store.publish(self.market_store_key(), self)
+        return self.markets
+
+    def get_markets_cache(self):
+        if not self.marketsCache:
+            return None
+        if isinstance(self.marketsCache, dict):
+            return FileMarketsCache(**self.marketsCache)
+        return self.marketsCache
+
+    def markets_cache_key(self):
+        return {
+            'id': self.id,
+            'sandbox': bool(self.urls) and ('api_backup' in self.urls),
+            'api': self.urls.get('api') if self.urls else None,
+            # not the whole options, they hold runtime state too (nonces, time differences, tokens)
+            'options': {key: self.options[key] for key in self.marketsCacheOptions if key in self.options},
+        }
+
+    def load_cached_markets(self, params={}):
+        """Returns a (markets, currencies) tuple from the markets cache, or None if nothing fresh is cached"""
+        cache = self.get_markets_cache()
+        if cache is None or params:
+            return None
+        return cache.load(self.markets_cache_key())
+
+    def save_cached_markets(self, markets, currencies=None, params={}):
+        cache = self.get_markets_cache()
+        if cache is None or params:
+            return
+        try:
+            cache.save(self.markets_cache_key(), markets, currencies)
+        except (OSError, TypeError, ValueError) as e:
+            if self.verbose:
+                self.print('Failed to save the markets cache of', self.id, e)
+
     def load_markets(self, reload=False, params={}):
         if not reload:
             if self.markets:
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            if self.shareMarkets:
+                markets = self.load_shared_markets()
+                if markets is not None:
+                    return markets
+            cached = self.load_cached_markets(params)
+            if cached is not None:
+                return self.set_shared_markets(*cached)
         currencies = None
         if self.has['fetchCurrencies']:
             currencies = self.fetch_currencies()
         markets = self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        # set_markets() extends the market structures in place, store them as fetched
+        self.save_cached_markets(markets, currencies, params)
+        return self.set_shared_markets(markets, currencies)
 
     def load_accounts(self, reload=False, params={}):
         if reload:
@@ -1453,6 +1792,8 @@ class Exchange(object):
         return ohlcv[0:6] if isinstance(ohlcv, list) else ohlcv
 
     def parse_ohlcvs(self, ohlcvs, market=None, timeframe='1m', since=None, limit=None):
+        if self.ohlcvFormat != 'list':
+            return self.parse_columnar_ohlcvs(ohlcvs, market, timeframe, since, limit)
         ohlcvs = self.to_array(ohlcvs)
         num_ohlcvs = len(ohlcvs)
         result = []
@@ -1467,24 +1808,85 @@ class Exchange(object):
             result.append(ohlcv)
         return self.sort_by(result, 0)
 
+    def parse_columnar_ohlcvs(self, ohlcvs, market=None, timeframe='1m', since=None, limit=None):
+        """parse_ohlcvs() into OHLCVColumns, converting whole columns when the rows are lists of one layout"""
+        vectorized = self.ohlcvFormat == 'numpy'
+        rows = self.to_array(ohlcvs)
+        indexes = self.ohlcv_indexes(rows, market)
+        if indexes is None:
+            # rows of another kind, or a parse_ohlcv() that does more than pick and convert the fields
+            candles = []
+            for row in rows:
+                if limit and (len(candles) >= limit):
+                    break
+                candle = self.parse_ohlcv(row, market)
+                if since and (candle[0] < since):
+                    continue
+                candles.append(candle)
+            return OHLCVColumns.from_candles(candles, vectorized)
+        return OHLCVColumns.from_rows(rows, indexes, since, limit, vectorized)
+
+    def ohlcv_indexes(self, rows, market=None):
+        """The positions of the six fields in the raw rows, None when the columns cannot be converted as a whole"""
+        if not rows or set(map(type, rows)) != {list} or len(set(map(len, rows))) != 1:
+            return None
+        if self.ohlcvColumns is not None:
+            return self.ohlcvColumns
+        if type(self).parse_ohlcv is Exchange.parse_ohlcv:
+            return [0, 1, 2, 3, 4, 5] if len(rows[0]) >= 6 else None
+        # parse_ohlcv() is compared with the converted fields of a few rows across the response
+        count = len(rows)
+        probes = [rows[i] for i in sorted(set([(count - 1) * i // 15 for i in range(16)]))]
+        candles = [self.parse_ohlcv(row, market) for row in probes]
+        if any(not isinstance(candle, list) or len(candle) < 6 for candle in candles):
+            return None
+        return infer_ohlcv_indexes(probes, candles)
+
     def parse_bid_ask(self, bidask, price_key=0, amount_key=0):
         return [float(bidask[price_key]), float(bidask[amount_key])]
 
     def parse_bids_asks(self, bidasks, price_key=0, amount_key=1):
+        if self.orderBookFormat != 'list':
+            return self.parse_numeric_bids_asks(bidasks, price_key, amount_key)
         result = []
         if len(bidasks):
             if type(bidasks[0]) is list:
                 for bidask in bidasks:
-                    if bidask[price_key] and bidask[amount_key]:
+                    if bidask[price_key] and bidask[amount_key] is not None:
                         result.append(self.parse_bid_ask(bidask, price_key, amount_key))
             elif type(bidasks[0]) is dict:
                 for bidask in bidasks:
-                    if (price_key in bidask) and (amount_key in bidask) and (bidask[price_key] and bidask[amount_key]):
+                    if (price_key in bidask) and (amount_key in bidask) and (bidask[price_key] and bidask[amount_key] is not None):
                         result.append(self.parse_bid_ask(bidask, price_key, amount_key))
             else:
                 raise ExchangeError('unrecognized bidask format: ' + str(bidasks[0]))
         return result
 
+    def parse_numeric_bids_asks(self, bidasks, price_key=0, amount_key=1):
+        """parse_bids_asks() into the two arrays of a NumericBookSide, without a list per level"""
+        prices = array.array('d')
+        amounts = array.array('d')
+        if len(bidasks):
+            rows = type(bidasks[0])
+            if rows is not list and rows is not dict:
+                raise ExchangeError('unrecognized bidask format: ' + str(bidasks[0]))
+            # the parse_bid_ask() of an exchange of its own is used, only its price and amount are kept
+            parse_bid_ask = self.parse_bid_ask if type(self).parse_bid_ask is not Exchange.parse_bid_ask else None
+            add_price = prices.append
+            add_amount = amounts.append
+            for bidask in bidasks:
+                if rows is dict and not ((price_key in bidask) and (amount_key in bidask)):
+                    continue
+                if bidask[price_key] and bidask[amount_key] is not None:
+                    if parse_bid_ask is None:
+                        add_price(float(bidask[price_key]))
+                        add_amount(float(bidask[amount_key]))
+                    else:
+                        pair = parse_bid_ask(bidask, price_key, amount_key)
+                        add_price(pair[0])
+                        add_amount(pair[1])
+        return NumericBookSide(prices, amounts, self.orderBookFormat == 'numpy')
+
     def fetch_l2_order_book(self, symbol, limit=None, params={}):
         orderbook = self.fetch_order_book(symbol, limit, params)
         return self.extend(orderbook, {
@@ -1493,9 +1895,15 @@ class Exchange(object):
         })
 
     def parse_order_book(self, orderbook, timestamp=None, bids_key='bids', asks_key='asks', price_key=0, amount_key=1):
+        bids = self.parse_bids_asks(orderbook[bids_key], price_key, amount_key) if (bids_key in orderbook) and isinstance(orderbook[bids_key], list) else []
+        asks = self.parse_bids_asks(orderbook[asks_key], price_key, amount_key) if (asks_key in orderbook) and isinstance(orderbook[asks_key], list) else []
+        if self.orderBookFormat != 'list':
+            # the parse_bids_asks() of some exchanges returns lists
+            bids = bids if isinstance(bids, NumericBookSide) else NumericBookSide.from_pairs(bids, self.orderBookFormat == 'numpy')
+            asks = asks if isinstance(asks, NumericBookSide) else NumericBookSide.from_pairs(asks, self.orderBookFormat == 'numpy')
         return {
-            'bids': self.sort_by(self.parse_bids_asks(orderbook[bids_key], price_key, amount_key) if (bids_key in orderbook) and isinstance(orderbook[bids_key], list) else [], 0, True),
-            'asks': self.sort_by(self.parse_bids_asks(orderbook[asks_key], price_key, amount_key) if (asks_key in orderbook) and isinstance(orderbook[asks_key], list) else [], 0),
+            'bids': self.sort_by(bids, 0, True),
+            'asks': self.sort_by(asks, 0),
             'timestamp': timestamp,
             'datetime': self.iso8601(timestamp) if timestamp is not None else None,
             'nonce': None,
@@ -1678,7 +2086,8 @@ class Exchange(object):
 
     def parse_trades(self, trades, market=None, since=None, limit=None, params={}):
         array = self.to_array(trades)
-        array = [self.extend(self.parse_trade(trade, market), params) for trade in array]
+        extend = self.trade_record if self.structureRecords else self.lazy_structure if self.lazyStructures else self.extend
+        array = [extend(self.parse_trade(trade, market), params) for trade in array]
         array = self.sort_by(array, 'timestamp')
         symbol = market['symbol'] if market else None
         return self.filter_by_symbol_since_limit(array, symbol, since, limit)
@@ -1686,33 +2095,63 @@ class Exchange(object):
     def parse_ledger(self, data, currency=None, since=None, limit=None, params={}):
         array = self.to_array(data)
         result = []
+        extend = self.lazy_structure if self.lazyStructures else self.extend
         for item in array:
             entry = self.parse_ledger_entry(item, currency)
             if isinstance(entry, list):
-                result += [self.extend(i, params) for i in entry]
+                result += [extend(i, params) for i in entry]
             else:
-                result.append(self.extend(entry, params))
+                result.append(extend(entry, params))
         result = self.sort_by(result, 'timestamp')
         code = currency['code'] if currency else None
         return self.filter_by_currency_since_limit(result, code, since, limit)
 
     def parse_transactions(self, transactions, currency=None, since=None, limit=None, params={}):
         array = self.to_array(transactions)
-        array = [self.extend(self.parse_transaction(transaction, currency), params) for transaction in array]
+        extend = self.lazy_structure if self.lazyStructures else self.extend
+        array = [extend(self.parse_transaction(transaction, currency), params) for transaction in array]
         array = self.sort_by(array, 'timestamp')
         code = currency['code'] if currency else None
         return self.filter_by_currency_since_limit(array, code, since, limit)
 
     def parse_orders(self, orders, market=None, since=None, limit=None, params={}):
         array = []
+        extend = self.order_record if self.structureRecords else self.lazy_structure if self.lazyStructures else self.extend
         if isinstance(orders, list):
-            array = [self.extend(self.parse_order(order, market), params) for order in orders]
+            array = [extend(self.parse_order(order, market), params) for order in orders]
         else:
-            array = [self.extend(self.parse_order(self.extend({'id': id}, order), market), params) for id, order in orders.items()]
+            array = [extend(self.parse_order(self.extend({'id': id}, order), market), params) for id, order in orders.items()]
         array = self.sort_by(array, 'timestamp')
         symbol = market['symbol'] if market else None
         return self.filter_by_symbol_since_limit(array, symbol, since, limit)
 
+    def lazy_structure(self, structure, params={}):
+        """extend() of a parsed structure and the params into a LazyStructure, as parse_trades() and the others do with lazyStructures"""
+        result = LazyStructure(structure)
+        # the 'datetime' of the timestamp is formatted again when it is read, one the exchange gave in another form is kept
+        if 'datetime' not in structure or structure['datetime'] == format_iso8601(structure.get('timestamp')):
+            result.pop('datetime', None)
+        if params:
+            result.update(params)
+        if isinstance(self.lazyStructures, dict) and not self.lazyStructures.get('info', True):
+            result['info'] = None
+        return result
+
+    def trade_record(self, trade, params={}):
+        return self.structure_record(Trade, trade, params)
+
+    def order_record(self, order, params={}):
+        return self.structure_record(Order, order, params)
+
+    def structure_record(self, record, structure, params={}):
+        """extend() of a parsed structure and the params into a record, as parse_trades() and parse_orders() do with structureRecords"""
+        result = record.from_dict(structure)  # without the 'datetime' of the timestamp, formatted again when it is read
+        for key in params:
+            result[key] = params[key]
+        if isinstance(self.structureRecords, dict) and not self.structureRecords.get('info', True):
+            result['info'] = None
+        return result
+
     def safe_market(self, marketId, market=None, delimiter=None):
         if marketId is not None:
             if self.markets_by_id is not None and marketId in self.markets_by_id:
@@ -1822,7 +2261,7 @@ class Exchange(object):
 
     def market_id(self, symbol):
         market = self.market(symbol)
-        return market['id'] if type(market) is dict else symbol
+        return market['id'] if isinstance(market, dict) else symbol
 
     def calculate_fee(self, symbol, type, side, amount, price, takerOrMaker='taker', params={}):
         market = self.markets[symbol]
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+
+"""httpx clients sending the requests of an exchange over HTTP/2, the concurrent requests of an event loop share one connection"""
+
+# -----------------------------------------------------------------------------
+
+import threading
+import weakref
+
+from ccxt.base.errors import ExchangeError
+from ccxt.base.errors import ExchangeNotAvailable
+from ccxt.base.errors import NetworkError
+from ccxt.base.errors import NotSupported
+from ccxt.base.errors import RequestTimeout
+from ccxt.base.transport import CHUNK_SIZE, Response, Transport, streams
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'AsyncHttp2Transport',
+    'Http2Transport',
+    'ThreadClients',
+    'acquire_async_client',
+    'close_shared_clients',
+    'create_async_client',
+    'create_client',
+    'release_async_client',
+]
+
+# -----------------------------------------------------------------------------
+
+httpx = None  # imported with the first client, import ccxt does not pay for an opt-in transport
+
+
+def require_httpx():
+    global httpx
+    if httpx is None:
+        try:
+            import httpx as module
+            import h2  # noqa: F401, httpx negotiates HTTP/2 only with h2 installed
+        except ImportError:
+            raise NotSupported('the http2 option requires httpx and h2, pip install httpx[http2]')
+        httpx = module
+    return httpx
+
+
+def limits(config):
+    return httpx.Limits(
+        max_connections=config.get('maxConnections', 100),  # per client, each HTTP/2 connection carries many requests
+        max_keepalive_connections=config.get('maxKeepaliveConnections', 20),
+        keepalive_expiry=config.get('keepaliveExpiry', 15),  # seconds an idle connection is kept
+    )
+
+
+def client_key(config, verify, proxies):
+    return (
+        verify,
+        tuple(sorted((proxies or {}).items())),
+        config.get('maxConnections', 100),
+        config.get('maxKeepaliveConnections', 20),
+        config.get('keepaliveExpiry', 15),
+    )
+
+
+def create_client(config, verify=True, proxies=None):
+    """A synchronous HTTP/2 client configured by the http2 config of an exchange, proxies as in requests"""
+    require_httpx()
+    mounts = None
+    if proxies:
+        # {'https': 'http://proxy:3128'} → a transport through the proxy per scheme
+        mounts = dict((scheme + '://', httpx.HTTPTransport(http2=True, verify=verify, limits=limits(config), proxy=proxy)) for scheme, proxy in proxies.items())
+    return httpx.Client(http2=True, verify=verify, limits=limits(config), mounts=mounts, follow_redirects=True)
+
+
+class ThreadClients(object):
+    """The synchronous clients of an exchange, one per thread
+
+    httpcore does not number the HTTP/2 streams of a connection under a lock,
+    streams opened by two threads at once can reach the server out of order,
+    which then drops the connection. Each thread has a client and connection
+    of its own, reused by its next requests.
+    """
+
+    def __init__(self, config, verify=True, proxies=None):
+        require_httpx()
+        self.config = config
+        self.verify = verify
+        self.proxies = proxies
+        self.local = threading.local()
+        self.clients = weakref.WeakSet()  # the client of a thread that ended goes away with it
+        self.lock = threading.Lock()
+        self.is_closed = False
+
+    def get(self):
+        client = getattr(self.local, 'client', None)
+        if client is None or client.is_closed:
+            client = create_client(self.config, self.verify, self.proxies)
+            self.local.client = client
+            with self.lock:
+                self.clients.add(client)
+                self.is_closed = False
+        return client
+
+    def close(self):
+        with self.lock:
+            clients = list(self.clients)
+            self.clients.clear()
+            self.is_closed = True
+        for client in clients:
+            client.close()
+
+
+lock = threading.Lock()
+shared_clients = {}
+
+
+def shared_client(config, verify=True, proxies=None):
+    """Returns the clients of all the synchronous instances with the same settings"""
+    key = client_key(config, verify, proxies)
+    with lock:
+        clients = shared_clients.get(key)
+        if clients is None:
+            clients = ThreadClients(config, verify, proxies)
+            shared_clients[key] = clients
+        return clients
+
+
+def close_shared_clients():
+    """Closes the connections of the shared synchronous clients, new clients are made on demand"""
+    with lock:
+        clients = list(shared_clients.values())
+        shared_clients.clear()
+    for client in clients:
+        client.close()
+
+
+def create_async_client(config, verify=True, proxy=None):
+    """An asynchronous HTTP/2 client configured by the http2 config of an exchange, with a single proxy url as in aiohttp"""
+    require_httpx()
+    return httpx.AsyncClient(http2=True, verify=verify, limits=limits(config), proxy=proxy, follow_redirects=True)
+
+
+class SharedClient(object):
+
+    __slots__ = ('client', 'references')
+
+    def __init__(self, client):
+        self.client = client
+        self.references = 0
+
+
+# event loop → {settings: SharedClient}, an async client is bound to the loop it was first used on
+registry = weakref.WeakKeyDictionary()
+
+
+def acquire_async_client(config, verify, proxy, loop):
+    """Returns the client shared by the instances of a loop with the same settings, references it once more"""
+    clients = registry.setdefault(loop, {})
+    key = client_key(config, verify, {'proxy': proxy} if proxy else None)
+    shared = clients.get(key)
+    if shared is None or shared.client.is_closed:
+        shared = SharedClient(create_async_client(config, verify, proxy))
+        clients[key] = shared
+    shared.references += 1
+    return shared.client
+
+
+async def release_async_client(client, loop):
+    """Drops a reference to a shared client, closes it with the last one"""
+    clients = registry.get(loop, {})
+    for key, shared in list(clients.items()):
+        if shared.client is client:
+            shared.references -= 1
+            if shared.references <= 0:
+                del clients[key]
+                await client.aclose()
+            return
+
+
+def transport_error(e, details):
+    """The ccxt exception for an httpx exception"""
+    if isinstance(e, httpx.TimeoutException):
+        return RequestTimeout(details)
+    if isinstance(e, httpx.ConnectError):  # dns, refused connections and failed handshakes
+        return ExchangeNotAvailable(details)
+    if isinstance(e, httpx.TransportError):  # connections reset or closed by the server
+        return NetworkError(details)
+    return ExchangeError(details)  # too many redirects and the other errors
+
+
+class Http2Transport(Transport):
+    """The transport of the synchronous Exchange with the http2 option, over the client of the calling thread"""
+
+    def __init__(self, clients):
+        require_httpx()
+        self.client = clients  # ThreadClients
+
+    def send(self, request):
+        details = request.method + ' ' + request.url
+        client = self.client.get()
+        client.cookies.clear()
+        try:
+            response = client.send(client.build_request(request.method, request.url, content=request.body, headers=request.headers, timeout=request.timeout), stream=True)
+            if streams(request, response.status_code, response.headers):
+                return Response(response.status_code, response.reason_phrase, response.headers, None, self.chunks(response, details))
+            try:
+                content = response.read()
+            finally:
+                response.close()
+        except httpx.HTTPError as e:
+            raise transport_error(e, details) from e
+        return Response(response.status_code, response.reason_phrase, response.headers, content)
+
+    def chunks(self, response, details):
+        try:
+            for chunk in response.iter_bytes(CHUNK_SIZE):
+                yield chunk
+        except httpx.HTTPError as e:
+            raise transport_error(e, details) from e
+        finally:
+            response.close()
+
+    def close(self):
+        self.client.close()
+
+
+class AsyncHttp2Transport(Transport):
+    """The transport of the async Exchange with the http2 option, its concurrent requests share the connections of one client"""
+
+    def __init__(self, client):
+        require_httpx()
+        self.client = client
+
+    async def send(self, request):
+        details = request.method + ' ' + request.url
+        self.client.cookies.clear()
+        try:
+            response = await self.client.send(self.client.build_request(request.method, request.url, content=request.body, headers=request.headers, timeout=request.timeout), stream=True)
+            if streams(request, response.status_code, response.headers):
+                return Response(response.status_code, response.reason_phrase, response.headers, None, self.chunks(response, details))
+            try:
+                content = await response.aread()
+            finally:
+                await response.aclose()
+        except httpx.HTTPError as e:
+            raise transport_error(e, details) from e
+        return Response(response.status_code, response.reason_phrase, response.headers, content)
+
+    async def chunks(self, response, details):
+        try:
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                yield chunk
+        except httpx.HTTPError as e:
+            raise transport_error(e, details) from e
+        finally:
+            await response.aclose()
+
+    async def close(self):
+        await self.client.aclose()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""ISO 8601 parsing and formatting of the timestamps in milliseconds, for Exchange.parse8601() and Exchange.iso8601()"""
+
+# -----------------------------------------------------------------------------
+
+import datetime
+import re
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'format_iso8601',
+    'parse_iso8601',
+]
+
+# -----------------------------------------------------------------------------
+
+PATTERN = re.compile(
+    r'([0-9]{4})-?([0-9]{2})-?([0-9]{2})(?:T|[\s])?'
+    r'([0-9]{2}):?([0-9]{2}):?([0-9]{2})(\.[0-9]{1,3})?'
+    r'(?:(\+|\-)([0-9]{2})\:?([0-9]{2})|Z)?', re.IGNORECASE)
+
+DIGITS = re.compile(r'[0-9]+\Z').match  # ASCII digits only, str.isdigit() takes other scripts and str.isascii() is Python 3.7+
+
+EPOCH = datetime.date(1970, 1, 1).toordinal()
+DAY = 86400000
+MIN = (datetime.date.min.toordinal() - EPOCH) * DAY  # the range of datetime, out of it the timestamps were None
+MAX = (datetime.date.max.toordinal() - EPOCH + 1) * DAY - 1
+LAST = 253402300800000  # 10000-01-01, later timestamps are left to datetime, which raises
+
+# the days seen, by their year, month and day digits when parsed and their number since the epoch when formatted, cleared when full
+days = {}
+dates = {}
+minutes = {}  # the timestamps of the 'YYYY-MM-DDTHH:MM:' prefixes parsed
+CACHE_SIZE = 10000
+
+# the last second formatted and its 'YYYY-MM-DDTHH:MM:SS.' prefix, a single tuple to be read and replaced at once
+last_second = (None, None)
+
+
+def day_timestamp(year, month, day):
+    """The timestamp of the start of a day, ValueError for a day that does not exist"""
+    key = (year, month, day)
+    timestamp = days.get(key)
+    if timestamp is None:
+        timestamp = (datetime.date(int(year), int(month), int(day)).toordinal() - EPOCH) * DAY
+        if len(days) >= CACHE_SIZE:
+            days.clear()
+        days[key] = timestamp
+    return timestamp
+
+
+def minute_timestamp(timestamp):
+    """The timestamp of the 'YYYY-MM-DDTHH:MM:' prefix, None when it has another layout or does not exist"""
+    if timestamp[4] != '-' or timestamp[7] != '-' or timestamp[10] not in 'Tt' or timestamp[13] != ':' or timestamp[16] != ':':
+        return None
+    digits = timestamp[0:4] + timestamp[5:7] + timestamp[8:10] + timestamp[11:13] + timestamp[14:16]
+    if not DIGITS(digits):
+        return None
+    h = int(digits[8:10])
+    m = int(digits[10:12])
+    if h > 23 or m > 59:
+        return None
+    try:
+        result = day_timestamp(digits[0:4], digits[4:6], digits[6:8]) + h * 3600000 + m * 60000
+    except ValueError:
+        return None
+    if len(minutes) >= CACHE_SIZE:
+        minutes.clear()
+    minutes[timestamp[:17]] = result
+    return result
+
+
+def parse_iso8601(timestamp):
+    """Exchange.parse8601(), the same results for any input"""
+    if timestamp is None:
+        return timestamp
+    try:
+        # YYYY-MM-DDTHH:MM:SS.mmmZ and YYYY-MM-DDTHH:MM:SSZ, the layouts of most exchanges, by their minute
+        length = len(timestamp)
+        if length == 24 or length == 20:
+            minute = minutes.get(timestamp[:17])
+            if minute is None:
+                minute = minute_timestamp(timestamp)
+            if minute is not None and timestamp[-1] in 'Zz':
+                if length == 24:
+                    seconds = timestamp[17:19] + timestamp[20:23] if timestamp[19] == '.' else ''
+                else:
+                    seconds = timestamp[17:19]
+                if DIGITS(seconds):
+                    milliseconds = int(seconds) if length == 24 else int(seconds) * 1000
+                    return minute + milliseconds if milliseconds < 60000 else None
+        match = PATTERN.search(timestamp)
+        if match is None:
+            return None
+        yyyy, mm, dd, h, m, s, ms, sign, offset_hours, offset_minutes = match.groups()
+        h = int(h)
+        m = int(m)
+        s = int(s)
+        if h > 23 or m > 59 or s > 59:
+            return None
+        ms = int((ms + '00')[1:4]) if ms else 0
+        result = day_timestamp(yyyy, mm, dd) + h * 3600000 + m * 60000 + s * 1000 + ms
+        if sign:
+            offset = int(offset_hours) * 3600000 + int(offset_minutes) * 60000
+            result = result - offset if sign == '+' else result + offset
+            if result < MIN or result > MAX:
+                return None
+        return result
+    except (TypeError, OverflowError, OSError, ValueError):
+        return None
+
+
+def format_iso8601(timestamp):
+    """Exchange.iso8601(), the same results for any input"""
+    global last_second
+    if timestamp is None:
+        return timestamp
+    if not isinstance(timestamp, int):
+        return None
+    if timestamp < 0:
+        return None
+    if timestamp >= LAST:
+        try:
+            utc = datetime.datetime.utcfromtimestamp(timestamp // 1000)
+            return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + '{:03d}'.format(int(timestamp) % 1000) + 'Z'
+        except (TypeError, OverflowError, OSError):
+            return None
+    second, milliseconds = divmod(int(timestamp), 1000)
+    cached = last_second
+    if cached[0] == second:
+        prefix = cached[1]
+    else:
+        day, seconds = divmod(second, 86400)
+        date = dates.get(day)
+        if date is None:
+            date = datetime.date.fromordinal(day + EPOCH).isoformat()
+            if len(dates) >= CACHE_SIZE:
+                dates.clear()
+            dates[day] = date
+        prefix = '%sT%02d:%02d:%02d.' % (date, seconds // 3600, seconds // 60 % 60, seconds % 60)
+        last_second = (second, prefix)
+    return prefix + '%03dZ' % milliseconds
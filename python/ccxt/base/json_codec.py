@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+"""JSON codecs selectable with the jsonCodec property of an exchange"""
+
+# -----------------------------------------------------------------------------
+
+import json
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'JsonCodec',
+    'codecs',
+    'get_codec',
+]
+
+# -----------------------------------------------------------------------------
+
+
+def plain(value):
+    """The default= of the encoders, to_dict() of the LazyStructure and the other structures that are not plain dicts"""
+    to_dict = getattr(value, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    if isinstance(value, dict):
+        return dict(value)
+    raise TypeError('Object of type ' + type(value).__name__ + ' is not JSON serializable')
+
+
+class JsonCodec(object):
+    """The standard library codec, also the fallback for anything a faster codec rejects"""
+
+    name = 'json'
+    binary = False  # decodes bytes without making a str first, handed the raw body of the responses
+
+    def loads(self, data):
+        """Decodes a str or UTF-8 bytes"""
+        if isinstance(data, bytes):
+            # like the text of a response, invalid UTF-8 is replaced rather than rejected
+            data = data.decode('utf-8', 'replace')
+        return json.loads(data)
+
+    def dumps(self, value):
+        return json.dumps(value, separators=(',', ':'), default=plain)
+
+
+class OrjsonCodec(JsonCodec):
+
+    name = 'orjson'
+    binary = True
+
+    def __init__(self):
+        import orjson
+        self.orjson = orjson
+
+    def loads(self, data):
+        try:
+            return self.orjson.loads(data)
+        except ValueError:
+            # NaN, Infinity, integers wider than 64 bits and invalid UTF-8 are only accepted by the standard library
+            return JsonCodec.loads(self, data)
+
+    def dumps(self, value):
+        try:
+            # orjson reads the storage of a dict subclass, a LazyStructure would lose its 'datetime', they go to plain()
+            return self.orjson.dumps(value, default=plain, option=self.orjson.OPT_PASSTHROUGH_SUBCLASS).decode('utf-8')
+        except TypeError:
+            return JsonCodec.dumps(self, value)
+
+
+class UjsonCodec(JsonCodec):
+
+    name = 'ujson'
+    binary = True
+
+    def __init__(self):
+        import ujson
+        self.ujson = ujson
+
+    def loads(self, data):
+        try:
+            return self.ujson.loads(data)
+        except ValueError:
+            return JsonCodec.loads(self, data)
+
+    def dumps(self, value):
+        return self.ujson.dumps(value, ensure_ascii=True, escape_forward_slashes=False)
+
+
+# -----------------------------------------------------------------------------
+
+codecs = {
+    'json': JsonCodec,
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+}
+
+instances = {}
+
+
+def get_codec(name=None):
+    """Returns the codec for a name or a codec instance, the standard library one if it is unknown or not installed"""
+    if name is None:
+        name = 'json'
+    elif not isinstance(name, str):
+        return name
+    codec = instances.get(name)
+    if codec is None:
+        try:
+            codec = codecs.get(name, JsonCodec)()
+        except ImportError:
+            codec = JsonCodec()
+        instances[name] = codec
+    return codec
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+"""Incremental JSON parsing of large response bodies, fed chunk by chunk as they are read from the socket"""
+
+# -----------------------------------------------------------------------------
+
+from decimal import Decimal
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from ccxt.base.errors import NotSupported
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'JsonStreamParser',
+]
+
+# -----------------------------------------------------------------------------
+
+TABLE = 1  # an array under one of the numeric keys
+ROW = 2  # an array in a table, its numeric strings become floats
+
+
+class JsonStreamParser(object):
+    """Builds the value of a JSON document from its chunks, without holding the whole body
+
+    The rows of the arrays under numericKeys, like the [price, amount] pairs
+    of order books, are stored with floats in place of numeric strings, the
+    strings are never kept. Other values are the same as json.loads() would
+    return. The first kilobyte of the body is kept in head. Requires ijson.
+    """
+
+    def __init__(self, numeric_keys=('bids', 'asks')):
+        if ijson is None:
+            raise NotSupported('streaming JSON responses requires ijson, pip install ijson')
+        self.numeric_keys = frozenset(numeric_keys)
+        self.events = ijson.sendable_list()
+        # not use_float, its integers are limited to 64 bits
+        self.coroutine = ijson.basic_parse_coro(self.events)
+        self.stack = []  # containers being built, with their kind
+        self.keys = []  # the key being filled in each map of the stack
+        self.value = None
+        self.head = b''
+
+    def feed(self, chunk):
+        if len(self.head) < 1024:
+            self.head += chunk[:1024 - len(self.head)]
+        try:
+            self.coroutine.send(chunk)
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+        self.build()
+
+    def close(self):
+        """Returns the parsed value, raises ValueError for an invalid or truncated document"""
+        try:
+            self.coroutine.close()
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+        self.build()
+        if self.stack:
+            raise ValueError('incomplete JSON document')
+        return self.value
+
+    def build(self):
+        stack = self.stack
+        keys = self.keys
+        for event, value in self.events:
+            if event == 'map_key':
+                keys[-1] = value
+                continue
+            if event == 'start_array':
+                kind = 0
+                if stack:
+                    parent, parent_kind = stack[-1]
+                    if parent_kind == TABLE:
+                        kind = ROW
+                    elif parent_kind == 0 and type(parent) is dict and keys[-1] in self.numeric_keys:
+                        kind = TABLE
+                stack.append(([], kind))
+                continue
+            if event == 'start_map':
+                stack.append(({}, 0))
+                keys.append(None)
+                continue
+            if event == 'end_array':
+                value = stack.pop()[0]
+            elif event == 'end_map':
+                value = stack.pop()[0]
+                keys.pop()
+            elif event == 'string':
+                if stack and stack[-1][1] == ROW:
+                    try:
+                        value = float(value)
+                    except ValueError:
+                        pass
+            elif event == 'number' and type(value) is Decimal:
+                value = float(value)  # rounded as json.loads() does
+            # a scalar or a container that is complete
+            if not stack:
+                self.value = value
+            else:
+                parent = stack[-1][0]
+                if type(parent) is list:
+                    parent.append(value)
+                else:
+                    parent[keys[-1]] = value
+        del self.events[:]
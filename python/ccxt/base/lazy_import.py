@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""Deferred loading of exchange modules for the top-level ccxt packages"""
+
+# -----------------------------------------------------------------------------
+
+import importlib
+import os
+import sys
+import types
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'enabled',
+    'loader',
+]
+
+# -----------------------------------------------------------------------------
+
+
+def enabled():
+    """Set CCXT_LAZY_IMPORT=1 to import exchanges on first access, requires Python 3.7+ (PEP 562)"""
+    if sys.version_info < (3, 7):
+        return False
+    return os.environ.get('CCXT_LAZY_IMPORT', '').lower() in ('1', 'true', 'yes', 'on')
+
+
+def loader(package, namespace, ids):
+    """Returns module-level __getattr__ and __dir__ functions resolving exchange classes by id"""
+    ids = frozenset(ids)
+
+    class Package(types.ModuleType):
+
+        def __setattr__(self, name, value):
+            # the import machinery binds every loaded submodule onto the package, whether it is loaded by
+            # __getattr__, by a parent exchange (binanceus imports binance) or by the user (from ccxt.kraken
+            # import kraken), the exchange ids are bound to their classes instead, as without lazy imports
+            if name in ids and isinstance(value, types.ModuleType):
+                value = getattr(value, name, value)
+            super().__setattr__(name, value)
+
+    sys.modules[package].__class__ = Package
+
+    def __getattr__(name):
+        if name not in ids:
+            raise AttributeError('module ' + package + ' has no attribute ' + name)
+        importlib.import_module(package + '.' + name)
+        return namespace[name]
+
+    def __dir__():
+        return sorted(set(namespace.keys()) | ids)
+
+    return __getattr__, __dir__
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+"""Unified structures with their 'datetime' formatted from their 'timestamp' when it is read, instead of stored"""
+
+# -----------------------------------------------------------------------------
+
+from collections.abc import ItemsView, KeysView, ValuesView
+
+from ccxt.base.iso8601 import format_iso8601
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'LazyStructure',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class LazyStructure(dict):
+    """A trade, an order, a transaction or a ledger entry, the dict it replaces without the 'datetime' string of its 'timestamp'
+
+    structure['datetime'], get(), 'in', iteration, keys(), items(), len(),
+    comparison, copies, pickling and json.dumps() see the 'datetime' of the
+    'timestamp', the ISO 8601 string is made each time it is read. A
+    'datetime' that is set is stored as in a dict, one that is popped or
+    deleted is gone as from a dict. to_dict() returns a dict.
+    """
+
+    __slots__ = ('removed',)  # set when the 'datetime' of the timestamp is popped or deleted
+
+    def __missing__(self, key):
+        if key == 'datetime' and not getattr(self, 'removed', False):
+            return format_iso8601(dict.get(self, 'timestamp'))
+        raise KeyError(key)
+
+    def virtual(self):
+        return not dict.__contains__(self, 'datetime') and not getattr(self, 'removed', False)
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or (key == 'datetime' and self.virtual())
+
+    def __delitem__(self, key):
+        if key == 'datetime' and self.virtual():
+            self.removed = True
+        else:
+            dict.__delitem__(self, key)
+
+    def pop(self, key, *default):
+        if key == 'datetime' and self.virtual():
+            value = self.__missing__(key)
+            self.removed = True
+            return value
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key, default=None):
+        if key == 'datetime' and self.virtual():
+            return self.__missing__(key)
+        return dict.setdefault(self, key, default)
+
+    def popitem(self):
+        # the last key of the iteration, the virtual 'datetime' comes after the 'timestamp' or at the end
+        if self.virtual():
+            if not dict.__contains__(self, 'timestamp'):
+                return ('datetime', self.pop('datetime'))
+            key, value = dict.popitem(self)
+            if key == 'timestamp':
+                dict.__setitem__(self, key, value)
+                return ('datetime', self.pop('datetime'))
+            return (key, value)
+        return dict.popitem(self)
+
+    def get(self, key, default=None):
+        if key == 'datetime' and self.virtual():
+            return self.__missing__(key)
+        return dict.get(self, key, default)
+
+    def __iter__(self):
+        virtual = self.virtual()
+        for key in dict.__iter__(self):
+            yield key
+            if virtual and key == 'timestamp':
+                yield 'datetime'
+                virtual = False
+        if virtual:
+            yield 'datetime'
+
+    def __len__(self):
+        return dict.__len__(self) + self.virtual()
+
+    def keys(self):
+        return KeysView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyStructure):
+            other = other.to_dict()
+        return isinstance(other, dict) and self.to_dict() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def __reduce__(self):
+        if getattr(self, 'removed', False):
+            return (LazyStructure, (dict(dict.items(self)),), (None, {'removed': True}))
+        return (LazyStructure, (dict(dict.items(self)),))
+
+    def copy(self):
+        result = LazyStructure(dict.items(self))
+        if getattr(self, 'removed', False):
+            result.removed = True
+        return result
+
+    def to_dict(self):
+        return {key: self[key] for key in self}
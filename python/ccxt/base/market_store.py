@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+"""Process-wide registry of loaded markets shared between exchange instances"""
+
+# -----------------------------------------------------------------------------
+
+import threading
+import weakref
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'MarketStore',
+    'market_store',
+]
+
+# -----------------------------------------------------------------------------
+
+# the instance attributes that set_markets() derives from a market list, markets last
+MARKET_ATTRIBUTES = (
+    'markets_by_id',
+    'marketsById',
+    'symbols',
+    'ids',
+    'currencies',
+    'currencies_by_id',
+    'base_currencies',
+    'quote_currencies',
+    'markets',
+)
+
+
+class MarketSnapshot(object):
+    """One version of the market data for a key, treat the structures as read-only
+
+    apply() assigns the attributes of an instance one after the other, it is
+    not atomic. A thread that reads an instance while a new version is applied
+    may see the ids or currencies of the new version with the markets of the
+    old one. The markets are assigned last, so a thread that sees the new
+    markets also sees the new ids, symbols and currencies.
+    """
+
+    __slots__ = ('key', 'version', 'values')
+
+    def __init__(self, key, version, values):
+        self.key = key
+        self.version = version
+        self.values = values
+
+    def apply(self, exchange):
+        for name, value in self.values.items():
+            setattr(exchange, name, value)
+        exchange.markets_version = self.version
+        exchange.on_markets_loaded(list(exchange.markets_by_id.values()) if exchange.markets_by_id else [])
+
+
+class MarketStore(object):
+    """Shares one market snapshot per key among all the instances attached to it
+
+    Instances are referenced weakly, a key is dropped as soon as the last instance
+    attached to it is released or garbage-collected. Publishing a new snapshot for
+    a key applies it to every attached instance under the lock of the store, which
+    orders publishers and attaching instances, not the threads reading an instance.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.snapshots = {}
+        self.references = {}
+        self.versions = {}
+        self.keys = weakref.WeakKeyDictionary()
+
+    def get(self, key):
+        with self.lock:
+            return self.snapshots.get(key)
+
+    def count(self, key):
+        with self.lock:
+            return len(self.references.get(key, ()))
+
+    def attach(self, key, exchange):
+        """Binds an instance to the current snapshot of a key, returns None if there is none"""
+        with self.lock:
+            snapshot = self.snapshots.get(key)
+            if snapshot is not None:
+                self.reference(key, exchange)
+                snapshot.apply(exchange)
+            return snapshot
+
+    def publish(self, key, exchange):
+        """Stores the markets of an instance as the next version of a key for all instances attached to it"""
+        with self.lock:
+            version = self.versions.get(key, 0) + 1
+            values = dict((name, getattr(exchange, name, None)) for name in MARKET_ATTRIBUTES)
+            snapshot = MarketSnapshot(key, version, values)
+            self.versions[key] = version
+            self.snapshots[key] = snapshot
+            self.reference(key, exchange)
+            for reference in list(self.references[key]):
+                instance = reference()
+                if instance is exchange:
+                    exchange.markets_version = version  # set_markets() has run on it
+                elif instance is not None:
+                    snapshot.apply(instance)
+            return snapshot
+
+    def release(self, exchange):
+        """Detaches an instance, its markets stay as they are but are no longer updated"""
+        with self.lock:
+            key = self.keys.pop(exchange, None)
+            for reference in list(self.references.get(key, ())):
+                if reference() is exchange:
+                    self.discard(key, reference)
+
+    def reference(self, key, exchange):
+        previous = self.keys.get(exchange)
+        if previous == key:
+            return
+        if previous is not None:
+            self.release(exchange)
+        references = self.references.setdefault(key, set())
+        references.add(weakref.ref(exchange, lambda reference: self.discard(key, reference)))
+        self.keys[exchange] = key
+
+    def discard(self, key, reference):
+        with self.lock:
+            references = self.references.get(key)
+            if references is None:
+                return
+            references.discard(reference)
+            if not references:
+                del self.references[key]
+                self.snapshots.pop(key, None)
+
+
+market_store = MarketStore()
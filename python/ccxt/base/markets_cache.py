@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""On-disk cache of fetched markets and currencies for load_markets()"""
+
+# -----------------------------------------------------------------------------
+
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import time
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'FileMarketsCache',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class FileMarketsCache(object):
+    """Stores the raw fetch_markets() and fetch_currencies() results in one json file per key
+
+    The state an exchange derives from its markets, like the markets by altname of
+    kraken, is not stored, on_markets_loaded() rebuilds it when the markets are set.
+    The default directory is private to the user, <tempdir>/ccxt-markets-<uid> with
+    mode 0700. A directory or a file that is not owned by the user or that others can
+    write to is never read nor written, another local user could plant markets there.
+    Any object with the same load(key) and save(key, markets, currencies) methods
+    can be plugged into the marketsCache property of an exchange instead.
+    """
+
+    formats = ('json',)
+
+    def __init__(self, directory=None, ttl=3600000, format='json'):
+        if format not in self.formats:
+            raise ValueError('markets cache format must be one of ' + ', '.join(self.formats))
+        self.directory = directory or default_directory()
+        self.ttl = ttl  # milliseconds
+        self.format = format
+
+    def path(self, key):
+        encoded = json.dumps(key, sort_keys=True, separators=(',', ':'), default=str)
+        digest = hashlib.sha1(encoded.encode('utf-8')).hexdigest()[:20]
+        return os.path.join(self.directory, str(key['id']) + '-' + digest + '.' + self.format)
+
+    def load(self, key):
+        """Returns a (markets, currencies) tuple, or None if nothing fresh is cached"""
+        path = self.path(key)
+        try:
+            if not trusted(self.directory):
+                return None
+            with open(path, 'rb') as file:
+                status = os.fstat(file.fileno())
+                if not trusted_status(status) or not stat.S_ISREG(status.st_mode):
+                    return None
+                if (time.time() - status.st_mtime) * 1000 > self.ttl:
+                    return None
+                data = file.read()
+            cached = json.loads(data.decode('utf-8'))
+            return cached['markets'], cached['currencies']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, key, markets, currencies=None):
+        cached = {
+            'markets': markets,
+            'currencies': currencies,
+        }
+        data = json.dumps(cached, separators=(',', ':'), default=str).encode('utf-8')
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        if not trusted(self.directory):
+            raise OSError('the markets cache directory ' + self.directory + ' must be owned by the user and not writable by others')
+        path = self.path(key)
+        # write to a temporary file first so concurrent readers never see a partial file, mkstemp() creates it 0600
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, prefix='.' + os.path.basename(path))
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(data)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+def default_directory():
+    """<tempdir>/ccxt-markets-<uid>, the temporary directory of Windows is private to the user already"""
+    if hasattr(os, 'getuid'):
+        return os.path.join(tempfile.gettempdir(), 'ccxt-markets-' + str(os.getuid()))
+    return os.path.join(tempfile.gettempdir(), 'ccxt-markets')
+
+
+def trusted_status(status):
+    """Owned by the user and not writable by the group or others, always on systems without uids"""
+    if not hasattr(os, 'getuid'):
+        return True
+    return status.st_uid == os.getuid() and not (status.st_mode & (stat.S_IWGRP | stat.S_IWOTH))
+
+
+def trusted(directory):
+    try:
+        status = os.lstat(directory)
+    except OSError:
+        return False
+    return stat.S_ISDIR(status.st_mode) and trusted_status(status)
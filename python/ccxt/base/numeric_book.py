@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""Order book sides stored as two float64 arrays, the prices and the amounts, instead of a list of pairs"""
+
+# -----------------------------------------------------------------------------
+
+import collections
+from array import array
+
+from ccxt.base.errors import NotSupported
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'NumericBookSide',
+]
+
+# -----------------------------------------------------------------------------
+
+numpy = None  # imported with the first vectorized side, import ccxt does not pay for it
+
+
+def require_numpy():
+    global numpy
+    if numpy is None:
+        try:
+            import numpy as module
+        except ImportError:
+            raise NotSupported('the numpy order book format requires numpy, pip install numpy')
+        numpy = module
+    return numpy
+
+
+class NumericBookSide(object):
+    """The bids or the asks of an order book, in two contiguous float64 arrays
+
+    The arrays are array.array('d') or, with vectorized=True, NumPy arrays.
+    A side can be used as the list of [price, amount] pairs it replaces, the
+    pairs are made on access: side[0], side[:10], len(side), iteration and
+    comparison with a list work as before. to_list() returns the pairs.
+    """
+
+    __slots__ = ('prices', 'amounts', 'vectorized')
+
+    def __init__(self, prices=None, amounts=None, vectorized=False):
+        if vectorized:
+            require_numpy()
+            self.prices = numpy.frombuffer(prices, dtype=numpy.float64) if isinstance(prices, array) else numpy.asarray(prices if prices is not None else [], dtype=numpy.float64)
+            self.amounts = numpy.frombuffer(amounts, dtype=numpy.float64) if isinstance(amounts, array) else numpy.asarray(amounts if amounts is not None else [], dtype=numpy.float64)
+        else:
+            self.prices = prices if isinstance(prices, array) else array('d', prices or [])
+            self.amounts = amounts if isinstance(amounts, array) else array('d', amounts or [])
+        self.vectorized = vectorized
+
+    @classmethod
+    def from_pairs(cls, pairs, vectorized=False):
+        return cls(array('d', [pair[0] for pair in pairs]), array('d', [pair[1] for pair in pairs]), vectorized)
+
+    def __len__(self):
+        return len(self.prices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return NumericBookSide(self.prices[index], self.amounts[index], self.vectorized)
+        return [float(self.prices[index]), float(self.amounts[index])]
+
+    def __iter__(self):
+        if self.vectorized:
+            return (list(pair) for pair in zip(self.prices.tolist(), self.amounts.tolist()))
+        return (list(pair) for pair in zip(self.prices, self.amounts))
+
+    def __eq__(self, other):
+        if isinstance(other, NumericBookSide):
+            return list(self.prices) == list(other.prices) and list(self.amounts) == list(other.amounts)
+        return isinstance(other, list) and self.to_list() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.to_list())
+
+    def to_list(self):
+        return list(self)
+
+    def sorted(self, key=0, descending=False):
+        """Sorted by the prices (key 0) or the amounts (key 1), stable, the side itself when it is in order already"""
+        values = self.prices if key == 0 else self.amounts
+        if self.vectorized:
+            if len(values) < 2 or bool(numpy.all(values[:-1] >= values[1:]) if descending else numpy.all(values[:-1] <= values[1:])):
+                return self
+            order = numpy.argsort(-values if descending else values, kind='stable')
+            return NumericBookSide(self.prices[order], self.amounts[order], True)
+        # timsort takes a single pass over a sorted side
+        order = sorted(range(len(values)), key=values.__getitem__, reverse=descending)
+        if order == list(range(len(values))):
+            return self
+        return NumericBookSide(array('d', map(self.prices.__getitem__, order)), array('d', map(self.amounts.__getitem__, order)))
+
+    def aggregate(self):
+        """The positive amounts summed by price, as Exchange.aggregate() does for lists, in ascending order when vectorized"""
+        if self.vectorized:
+            positive = self.amounts > 0
+            prices, inverse = numpy.unique(self.prices[positive], return_inverse=True)
+            amounts = numpy.bincount(inverse.ravel(), weights=self.amounts[positive], minlength=len(prices))
+            return NumericBookSide(prices, amounts, True)
+        ordered = collections.OrderedDict()
+        for price, amount in zip(self.prices, self.amounts):
+            if amount > 0:
+                ordered[price] = ordered.get(price, 0) + amount
+        return NumericBookSide(array('d', ordered.keys()), array('d', ordered.values()))
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+"""Candles stored as six contiguous arrays, one per field, instead of a list per candle"""
+
+# -----------------------------------------------------------------------------
+
+from array import array
+from itertools import islice
+from numbers import Number
+from operator import gt, le
+
+from ccxt.base.errors import NotSupported
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'OHLCVColumns',
+]
+
+# -----------------------------------------------------------------------------
+
+FIELDS = ('timestamps', 'opens', 'highs', 'lows', 'closes', 'volumes')
+NAN = float('nan')
+
+numpy = None  # imported with the first vectorized candles, import ccxt does not pay for it
+
+
+def require_numpy():
+    global numpy
+    if numpy is None:
+        try:
+            import numpy as module
+        except ImportError:
+            raise NotSupported('the numpy ohlcv format requires numpy, pip install numpy')
+        numpy = module
+    return numpy
+
+
+def to_integer(value):
+    """safe_integer() of a single value"""
+    if isinstance(value, Number) or (isinstance(value, str) and value.isnumeric()):
+        return int(value)
+    return None
+
+
+def to_float(value):
+    """safe_float() of a single value, NaN in place of None"""
+    if value is None or value == '':
+        return NAN
+    try:
+        return float(value)
+    except ValueError:
+        return NAN
+
+
+def integers(values, vectorized):
+    if not all(type(value) is int for value in values):
+        values = [to_integer(value) for value in values]
+    return numpy.fromiter(values, numpy.int64, len(values)) if vectorized else array('q', values)
+
+
+def floats(values, vectorized):
+    try:
+        return numpy.fromiter(map(float, values), numpy.float64, len(values)) if vectorized else array('d', map(float, values))
+    except (TypeError, ValueError):
+        # None, empty or invalid values, converted one by one
+        return numpy.fromiter(map(to_float, values), numpy.float64, len(values)) if vectorized else array('d', map(to_float, values))
+
+
+class OHLCVColumns(object):
+    """Candles in six arrays: timestamps (int64), opens, highs, lows, closes and volumes (float64)
+
+    The arrays are array.array or, with vectorized=True, NumPy arrays. The
+    candles can be used as the list of [timestamp, open, high, low, close,
+    volume] lists they replace, the lists are made on access: candles[-1],
+    candles[:10], len(candles), iteration and comparison with a list work as
+    before, missing values are None. to_list() returns the lists.
+    """
+
+    __slots__ = FIELDS + ('vectorized',)
+
+    def __init__(self, timestamps, opens, highs, lows, closes, volumes, vectorized=False):
+        if vectorized:
+            require_numpy()
+        self.timestamps = timestamps
+        self.opens = opens
+        self.highs = highs
+        self.lows = lows
+        self.closes = closes
+        self.volumes = volumes
+        self.vectorized = vectorized
+
+    @classmethod
+    def from_rows(cls, rows, indexes=(0, 1, 2, 3, 4, 5), since=None, limit=None, vectorized=False):
+        """The candles in the rows, their fields at the indexes, the rows before since skipped, at most limit, sorted by timestamp"""
+        if vectorized:
+            require_numpy()
+        if limit and not since:
+            rows = rows[:limit]
+        timestamps = integers([row[indexes[0]] for row in rows], vectorized)
+        if since or limit:
+            if vectorized:
+                selected = numpy.flatnonzero(timestamps >= since) if since else numpy.arange(len(timestamps))
+            else:
+                selected = [i for i, timestamp in enumerate(timestamps) if timestamp >= since] if since else range(len(timestamps))
+            if limit:
+                selected = selected[:limit]
+            if len(selected) < len(rows):
+                timestamps = timestamps[selected] if vectorized else array('q', map(timestamps.__getitem__, selected))
+                rows = [rows[i] for i in selected]
+        columns = [floats([row[index] for row in rows], vectorized) for index in indexes[1:]]
+        return cls(timestamps, *columns, vectorized=vectorized).sorted()
+
+    @classmethod
+    def from_candles(cls, candles, vectorized=False):
+        """The candles from a list of [timestamp, open, high, low, close, volume] lists, sorted by timestamp"""
+        return cls.from_rows(candles, vectorized=vectorized)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return OHLCVColumns(*[getattr(self, field)[index] for field in FIELDS], vectorized=self.vectorized)
+        candle = [int(self.timestamps[index])]
+        for field in FIELDS[1:]:
+            value = float(getattr(self, field)[index])
+            candle.append(value if value == value else None)
+        return candle
+
+    def __iter__(self):
+        columns = [getattr(self, field) for field in FIELDS]
+        if self.vectorized:
+            columns = [column.tolist() for column in columns]
+        for candle in zip(*columns):
+            yield [value if value == value else None for value in candle]
+
+    def __eq__(self, other):
+        if isinstance(other, OHLCVColumns):
+            other = other.to_list()
+        return isinstance(other, list) and self.to_list() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.to_list())
+
+    def to_list(self):
+        return list(self)
+
+    def sorted(self):
+        """Sorted by timestamp, stable, the candles themselves when they are in order already"""
+        timestamps = self.timestamps
+        if self.vectorized:
+            if len(timestamps) < 2 or bool(numpy.all(timestamps[:-1] <= timestamps[1:])):
+                return self
+            if bool(numpy.all(timestamps[:-1] > timestamps[1:])):
+                order = slice(None, None, -1)  # newest first, as many exchanges return them
+            else:
+                order = numpy.argsort(timestamps, kind='stable')
+            return OHLCVColumns(*[getattr(self, field)[order] for field in FIELDS], vectorized=True)
+        if all(map(le, timestamps, islice(timestamps, 1, None))):
+            return self
+        if all(map(gt, timestamps, islice(timestamps, 1, None))):
+            return OHLCVColumns(*[array(getattr(self, field).typecode, reversed(getattr(self, field))) for field in FIELDS])
+        order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+        return OHLCVColumns(*[array(getattr(self, field).typecode, map(getattr(self, field).__getitem__, order)) for field in FIELDS])
+
+
+def infer_indexes(rows, candles):
+    """The indexes of the six fields in the raw rows that give the parsed candles, None if they are ambiguous or do not match"""
+    indexes = []
+    width = len(rows[0])
+    for field in range(6):
+        convert = to_integer if field == 0 else to_float
+        candidates = set(range(width))
+        for row, candle in zip(rows, candles):
+            expected = NAN if candle[field] is None and field else candle[field]
+            candidates = set(i for i in candidates if same(convert(row[i]), expected))
+        if len(candidates) != 1:
+            return None  # like an open equal to the close in every probed row
+        indexes.append(candidates.pop())
+    return indexes
+
+
+def same(value, expected):
+    if value != value:
+        return expected != expected  # NaN
+    return type(expected) is not str and value == expected
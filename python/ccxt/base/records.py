@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+"""Trades, orders and fees as records with __slots__, read like the dicts they replace"""
+
+# -----------------------------------------------------------------------------
+
+from collections.abc import Mapping
+
+from ccxt.base.iso8601 import format_iso8601
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'Fee',
+    'Order',
+    'Record',
+    'Trade',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class Record(Mapping):
+    """The unified fields of a structure in slots, the other keys in the extra dict
+
+    A record is a read-only Mapping of the structure, with the same keys and
+    values: record['price'], get(), 'in', iteration, keys(), items(), len(),
+    == against a dict, dict(record) and {**record} work as with the dict, and
+    setting a key stores it. The fields are attributes too, record.price.
+    The 'datetime' of the 'timestamp' is not stored, it is formatted when it
+    is read, one in another form is kept in the extra dict. to_dict()
+    returns the dict, for json.dumps() for instance.
+    """
+
+    __slots__ = ('extra',)
+
+    fields = ()  # the keys of the structure, in order
+    stored = frozenset()  # the keys held in slots
+    nested = {}  # the records of the dicts under some keys
+    unified = frozenset()  # the keys of a structure built by build()
+    build = None  # the record of a dict with the unified keys exactly, by compile_builder()
+
+    @classmethod
+    def from_dict(cls, structure):
+        if type(structure) is dict and structure.keys() == cls.unified:
+            return cls.build(structure)
+        record = cls.__new__(cls)
+        stored = cls.stored
+        extra = None
+        for key, value in structure.items():
+            if key in stored:
+                setattr(record, key, value)
+            elif key != 'datetime' or value != format_iso8601(structure.get('timestamp')):
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        record.extra = extra
+        for key, nested in cls.nested.items():
+            value = getattr(record, key, None)
+            if type(value) is dict:
+                setattr(record, key, nested.from_dict(value))
+        return record
+
+    def __getitem__(self, key):
+        if key in self.stored:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        extra = self.extra
+        if extra is not None and key in extra:
+            return extra[key]
+        if key == 'datetime' and 'datetime' in self.fields:
+            return format_iso8601(getattr(self, 'timestamp', None))
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self.stored:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __iter__(self):
+        extra = self.extra
+        for key in self.fields:
+            if key in self.stored:
+                if hasattr(self, key):
+                    yield key
+            elif key == 'datetime' or (extra is not None and key in extra):
+                yield key
+        if extra is not None:
+            for key in extra:
+                if key not in self.fields:
+                    yield key
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def to_dict(self):
+        result = {}
+        for key in self:
+            value = self[key]
+            if isinstance(value, Record):
+                value = value.to_dict()
+            elif type(value) is list:
+                value = [item.to_dict() if isinstance(item, Record) else item for item in value]
+            result[key] = value
+        return result
+
+
+def compile_builder(record):
+    """The build() of a record type, its source is generated with an assignment per slot, as from_dict() does key by key"""
+    lines = [
+        'def build(structure):',
+        '    record = new(record_type)',
+    ]
+    for key in record.__slots__:
+        if key in record.nested:
+            lines.append('    value = structure[' + repr(key) + ']')
+            lines.append('    record.' + key + ' = nested[' + repr(key) + '].from_dict(value) if type(value) is dict else value')
+        else:
+            lines.append('    record.' + key + ' = structure[' + repr(key) + ']')
+    if 'datetime' in record.fields:
+        # the 'datetime' of the timestamp is formatted when it is read, another one is kept
+        lines.append("    value = structure['datetime']")
+        lines.append("    record.extra = None if value == format_iso8601(structure['timestamp']) else {'datetime': value}")
+    else:
+        lines.append('    record.extra = None')
+    lines.append('    return record')
+    namespace = {'new': record.__new__, 'record_type': record, 'nested': record.nested, 'format_iso8601': format_iso8601}
+    exec('\n'.join(lines), namespace)
+    return staticmethod(namespace['build'])
+
+
+class Fee(Record):
+
+    __slots__ = ('cost', 'currency', 'rate')
+
+    fields = ('cost', 'currency', 'rate')
+    stored = frozenset(fields)
+
+
+class Trade(Record):
+
+    __slots__ = ('info', 'id', 'timestamp', 'symbol', 'order', 'type', 'side', 'takerOrMaker', 'price', 'amount', 'cost', 'fee')
+
+    fields = ('info', 'id', 'timestamp', 'datetime', 'symbol', 'order', 'type', 'side', 'takerOrMaker', 'price', 'amount', 'cost', 'fee')
+    stored = frozenset(__slots__)
+    nested = {'fee': Fee}
+
+    @property
+    def datetime(self):
+        return self['datetime']
+
+
+class Order(Record):
+
+    __slots__ = ('id', 'clientOrderId', 'timestamp', 'lastTradeTimestamp', 'status', 'symbol', 'type', 'timeInForce', 'side',
+                 'price', 'average', 'amount', 'filled', 'remaining', 'cost', 'trades', 'fee', 'info')
+
+    fields = ('id', 'clientOrderId', 'datetime', 'timestamp', 'lastTradeTimestamp', 'status', 'symbol', 'type', 'timeInForce', 'side',
+              'price', 'average', 'amount', 'filled', 'remaining', 'cost', 'trades', 'fee', 'info')
+    stored = frozenset(__slots__)
+    nested = {'fee': Fee}
+
+    @property
+    def datetime(self):
+        return self['datetime']
+
+
+for record_type in (Fee, Trade, Order):
+    record_type.unified = frozenset(record_type.fields)
+    record_type.build = compile_builder(record_type)
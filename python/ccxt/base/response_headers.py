@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+"""Hands the headers of a response back to the call that made the request, without storing them on the instance"""
+
+# -----------------------------------------------------------------------------
+
+import threading
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # Python < 3.7
+    ContextVar = None
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'get_response_headers',
+    'set_response_headers',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class ThreadLocalVar(threading.local):
+    """The part of ContextVar used here, per thread only, so concurrent asyncio tasks can see each other's value"""
+
+    value = None
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+# the (exchange id(), headers) of the latest response received in the current thread or asyncio task
+latest = ContextVar('ccxt_response_headers', default=None) if ContextVar else ThreadLocalVar()
+
+
+def set_response_headers(exchange, headers):
+    latest.set((id(exchange), headers))
+
+
+def get_response_headers(exchange):
+    """Returns the headers of the latest response received by an exchange in the current thread or task"""
+    value = latest.get()
+    if value is not None and value[0] == id(exchange):
+        return value[1]
+    return None
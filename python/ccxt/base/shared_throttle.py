@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+"""Token buckets shared by all the processes of a host through small lock files"""
+
+# -----------------------------------------------------------------------------
+
+import os
+import struct
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from ccxt.base.errors import NotSupported
+from ccxt.base.throttle import TokenBucket
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'FileBucketStore',
+    'FileTokenBucket',
+]
+
+# -----------------------------------------------------------------------------
+
+STATE = struct.Struct('<dd')  # tokens, timestamp in seconds since the epoch
+
+
+class FileLock(object):
+    """Loads the state of a bucket from its file on enter, stores it back on exit, under an exclusive flock()"""
+
+    def __init__(self, bucket, path):
+        self.bucket = bucket
+        self.path = path
+        self.lock = threading.Lock()
+        self.descriptor = None
+
+    def __enter__(self):
+        self.lock.acquire()
+        try:
+            if self.descriptor is None:
+                self.descriptor = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            fcntl.flock(self.descriptor, fcntl.LOCK_EX)
+            data = os.pread(self.descriptor, STATE.size, 0)
+            if len(data) == STATE.size:
+                self.bucket.tokens, self.bucket.timestamp = STATE.unpack(data)
+            else:
+                self.bucket.tokens, self.bucket.timestamp = self.bucket.capacity, self.bucket.clock()
+        except BaseException:
+            self.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            os.pwrite(self.descriptor, STATE.pack(self.bucket.tokens, self.bucket.timestamp), 0)
+        finally:
+            self.release()
+
+    def release(self):
+        try:
+            if self.descriptor is not None:
+                fcntl.flock(self.descriptor, fcntl.LOCK_UN)
+        finally:
+            self.lock.release()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        if self.descriptor is not None:
+            os.close(self.descriptor)
+            self.descriptor = None
+
+
+class FileTokenBucket(TokenBucket):
+    """A TokenBucket whose tokens live in a file, every process opening the same file draws from the same budget
+
+    The capacity and refill rate come from the config of each process, they
+    should be the same everywhere. Each operation holds the file lock for a
+    read and a write of 16 bytes only.
+    """
+
+    def __init__(self, path, config=None):
+        if fcntl is None:
+            raise NotSupported('shared rate limits in files require fcntl, which is not available on this platform')
+        super(FileTokenBucket, self).__init__(config)
+        self.clock = time.time  # comparable across processes
+        self.timestamp = self.clock()
+        self.path = path
+        self.lock = FileLock(self, path)
+
+
+class FileBucketStore(object):
+    """Hands out a FileTokenBucket per key, in one directory
+
+    Any object with a bucket(key, config) method returning an object with the
+    reserve(), refund(), pause() and resync() methods of a TokenBucket can be
+    assigned to the sharedRateLimit property of an exchange instead, to keep
+    the budget in another process or service.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or os.path.join(tempfile.gettempdir(), 'ccxt-rate-limits')
+
+    def bucket(self, key, config=None):
+        os.makedirs(self.directory, exist_ok=True)
+        return FileTokenBucket(os.path.join(self.directory, key + '.bucket'), config)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""Thread-safe token bucket behind the rate limiter of the synchronous Exchange"""
+
+# -----------------------------------------------------------------------------
+
+import threading
+import time
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'TokenBucket',
+    'throttle',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class TokenBucket(object):
+    """Refills at refillRate tokens per millisecond up to capacity, each request takes its cost
+
+    A request takes its tokens as soon as it asks for them, even if that leaves
+    the bucket in debt, and then waits for the debt to be refilled. Requests are
+    thereby served in the order they arrive, with a fixed amount of work each.
+    """
+
+    def __init__(self, config=None):
+        config = config or {}
+        self.capacity = config.get('capacity', 1.0)
+        self.refill_rate = config.get('refillRate', 0.001)  # tokens per millisecond
+        self.default_cost = config.get('defaultCost', 1.0)
+        self.tokens = self.capacity
+        self.clock = time.monotonic
+        self.timestamp = self.clock()
+        self.lock = threading.Lock()
+
+    def refill(self, now):
+        elapsed = now - self.timestamp
+        self.timestamp = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate * 1000)
+
+    def reserve(self, cost=None):
+        """Takes the tokens for a request, returns the number of seconds to wait before sending it"""
+        cost = self.default_cost if cost is None else cost
+        if self.refill_rate == float('inf'):
+            return 0
+        with self.lock:
+            self.refill(self.clock())
+            self.tokens -= cost
+            if self.tokens >= 0:
+                return 0
+            return -self.tokens / (self.refill_rate * 1000)
+
+    def pause(self, seconds):
+        """Holds every request back for a number of seconds, as asked by a Retry-After header"""
+        if self.refill_rate == float('inf'):
+            return
+        with self.lock:
+            self.refill(self.clock())
+            self.tokens = min(self.tokens, 0) - seconds * self.refill_rate * 1000
+
+    def resync(self, remaining, reset=None):
+        """Aligns the bucket with the budget the exchange reports as left until the end of its window
+
+        The tokens are capped so that what the bucket can hand out until the
+        window resets in `reset` seconds does not exceed `remaining`, going
+        into debt slows the requests down before the exchange rejects them.
+        """
+        if self.refill_rate == float('inf'):
+            return
+        with self.lock:
+            self.refill(self.clock())
+            refilled = reset * self.refill_rate * 1000 if reset else 0
+            self.tokens = min(self.tokens, remaining - refilled)
+
+    def refund(self, cost=None):
+        """Gives back the tokens of a request that was not sent"""
+        cost = self.default_cost if cost is None else cost
+        with self.lock:
+            self.tokens = min(self.capacity, self.tokens + cost)
+
+
+def throttle(config=None):
+    """Returns a throttle(cost=None, rate_limit=None) function that blocks the calling thread until the request can be sent"""
+
+    config = config or {}
+    bucket = config.get('bucket') or TokenBucket(config)
+
+    def throttle(cost=None, rate_limit=None):
+        if rate_limit is not None and rate_limit != throttle.rate_limit:
+            # tokenBucket was made for the rateLimit of the config, later changes of exchange.rateLimit apply
+            bucket.refill_rate = 1 / rate_limit if rate_limit > 0 else float('inf')
+            throttle.rate_limit = rate_limit
+        delay = bucket.reserve(cost)
+        if delay > 0:
+            time.sleep(delay)
+
+    throttle.bucket = bucket
+    throttle.rate_limit = config.get('rateLimit')
+    return throttle
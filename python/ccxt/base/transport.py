@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+"""The HTTP clients behind Exchange.fetch, a request object in and a response object out"""
+
+# -----------------------------------------------------------------------------
+
+import base64
+import codecs
+import inspect
+import json
+from ssl import SSLError
+
+from requests.exceptions import Timeout, TooManyRedirects, RequestException, ConnectionError as requestsConnectionError
+from requests.structures import CaseInsensitiveDict
+
+from ccxt.base.errors import ExchangeError
+from ccxt.base.errors import NetworkError
+from ccxt.base.errors import RequestTimeout
+
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    'RecordingTransport',
+    'ReplayTransport',
+    'Request',
+    'RequestsTransport',
+    'Response',
+    'Transport',
+]
+
+# -----------------------------------------------------------------------------
+
+
+class Request(object):
+    """What Exchange.fetch asks a transport to send
+
+    body is bytes or None, timeout is in seconds, proxy holds the proxies of
+    the exchange, the requests-style dict of the synchronous Exchange or the
+    aiohttp_proxy url in async_support. With stream set to a number of bytes,
+    successful JSON responses of that size or more are better returned as
+    chunks, see streams().
+    """
+
+    __slots__ = ('method', 'url', 'headers', 'body', 'timeout', 'verify', 'proxy', 'stream')
+
+    def __init__(self, method, url, headers=None, body=None, timeout=10, verify=True, proxy=None, stream=None):
+        self.method = method
+        self.url = url
+        self.headers = headers if headers is not None else {}
+        self.body = body
+        self.timeout = timeout
+        self.verify = verify
+        self.proxy = proxy
+        self.stream = stream
+
+
+class Response(object):
+    """What a transport returns, body is the payload as bytes, already decompressed
+
+    A streamed response has no body but chunks, an iterable of decompressed
+    bytes, asynchronous in async_support, consumed once by the exchange.
+    """
+
+    __slots__ = ('status', 'reason', 'headers', 'body', 'chunks')
+
+    def __init__(self, status, reason='', headers=None, body=b'', chunks=None):
+        self.status = status
+        self.reason = reason
+        # case-insensitive, native header objects of the http clients are kept as they are
+        self.headers = CaseInsensitiveDict(headers) if headers is None or type(headers) is dict else headers
+        self.body = body
+        self.chunks = chunks
+
+    def text(self):
+        """The body decoded with the charset of its Content-Type, UTF-8 when it has none or an unknown one"""
+        return self.body.decode(charset(self.headers.get('Content-Type')), 'replace')
+
+
+def charset(content_type):
+    """The codec of the charset parameter of a Content-Type header, utf-8 by default"""
+    for parameter in (content_type or '').split(';')[1:]:
+        name, _, value = parameter.partition('=')
+        if name.strip().lower() == 'charset':
+            try:
+                return codecs.lookup(value.strip().strip('"\'')).name
+            except LookupError:
+                break
+    return 'utf-8'
+
+
+def streams(request, status, headers):
+    """Whether a response is to be returned as chunks, a successful JSON response of request.stream bytes or more"""
+    if request.stream is None or not 200 <= status < 300 or 'json' not in headers.get('Content-Type', ''):
+        return False
+    length = headers.get('Content-Length')
+    return length is None or int(length) >= request.stream
+
+
+CHUNK_SIZE = 65536
+
+
+class Transport(object):
+    """Sends a Request, returns a Response, or an awaitable of one in async_support, where close() is a coroutine too
+
+    Network failures are raised as RequestTimeout, NetworkError and its
+    subclasses, or ExchangeError, with the method and url for a message.
+    Responses are returned whatever their status, the exchange handles the
+    http errors. A transport can be assigned to the transport property of an
+    exchange, see RequestsTransport and ReplayTransport for examples.
+    """
+
+    def send(self, request):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+def requests_error(e, details):
+    """The ccxt exception for an exception of requests"""
+    if isinstance(e, Timeout):
+        return RequestTimeout(details)
+    if isinstance(e, (TooManyRedirects, SSLError)):
+        return ExchangeError(details)
+    if isinstance(e, requestsConnectionError):
+        return RequestTimeout(details) if 'Read timed out' in str(e) else NetworkError(details)
+    if any(x in str(e) for x in ['ECONNRESET', 'Connection aborted.', 'Connection broken:']):
+        return NetworkError(details)
+    return ExchangeError(details)  # base exception class
+
+
+class RequestsTransport(Transport):
+    """The default transport of the synchronous Exchange, over a requests Session"""
+
+    def __init__(self, session):
+        self.client = session
+
+    def send(self, request):
+        details = request.method + ' ' + request.url
+        self.client.cookies.clear()
+        options = {'stream': True} if request.stream is not None else {}
+        try:
+            response = self.client.request(
+                request.method,
+                request.url,
+                data=request.body,
+                headers=request.headers,
+                timeout=int(request.timeout),
+                proxies=request.proxy,
+                verify=request.verify,
+                **options
+            )
+            if streams(request, response.status_code, response.headers):
+                return Response(response.status_code, response.reason, response.headers, None, self.chunks(response, details))
+            content = response.content
+        except (RequestException, SSLError) as e:
+            raise requests_error(e, details) from e
+        return Response(response.status_code, response.reason, response.headers, content)
+
+    def chunks(self, response, details):
+        try:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                yield chunk
+        except (RequestException, SSLError) as e:
+            raise requests_error(e, details) from e
+        finally:
+            response.close()
+
+    def close(self):
+        self.client.close()
+
+
+class RecordingTransport(Transport):
+    """Passes the requests on to another transport and records the responses, to be replayed by a ReplayTransport"""
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.records = []
+
+    def send(self, request):
+        response = self.transport.send(request)
+        if inspect.isawaitable(response):
+            return self.record_async(request, response)
+        self.record(request, response)
+        return response
+
+    async def record_async(self, request, awaitable):
+        response = await awaitable
+        self.record(request, response)
+        return response
+
+    def record(self, request, response):
+        self.records.append({
+            'method': request.method,
+            'url': request.url,
+            'status': response.status,
+            'reason': response.reason,
+            'headers': dict(response.headers.items()),
+            'body': base64.b64encode(response.body).decode(),
+        })
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.records, f, indent=1)
+
+    def close(self):
+        self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """Answers requests with recorded responses, without a network
+
+    Responses are looked up by key(request), the method and the url by
+    default, and served in the order they were recorded, the last one is
+    repeated. Override key() to leave out the parts of the url that change
+    from a run to another, like nonces and signatures.
+    """
+
+    def __init__(self, records=()):
+        self.responses = {}
+        for record in records:
+            self.add(Request(record['method'], record['url']), Response(record['status'], record['reason'], record['headers'], base64.b64decode(record['body'])))
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def key(self, request):
+        return request.method + ' ' + request.url
+
+    def add(self, request, response):
+        self.responses.setdefault(self.key(request), []).append(response)
+
+    def send(self, request):
+        responses = self.responses.get(self.key(request))
+        if not responses:
+            raise ExchangeError('no recorded response for ' + request.method + ' ' + request.url)
+        return responses.pop(0) if len(responses) > 1 else responses[0]
@@ -34,7 +34,17 @@ class binance(Exchange):
             'id': 'binance',
             'name': 'Binance',
             'countries': ['JP', 'MT'],  # Japan, Malta
-            'rateLimit': 500,
+            'rateLimit': 50,
+            'tokenBucket': {
+                'defaultCost': 10,  # the endpoints without a declared weight keep the pace of 500 ms they had
+            },
+            'rateLimitHeaders': {
+                'retryAfter': 'Retry-After',
+                'used': 'x-mbx-used-weight-1m',
+                'limit': 1200,
+                'window': 60000,
+                'weight': 1,  # binance weights per token, the costs are weights
+            },
             'certified': True,
             'pro': True,
             # new metainfo interface
@@ -265,26 +275,27 @@ class binance(Exchange):
                     ],
                 },
                 'dapiPublic': {
-                    'get': [
-                        'ping',
-                        'time',
-                        'exchangeInfo',
-                        'depth',
-                        'trades',
-                        'historicalTrades',
-                        'aggTrades',
-                        'premiumIndex',
-                        'fundingRate',
-                        'klines',
-                        'continuousKlines',
-                        'indexPriceKlines',
-                        'markPriceKlines',
-                        'ticker/24hr',
-                        'ticker/price',
-                        'ticker/bookTicker',
-                        'allForceOrders',
-                        'openInterest',
-                    ],
+                    # costs in the request weights of binance, the rateLimit of 50 ms is one weight, 1200 per minute
+                    'get': {
+                        'ping': 1,
+                        'time': 1,
+                        'exchangeInfo': 1,
+                        'depth': {'cost': 10, 'byLimit': [[50, 2], [100, 5], [500, 10], [1000, 20]]},
+                        'trades': 1,
+                        'historicalTrades': 20,
+                        'aggTrades': 20,
+                        'premiumIndex': 10,
+                        'fundingRate': 1,
+                        'klines': {'cost': 2, 'byLimit': [[99, 1], [499, 2], [1000, 5], [1500, 10]]},
+                        'continuousKlines': {'cost': 2, 'byLimit': [[99, 1], [499, 2], [1000, 5], [1500, 10]]},
+                        'indexPriceKlines': {'cost': 2, 'byLimit': [[99, 1], [499, 2], [1000, 5], [1500, 10]]},
+                        'markPriceKlines': {'cost': 2, 'byLimit': [[99, 1], [499, 2], [1000, 5], [1500, 10]]},
+                        'ticker/24hr': {'cost': 1, 'noSymbol': 40},
+                        'ticker/price': {'cost': 1, 'noSymbol': 2},
+                        'ticker/bookTicker': {'cost': 1, 'noSymbol': 2},
+                        'allForceOrders': {'cost': 20, 'noSymbol': 50},
+                        'openInterest': 1,
+                    },
                 },
                 'dapiData': {
                     'get': [
@@ -334,24 +345,25 @@ class binance(Exchange):
                     ],
                 },
                 'fapiPublic': {
-                    'get': [
-                        'ping',
-                        'time',
-                        'exchangeInfo',
-                        'depth',
-                        'trades',
-                        'historicalTrades',
-                        'aggTrades',
-                        'klines',
-                        'fundingRate',
-                        'premiumIndex',
-                        'ticker/24hr',
-                        'ticker/price',
-                        'ticker/bookTicker',
-                        'allForceOrders',
-                        'openInterest',
-                        'indexInfo',
-                    ],
+                    # costs in the request weights of binance, the rateLimit of 50 ms is one weight, 1200 per minute
+                    'get': {
+                        'ping': 1,
+                        'time': 1,
+                        'exchangeInfo': 1,
+                        'depth': {'cost': 10, 'byLimit': [[50, 2], [100, 5], [500, 10], [1000, 20]]},
+                        'trades': 1,
+                        'historicalTrades': 20,
+                        'aggTrades': 20,
+                        'klines': {'cost': 2, 'byLimit': [[99, 1], [499, 2], [1000, 5], [1500, 10]]},
+                        'fundingRate': 1,
+                        'premiumIndex': 1,
+                        'ticker/24hr': {'cost': 1, 'noSymbol': 40},
+                        'ticker/price': {'cost': 1, 'noSymbol': 2},
+                        'ticker/bookTicker': {'cost': 1, 'noSymbol': 2},
+                        'allForceOrders': {'cost': 20, 'noSymbol': 50},
+                        'openInterest': 1,
+                        'indexInfo': 1,
+                    },
                 },
                 'fapiData': {
                     'get': [
@@ -412,44 +424,46 @@ class binance(Exchange):
                     ],
                 },
                 'public': {
-                    'get': [
-                        'ping',
-                        'time',
-                        'depth',
-                        'trades',
-                        'aggTrades',
-                        'historicalTrades',
-                        'klines',
-                        'ticker/24hr',
-                        'ticker/price',
-                        'ticker/bookTicker',
-                        'exchangeInfo',
-                    ],
+                    # costs in the request weights of binance, the rateLimit of 50 ms is one weight, 1200 per minute
+                    'get': {
+                        'ping': 1,
+                        'time': 1,
+                        'depth': {'cost': 1, 'byLimit': [[100, 1], [500, 5], [1000, 10], [5000, 50]]},
+                        'trades': 1,
+                        'aggTrades': 1,
+                        'historicalTrades': 5,
+                        'klines': 1,
+                        'ticker/24hr': {'cost': 1, 'noSymbol': 40},
+                        'ticker/price': {'cost': 1, 'noSymbol': 2},
+                        'ticker/bookTicker': {'cost': 1, 'noSymbol': 2},
+                        'exchangeInfo': 10,
+                    },
                     'put': ['userDataStream'],
                     'post': ['userDataStream'],
                     'delete': ['userDataStream'],
                 },
                 'private': {
-                    'get': [
-                        'allOrderList',  # oco
-                        'openOrderList',  # oco
-                        'orderList',  # oco
-                        'order',
-                        'openOrders',
-                        'allOrders',
-                        'account',
-                        'myTrades',
-                    ],
-                    'post': [
-                        'order/oco',
-                        'order',
-                        'order/test',
-                    ],
-                    'delete': [
-                        'openOrders',  # added on 2020-04-25 for canceling all open orders per symbol
-                        'orderList',  # oco
-                        'order',
-                    ],
+                    # costs in the request weights of binance, the rateLimit of 50 ms is one weight, 1200 per minute
+                    'get': {
+                        'allOrderList': 10,  # oco
+                        'openOrderList': 3,  # oco
+                        'orderList': 2,  # oco
+                        'order': 2,
+                        'openOrders': {'cost': 3, 'noSymbol': 40},
+                        'allOrders': 10,
+                        'account': 10,
+                        'myTrades': 10,
+                    },
+                    'post': {
+                        'order/oco': 1,
+                        'order': 1,
+                        'order/test': 1,
+                    },
+                    'delete': {
+                        'openOrders': 1,  # added on 2020-04-25 for canceling all open orders per symbol
+                        'orderList': 1,  # oco
+                        'order': 1,
+                    },
                 },
             },
             'fees': {
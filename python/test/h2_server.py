@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+"""A local TLS server speaking HTTP/2 and HTTP/1.1, for the tests and benchmarks of the http2 option
+
+GET /time answers {"serverTime": ...} after the configured latency,
+GET /status/<code> answers with that status and {"code": <code>},
+GET /sleep/<milliseconds> answers after sleeping that long,
+GET /stats answers with the connections and requests served so far.
+"""
+
+import asyncio
+import datetime
+import ipaddress
+import json
+import os
+import ssl
+import tempfile
+import threading
+
+import h2.config
+import h2.connection
+import h2.events
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+# ------------------------------------------------------------------------------
+
+
+def ssl_context():
+    """A server context with a self-signed certificate for 127.0.0.1, negotiating h2 or http/1.1 by ALPN"""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, '127.0.0.1')])
+    now = datetime.datetime.utcnow()
+    certificate = x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key()) \
+        .serial_number(x509.random_serial_number()).not_valid_before(now).not_valid_after(now + datetime.timedelta(days=1)) \
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address('127.0.0.1'))]), critical=False) \
+        .sign(key, hashes.SHA256())
+    directory = tempfile.mkdtemp()
+    certfile = os.path.join(directory, 'cert.pem')
+    keyfile = os.path.join(directory, 'key.pem')
+    with open(certfile, 'wb') as f:
+        f.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(keyfile, 'wb') as f:
+        f.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()))
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(certfile, keyfile)
+    context.set_alpn_protocols(['h2', 'http/1.1'])
+    os.remove(certfile)
+    os.remove(keyfile)
+    os.rmdir(directory)
+    return context
+
+
+class Stats(object):
+
+    def __init__(self):
+        self.connections = {'h2': 0, 'http/1.1': 0}
+        self.requests = 0
+        self.max_streams = 0  # requests in flight on one connection
+
+    def summary(self):
+        return {'connections': self.connections, 'requests': self.requests, 'maxStreams': self.max_streams}
+
+
+async def respond(path, latency, stats):
+    """Returns the status and the body for a path"""
+    if path == '/stats':
+        return 200, json.dumps(stats.summary()).encode()
+    if path.startswith('/status/'):
+        code = int(path[len('/status/'):])
+        return code, json.dumps({'code': code}).encode()
+    if path.startswith('/sleep/'):
+        await asyncio.sleep(int(path[len('/sleep/'):]) / 1000)
+    elif latency:
+        await asyncio.sleep(latency / 1000)
+    return 200, json.dumps({'serverTime': 1600000000000}).encode()
+
+
+class ServerProtocol(asyncio.Protocol):
+
+    def __init__(self, stats, latency):
+        self.stats = stats
+        self.latency = latency
+        self.transport = None
+        self.h2 = None
+        self.buffer = b''
+        self.streams = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+        protocol = transport.get_extra_info('ssl_object').selected_alpn_protocol()
+        if protocol == 'h2':
+            self.h2 = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+            self.h2.initiate_connection()
+            self.transport.write(self.h2.data_to_send())
+        self.stats.connections[protocol or 'http/1.1'] += 1
+
+    def data_received(self, data):
+        if self.h2 is not None:
+            for event in self.h2.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    path = dict(event.headers)[b':path'].decode()
+                    self.spawn(self.respond_h2(event.stream_id, path))
+                elif isinstance(event, h2.events.DataReceived):
+                    self.h2.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            self.transport.write(self.h2.data_to_send())
+        else:
+            self.buffer += data
+            while b'\r\n\r\n' in self.buffer:
+                head, rest = self.buffer.split(b'\r\n\r\n', 1)
+                lines = head.decode().split('\r\n')
+                headers = dict(line.lower().split(': ', 1) for line in lines[1:])
+                length = int(headers.get('content-length', 0))
+                if len(rest) < length:
+                    return
+                self.buffer = rest[length:]
+                self.spawn(self.respond_http1(lines[0].split(' ')[1]))
+
+    def spawn(self, coroutine):
+        self.stats.requests += 1
+        self.streams += 1
+        self.stats.max_streams = max(self.stats.max_streams, self.streams)
+        asyncio.ensure_future(coroutine)
+
+    async def respond_h2(self, stream_id, path):
+        status, body = await respond(path, self.latency, self.stats)
+        self.streams -= 1
+        if self.transport.is_closing():
+            return
+        self.h2.send_headers(stream_id, [
+            (':status', str(status)),
+            ('content-type', 'application/json'),
+            ('content-length', str(len(body))),
+        ])
+        self.h2.send_data(stream_id, body, end_stream=True)
+        self.transport.write(self.h2.data_to_send())
+
+    async def respond_http1(self, path):
+        # responses to pipelined requests would have to be ordered, clients do not pipeline
+        status, body = await respond(path, self.latency, self.stats)
+        self.streams -= 1
+        if self.transport.is_closing():
+            return
+        self.transport.write(('HTTP/1.1 {} OK\r\nContent-Type: application/json\r\nContent-Length: {}\r\n\r\n'.format(status, len(body))).encode() + body)
+
+
+async def serve(latency=0, port=0):
+    """Starts a server on 127.0.0.1, returns it with its url and stats"""
+    stats = Stats()
+    context = ssl_context()
+    server = await asyncio.get_event_loop().create_server(lambda: ServerProtocol(stats, latency), '127.0.0.1', port, ssl=context)
+    url = 'https://127.0.0.1:' + str(server.sockets[0].getsockname()[1])
+    return server, url, stats
+
+
+def serve_in_thread(latency=0):
+    """Runs a server on an event loop of its own in a daemon thread, returns its url and stats"""
+    started = threading.Event()
+    result = {}
+
+    def run():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        server, result['url'], result['stats'] = loop.run_until_complete(serve(latency))
+        started.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, daemon=True).start()
+    started.wait()
+    return result['url'], result['stats']
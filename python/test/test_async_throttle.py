@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.throttle import throttle  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+async def test_fifo():
+    limiter = throttle({'refillRate': 1 / 20})
+    order = []
+
+    async def request(i):
+        await limiter(20)
+        order.append(i)
+
+    start = time.monotonic()
+    await asyncio.gather(*[request(i) for i in range(10)])
+    elapsed = time.monotonic() - start
+    assert order == list(range(10))
+    assert 0.15 < elapsed < 0.4
+    assert limiter.timer is None and not limiter.pending()
+
+
+async def test_burst_and_cost():
+    limiter = throttle({'refillRate': 1 / 20, 'capacity': 5})
+    start = time.monotonic()
+    await asyncio.gather(*[limiter(20) for i in range(5)])
+    assert time.monotonic() - start < 0.01
+    await limiter(20, 5)
+    assert 0.08 < time.monotonic() - start < 0.2
+
+
+async def test_cancellation():
+    limiter = throttle({'refillRate': 1 / 50})
+    await limiter(50)
+    head = limiter(50)  # holds the reservation, waits ~50 ms
+    queued = limiter(50)
+    last = limiter(50)
+    queued.cancel()
+    start = time.monotonic()
+    head.cancel()
+    # the tokens of the cancelled head are given back and the queued one is skipped,
+    # so the last request waits for one refill instead of three
+    await last
+    assert 0.03 < time.monotonic() - start < 0.09
+    assert limiter.timer is None and not limiter.pending()
+
+
+async def test_rate_limit_change():
+    limiter = throttle({'refillRate': 1 / 1000})
+    await limiter(1000)
+    start = time.monotonic()
+    await limiter(10)
+    assert time.monotonic() - start < 0.1
+    # also when it changed before the first request, the config holds the rateLimit the bucket was made for
+    limiter = throttle({'refillRate': 1 / 1000, 'rateLimit': 1000})
+    await limiter(10)
+    start = time.monotonic()
+    await limiter(10)
+    assert time.monotonic() - start < 0.1
+
+
+async def test_priorities():
+    limiter = throttle({'refillRate': 1 / 10})
+    await limiter(10)
+    order = []
+
+    async def request(name, priority):
+        await limiter(10, None, priority)
+        order.append(name)
+
+    tasks = [asyncio.ensure_future(request('market' + str(i), 'market')) for i in range(5)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.ensure_future(request('account', 'account')))
+    tasks.append(asyncio.ensure_future(request('trading', 'trading')))
+    tasks.append(asyncio.ensure_future(request('unknown', 'unknown')))
+    await asyncio.gather(*tasks)
+    # the first market request already holds its reservation, the others go after the higher lanes
+    assert order == ['market0', 'trading', 'account', 'market1', 'market2', 'market3', 'market4', 'unknown']
+
+
+async def test_starvation():
+    limiter = throttle({'refillRate': 1 / 10, 'starvationTimeout': 50})
+    await limiter(10)
+    order = []
+
+    async def request(name, priority):
+        await limiter(10, None, priority)
+        order.append(name)
+
+    tasks = [asyncio.ensure_future(request('market', 'market'))]
+    tasks += [asyncio.ensure_future(request('trading' + str(i), 'trading')) for i in range(10)]
+    await asyncio.gather(*tasks)
+    # the market request is not left behind all the trading ones
+    assert order.index('market') < 10
+
+
+class prioritized(Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(prioritized, self).describe(), {
+            'id': 'prioritized',
+            'enableRateLimit': True,
+            'api': {
+                'public': {'get': ['ticker']},
+                'private': {'get': ['balance'], 'post': ['order']},
+            },
+        })
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return {'url': path, 'method': method, 'headers': headers, 'body': params}
+
+    async def fetch(self, url, method='GET', headers=None, body=None):
+        return body
+
+
+async def test_exchange_priorities():
+    exchange = prioritized()
+    lanes = []
+
+    async def throttle(rate_limit, cost=None, priority=None):
+        lanes.append(priority)
+
+    exchange.throttle = throttle
+    await exchange.public_get_ticker()
+    await exchange.private_get_balance()
+    await exchange.private_post_order()
+    assert await exchange.public_get_ticker({'throttlePriority': 'trading', 'symbol': 'BTCUSD'}) == {'symbol': 'BTCUSD'}
+    assert lanes == ['market', 'account', 'trading', 'trading']
+    await exchange.close()
+
+
+async def main():
+    await test_fifo()
+    await test_burst_and_cost()
+    await test_cancellation()
+    await test_rate_limit_change()
+    await test_priorities()
+    await test_starvation()
+    await test_exchange_priorities()
+
+
+asyncio.get_event_loop().run_until_complete(main())
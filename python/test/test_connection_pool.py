@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+from requests.adapters import HTTPAdapter
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.connection_pool import SharedHTTPAdapter, close_shared_adapters  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+# sessions keep the requests defaults unless a pool is configured
+exchange = ccxt.Exchange()
+assert exchange.session.get_adapter('https://api.example.com')._pool_maxsize == 10
+
+sized = ccxt.Exchange({'connectionPool': {'poolMaxsize': 32, 'poolConnections': 4}})
+adapter = sized.session.get_adapter('https://api.example.com')
+assert type(adapter) is HTTPAdapter
+assert adapter._pool_maxsize == 32 and adapter._pool_connections == 4
+assert sized.session.get_adapter('http://api.example.com') is adapter
+
+# instances sharing a pool share the same adapter, and its connections outlive them
+config = {'connectionPool': {'poolMaxsize': 32, 'shared': True}}
+first = ccxt.Exchange(config)
+second = ccxt.binance(config)
+adapter = first.session.get_adapter('https://api.example.com')
+assert isinstance(adapter, SharedHTTPAdapter)
+assert second.session.get_adapter('https://api.binance.com') is adapter
+assert ccxt.Exchange({'connectionPool': {'poolMaxsize': 16, 'shared': True}}).session.get_adapter('https://api.example.com') is not adapter
+pool = adapter.poolmanager.connection_from_url('https://api.example.com')
+first.session.close()
+del first
+assert adapter.poolmanager.connection_from_url('https://api.example.com') is pool
+close_shared_adapters()
+assert adapter.poolmanager.connection_from_url('https://api.example.com') is not pool
+assert ccxt.Exchange(config).session.get_adapter('https://api.example.com') is not adapter
+
+# a session given in the config is used as it is
+session = ccxt.Exchange().session
+assert ccxt.Exchange({'session': session, 'connectionPool': {'poolMaxsize': 32}}).session is session
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+from aiohttp import web
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt.async_support as ccxt  # noqa: E402
+from ccxt.async_support.base import connector_pool  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+async def time(request):
+    return web.json_response({'serverTime': 1600000000000})
+
+
+async def main():
+    app = web.Application()
+    app.router.add_get('/time', time)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    url = 'http://127.0.0.1:' + str(site._server.sockets[0].getsockname()[1]) + '/time'
+    loop = asyncio.get_event_loop()
+
+    # instances of a loop with the same settings share one connector and its connections
+    config = {'connectionPool': {'shared': True, 'limitPerHost': 4, 'metrics': True}}
+    exchanges = [ccxt.Exchange(config) for i in range(3)]
+    for exchange in exchanges:
+        exchange.open()
+    connector = exchanges[0].session.connector
+    assert all(exchange.session.connector is connector for exchange in exchanges)
+    assert connector.limit_per_host == 4
+    responses = await asyncio.gather(*[exchange.fetch(url) for exchange in exchanges for i in range(10)])
+    assert all(response['serverTime'] == 1600000000000 for response in responses)
+    summary = exchanges[0].connection_metrics.summary()
+    assert summary['requests'] == 10
+    assert summary['latencyAverage'] > 0
+    assert 0 < summary['openConnections'] <= 4
+    created = sum(exchange.connection_metrics.connections_created for exchange in exchanges)
+    assert created <= 4
+
+    # the connector stays open until the last instance sharing it is closed
+    other = ccxt.Exchange({'connectionPool': {'shared': True, 'limitPerHost': 8}})
+    other.open()
+    assert other.session.connector is not connector
+    await exchanges[0].close()
+    await exchanges[1].close()
+    assert not connector.closed
+    assert (await exchanges[2].fetch(url))['serverTime'] == 1600000000000
+    await exchanges[2].close()
+    assert connector.closed
+    await other.close()
+    assert not connector_pool.registry[loop]
+
+    # an instance reopened after closing gets a new shared connector
+    exchange = ccxt.Exchange(config)
+    exchange.open()
+    assert not exchange.session.connector.closed
+    await exchange.close()
+
+    # without sharing each instance owns its connector
+    exchange = ccxt.Exchange({'connectionPool': {'ttlDnsCache': 300}})
+    exchange.open()
+    own = exchange.session.connector
+    assert exchange.connection_metrics is None
+    await exchange.close()
+    assert own.closed
+
+    await runner.cleanup()
+
+
+asyncio.get_event_loop().run_until_complete(main())
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+# generated api methods are built once per class
+
+first = ccxt.okex({'apiKey': 'one'})
+method = ccxt.okex.__dict__['general_get_time']
+second = ccxt.okex({'apiKey': 'two'})
+assert ccxt.okex.__dict__['general_get_time'] is method
+assert ccxt.okex.__dict__['_rest_api_defined']
+assert first.apiKey == 'one' and second.apiKey == 'two'
+
+# subclasses with their own api get their own methods
+assert '_rest_api_defined' not in ccxt.binanceus.__dict__
+binanceus = ccxt.binanceus()
+assert ccxt.binanceus.__dict__['_rest_api_defined']
+assert hasattr(binanceus, 'publicGetExchangeInfo')
+
+# ------------------------------------------------------------------------------
+# camelcase aliases are defined once per class
+
+kraken = ccxt.kraken({'custom_setting': 1})
+assert ccxt.kraken.fetchOHLCV is ccxt.kraken.fetch_ohlcv
+assert kraken.safeFloat({'a': '1.5'}, 'a') == 1.5
+assert kraken.customSetting == 1
+assert 'lastHttpResponse' not in kraken.__dict__
+kraken.last_http_response = 'response'
+assert kraken.lastHttpResponse == 'response'
+try:
+    kraken.doesNotExist
+    assert False
+except AttributeError:
+    pass
+
+# ------------------------------------------------------------------------------
+# describe() settings are shared by the class and copied on write per instance
+
+one = ccxt.binance({'options': {'defaultType': 'future'}})
+two = ccxt.binance()
+one.options['hasAlreadyAuthenticatedSuccessfully'] = True
+one.urls['api']['public'] = 'https://example.com'
+one.has['fetchTickers'] = False
+assert one.options['defaultType'] == 'future'
+assert two.options['defaultType'] == 'spot'
+assert two.options['hasAlreadyAuthenticatedSuccessfully'] is False
+assert two.urls['api']['public'] != 'https://example.com'
+assert two.has['fetchTickers'] is True
+assert ccxt.binance.has['fetchTickers'] is True
+assert ccxt.bitstamp().userAgent == ccxt.Exchange.userAgents['chrome']
+assert isinstance(ccxt.binance.urls, dict) and ccxt.binance.urls['api']['public'] == two.urls['api']['public']
+assert ccxt.Exchange.has['fetchOHLCV'] == 'emulated'
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+import threading
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base import http2  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+try:
+    http2.require_httpx()
+except ccxt.NotSupported:
+    # without httpx and h2 the option is refused rather than ignored
+    try:
+        ccxt.Exchange({'http2': True}).fetch('https://127.0.0.1/')
+        assert False
+    except ccxt.NotSupported:
+        pass
+    sys.exit(0)
+
+from h2_server import serve, serve_in_thread  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+url, stats = serve_in_thread(latency=20)
+
+exchange = ccxt.Exchange({'id': 'test', 'http2': True, 'verify': False, 'timeout': 1000})
+assert exchange.fetch(url + '/time') == {'serverTime': 1600000000000}
+assert exchange.last_http_response == '{"serverTime": 1600000000000}'
+assert exchange.last_response_headers['Content-Type'] == 'application/json'
+assert exchange.http2_client is not None
+assert stats.connections['h2'] == 1
+
+# each thread has a connection of its own, reused by its next requests
+clients = []
+
+
+def fetch_twice():
+    clients.append(exchange.open_http2_client().get())
+    exchange.fetch(url + '/time')
+    exchange.fetch(url + '/time')
+
+
+threads = [threading.Thread(target=fetch_twice) for i in range(4)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert len(set(clients)) == 4
+assert exchange.http2_client.get() not in clients
+assert stats.connections['h2'] == 5
+assert stats.requests == 9
+
+# errors are mapped as with the default transport
+try:
+    exchange.fetch(url + '/status/503')
+    assert False
+except ccxt.ExchangeNotAvailable:
+    pass
+
+try:
+    exchange.fetch(url + '/status/422')
+    assert False
+except ccxt.ExchangeError:
+    pass
+
+try:
+    exchange.fetch(url + '/sleep/3000')
+    assert False
+except ccxt.RequestTimeout:
+    pass
+
+try:
+    exchange.fetch('https://127.0.0.1:1/time')
+    assert False
+except ccxt.ExchangeNotAvailable:
+    pass
+
+# shared clients serve the instances configured alike
+config = {'id': 'test', 'http2': {'shared': True}, 'verify': False}
+first = ccxt.Exchange(config)
+second = ccxt.Exchange(config)
+first.fetch(url + '/time')
+second.fetch(url + '/time')
+assert first.http2_client is second.http2_client
+assert first.http2_client.get() is second.http2_client.get()
+http2.close_shared_clients()
+assert first.http2_client.is_closed
+assert first.http2_client.get() is not None  # reopened on demand
+
+# ------------------------------------------------------------------------------
+
+
+async def main():
+    server, url, stats = await serve(latency=20)
+
+    # concurrent requests of an async instance go over one connection
+    exchange = ccxt.async_support.Exchange({'id': 'test', 'http2': True, 'verify': False, 'timeout': 1000})
+    responses = await asyncio.gather(*[exchange.fetch(url + '/time') for i in range(50)])
+    assert all(response == {'serverTime': 1600000000000} for response in responses)
+    assert stats.connections['h2'] == 1
+    assert stats.max_streams > 10
+    assert exchange.session is None
+
+    try:
+        await exchange.fetch(url + '/status/418')
+        assert False
+    except ccxt.DDoSProtection:
+        pass
+
+    try:
+        await exchange.fetch(url + '/sleep/3000')
+        assert False
+    except ccxt.RequestTimeout:
+        pass
+
+    await exchange.close()
+    assert exchange.http2_client is None
+
+    # shared clients are closed with the last instance
+    config = {'id': 'test', 'http2': {'shared': True}, 'verify': False}
+    exchanges = [ccxt.async_support.Exchange(config) for i in range(3)]
+    await asyncio.gather(*[exchange.fetch(url + '/time') for exchange in exchanges])
+    client = exchanges[0].http2_client
+    assert all(exchange.http2_client is client for exchange in exchanges)
+    for exchange in exchanges[:2]:
+        await exchange.close()
+    assert not client.is_closed
+    await exchanges[2].close()
+    assert client.is_closed
+
+    server.close()
+    await server.wait_closed()
+
+
+asyncio.get_event_loop().run_until_complete(main())
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+import calendar
+import datetime
+import os
+import random
+import re
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+# the methods as they were before the fast paths, the reference of their results
+
+
+def iso8601(timestamp=None):
+    if timestamp is None:
+        return timestamp
+    if not isinstance(timestamp, int):
+        return None
+    if int(timestamp) < 0:
+        return None
+
+    try:
+        utc = datetime.datetime.utcfromtimestamp(timestamp // 1000)
+        return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + "{:03d}".format(int(timestamp) % 1000) + 'Z'
+    except (TypeError, OverflowError, OSError):
+        return None
+
+
+def parse8601(timestamp=None):
+    if timestamp is None:
+        return timestamp
+    yyyy = '([0-9]{4})-?'
+    mm = '([0-9]{2})-?'
+    dd = '([0-9]{2})(?:T|[\\s])?'
+    h = '([0-9]{2}):?'
+    m = '([0-9]{2}):?'
+    s = '([0-9]{2})'
+    ms = '(\\.[0-9]{1,3})?'
+    tz = '(?:(\\+|\\-)([0-9]{2})\\:?([0-9]{2})|Z)?'
+    regex = r'' + yyyy + mm + dd + h + m + s + ms + tz
+    try:
+        match = re.search(regex, timestamp, re.IGNORECASE)
+        if match is None:
+            return None
+        yyyy, mm, dd, h, m, s, ms, sign, hours, minutes = match.groups()
+        ms = ms or '.000'
+        ms = (ms + '00')[0:4]
+        msint = int(ms[1:])
+        sign = sign or ''
+        sign = int(sign + '1') * -1
+        hours = int(hours or 0) * sign
+        minutes = int(minutes or 0) * sign
+        offset = datetime.timedelta(hours=hours, minutes=minutes)
+        string = yyyy + mm + dd + h + m + s + ms + 'Z'
+        dt = datetime.datetime.strptime(string, "%Y%m%d%H%M%S.%fZ")
+        dt = dt + offset
+        return calendar.timegm(dt.utctimetuple()) * 1000 + msint
+    except (TypeError, OverflowError, OSError, ValueError):
+        return None
+
+
+def outcome(function, *args):
+    try:
+        return ('value', function(*args))
+    except Exception as e:
+        return ('error', type(e))
+
+
+# ------------------------------------------------------------------------------
+
+random.seed(1)
+
+# formatting, including the same second and day over and over
+timestamps = [None, 0, 1, 999, 1000, True, False, -1, 1.5, '1', 1577836800000, 1577836800999, 951782400000, 4102444800000,
+              253402300799999, 253402300800000, 10 ** 20, 2 ** 64]
+timestamps += [random.randint(0, 4102444800000) for i in range(20000)]
+start = random.randint(0, 4102444800000)
+timestamps += [start + i * random.randint(0, 50) for i in range(20000)]
+for timestamp in timestamps:
+    assert outcome(Exchange.iso8601, timestamp) == outcome(iso8601, timestamp), timestamp
+
+# parsing, the layouts of the exchanges and their edge cases
+strings = [
+    None, '', 'abc', 1, b'2020-01-01T00:00:00.000Z', ['2020-01-01T00:00:00.000Z'],
+    '2020-01-01T00:00:00.000Z', '2020-01-01T00:00:00Z', '2020-01-01T00:00:00.5Z', '2020-01-01T00:00:00.12Z',
+    '2020-01-01T00:00:00.123456Z', '2020-01-01T00:00:00.123456789Z', '2020-01-01T00:00:00.123456+02:00',
+    '2020-01-01T00:00:00+02:00', '2020-01-01T00:00:00-0530', '2020-01-01T00:00:00.123+0230', '2020-01-01 00:00:00',
+    '20200101T000000Z', '20200101000000', 'x2020-01-01T00:00:00Zy', '2020-01-01T00:00:00z', '2020-01-01t00:00:00Z',
+    '2020-02-29T12:00:00.000Z', '2019-02-29T12:00:00.000Z', '2020-13-01T00:00:00.000Z', '2020-00-10T00:00:00.000Z',
+    '2020-01-01T24:00:00.000Z', '2020-01-01T23:60:00.000Z', '2020-01-01T23:59:60.000Z', '2020-01-01T23:59:61Z',
+    '0000-01-01T00:00:00.000Z', '0001-01-01T00:00:00.000Z', '0001-01-01T00:00:00+01:00', '0001-01-01T00:00:00-01:00',
+    '9999-12-31T23:59:59.999Z', '9999-12-31T23:59:59.999-01:00', '9999-12-31T23:59:59.999+01:00', '1969-12-31T23:59:59.999Z',
+    '2020-01-01T00:00:00.000', '2020-01-01T00:00:00.0a0Z', '2020-01-0aT00:00:00.000Z', '２０２０-01-01T00:00:00.000Z',
+    '2020-01-01T00:00:00.000Z ', ' 2020-01-01T00:00:00.000Z', '2020-01-01T00:00:00+99:99', '2020-01-01T00:00:00 +02:00',
+    '1234567890123456', '2020-01-01T00:00:00,000Z', '2020-01-01\t00:00:00.000Z', '2020/01/01T00:00:00.000Z',
+    # digits of other scripts and line ends in the fields read by the fast path
+    '2020-01-01T00:00:0\u0661.123Z', '2020-01-01T00:00:0\u0661Z', '2020-01-01T0\u0661:00:00.000Z', '2020-01-01T00:00:01.12\u0663Z',
+    '2020-01-01T00:00:1\n.000Z', '2020-01-01T00:00:01.12\nZ', '2020-01-01T00:0\n:00Z',
+]
+for i in range(20000):
+    timestamp = random.randint(0, 4102444800000)
+    strings.append(iso8601(timestamp))
+    strings.append(iso8601(timestamp)[:19] + 'Z')
+    strings.append(iso8601(timestamp)[:19] + random.choice(['+', '-']) + '%02d:%02d' % (random.randint(0, 23), random.randint(0, 59)))
+    strings.append(iso8601(timestamp)[:random.randint(19, 24)])
+alphabet = '0123456789-:.TZtz+ '
+for i in range(20000):
+    # digits and separators shuffled around the common layout
+    string = list(random.choice(strings[-80000:]))
+    for j in range(random.randint(1, 3)):
+        string[random.randrange(len(string))] = random.choice(alphabet)
+    strings.append(''.join(string))
+for string in strings:
+    assert outcome(Exchange.parse8601, string) == outcome(parse8601, string), string
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.json_codec import codecs, get_codec  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+text = '{"bids":[["0.1","2"]],"asks":[],"id":123456789012345678901234567890,"nan":NaN,"name":"\\u00e9t\\u00e9"}'
+expected = ccxt.Exchange.unjson(text)
+
+for name in list(codecs) + ['unknown']:
+    exchange = ccxt.Exchange({'jsonCodec': name})
+    # str and bytes decode the same, including what only the standard library accepts
+    for payload in (text, text.encode('utf-8')):
+        decoded = exchange.parse_json(payload)
+        assert decoded['id'] == expected['id']
+        assert decoded['nan'] != decoded['nan']
+        assert decoded['bids'] == expected['bids']
+        assert decoded['name'] == expected['name']
+    assert exchange.parse_json(b'[1,2]') == [1, 2]
+    assert exchange.parse_json(b'<html></html>') is None
+    assert exchange.parse_json(b'{"broken":') is None
+    assert exchange.parse_json(b'{"invalid":"\xff"}') == {'invalid': u'�'}
+    assert exchange.parse_json('') is None
+    # request bodies go through the same codec
+    assert exchange.unjson(exchange.json({'a': [1, 'b', None, True]})) == {'a': [1, 'b', None, True]}
+
+assert get_codec().name == 'json'
+assert get_codec('unknown').name == 'json'
+assert ccxt.Exchange({'jsonCodec': 'orjson'}).json is not ccxt.Exchange.json
+assert ccxt.Exchange().json is ccxt.Exchange.json
+
+# responses are decoded once, the standard library parses the text of the response and the binary codecs its bytes
+from ccxt.base.transport import Request, Response  # noqa: E402
+
+
+class Recorder(object):
+
+    def __init__(self, binary):
+        self.binary = binary
+        self.received = []
+
+    def loads(self, data):
+        self.received.append(type(data))
+        return get_codec('json').loads(data)
+
+    def dumps(self, value):
+        return get_codec('json').dumps(value)
+
+
+for binary, received in ((False, str), (True, bytes)):
+    recorder = Recorder(binary)
+    exchange = ccxt.Exchange({'jsonCodec': recorder})
+    response = Response(200, 'OK', {'Content-Type': 'application/json'}, text.encode('utf-8'))
+    assert exchange.handle_rest_response(Request('GET', 'https://api.example.com'), response)['bids'] == expected['bids']
+    assert recorder.received == [received]
+assert get_codec('json').binary is False and get_codec('orjson').binary is (get_codec('orjson').name == 'orjson')
+
+# the text of a body is only made when something reads it
+
+
+class CountingResponse(Response):
+
+    __slots__ = ()
+    decoded = 0
+
+    def text(self):
+        CountingResponse.decoded += 1
+        return Response.text(self)
+
+
+def decodes(exchange, status=200):
+    CountingResponse.decoded = 0
+    response = CountingResponse(status, 'OK', {'Content-Type': 'application/json'}, text.encode('utf-8'))
+    try:
+        exchange.handle_rest_response(Request('GET', 'https://api.example.com'), response)
+    except ccxt.BaseError:
+        pass
+    return CountingResponse.decoded
+
+
+assert decodes(ccxt.Exchange({'jsonCodec': Recorder(True), 'lean': True})) == 0
+assert decodes(ccxt.Exchange({'id': 'test', 'jsonCodec': Recorder(True), 'lean': True}), 400) == 1
+assert decodes(ccxt.Exchange({'jsonCodec': Recorder(False), 'lean': True})) == 1
+exchange = ccxt.Exchange({'jsonCodec': Recorder(True)})
+assert decodes(exchange) == 1 and exchange.last_http_response == text
+assert decodes(ccxt.binance({'jsonCodec': Recorder(True), 'lean': True})) == 1  # handle_errors reads the body
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from aiohttp import web
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base import json_stream  # noqa: E402
+from ccxt.base.transport import Response, Transport  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+if json_stream.ijson is None:
+    # without ijson the option is refused rather than ignored
+    try:
+        json_stream.JsonStreamParser()
+        assert False
+    except ccxt.NotSupported:
+        pass
+    sys.exit(0)
+
+# ------------------------------------------------------------------------------
+
+
+def parse(data, size, numeric_keys=('bids', 'asks')):
+    parser = json_stream.JsonStreamParser(numeric_keys)
+    for i in range(0, len(data), size):
+        parser.feed(data[i:i + size])
+    return parser.close()
+
+
+# any document parses as with json.loads(), whatever the chunks
+document = {
+    'a': [1, -2, 3.5, 1e-8, 12345678901234567890, 'text', 'ünïcode', None, True, False, [], {}],
+    'b': {'c': {'d': [[{'e': 'f'}]]}, 'g': '1.5'},
+    'h': '',
+}
+data = json.dumps(document).encode()
+for size in (1, 2, 3, 7, 64, len(data)):
+    assert parse(data, size) == document
+assert parse(b'[1,"2",[3]]', 1) == [1, '2', [3]]
+assert parse(b'"x"', 1) == 'x'
+assert parse(b'null', 1) is None
+
+# the rows of the arrays under the numeric keys hold floats, other values are left alone
+book = {
+    'lastUpdateId': 1027024,
+    'bids': [['4.00000000', '431.00000000'], ['3.99', 2]],
+    'asks': [['4.00000200', '12.00000000', 'order-id']],
+    'result': {'XXBTZUSD': {'bids': [['10718.5', '0.0125', 1600000000]], 'info': ['1', '2']}},
+    'trades': [['1', '2']],
+}
+parsed = parse(json.dumps(book).encode(), 5)
+assert parsed['bids'] == [[4.0, 431.0], [3.99, 2]]
+assert parsed['asks'] == [[4.000002, 12.0, 'order-id']]
+assert parsed['result']['XXBTZUSD']['bids'] == [[10718.5, 0.0125, 1600000000]]
+assert parsed['result']['XXBTZUSD']['info'] == ['1', '2']
+assert parsed['trades'] == [['1', '2']]
+assert parsed['lastUpdateId'] == 1027024
+assert parse(json.dumps(book).encode(), 5, ['trades'])['trades'] == [[1.0, 2.0]]
+
+# invalid and truncated documents are refused
+for invalid in (b'{"a": }', b'{"a": [1, 2', b'[1]]', b''):
+    try:
+        parse(invalid, 2)
+        assert False
+    except ValueError:
+        pass
+
+# ------------------------------------------------------------------------------
+
+levels = [['%.8f' % (10000 - i * 0.01), '%.8f' % (i + 0.5)] for i in range(2000)]
+depth = {'lastUpdateId': 1, 'bids': levels, 'asks': levels[::-1]}
+body = json.dumps(depth).encode()
+
+
+class ChunkedTransport(Transport):
+
+    def __init__(self, body):
+        self.body = body
+        self.requests = []
+
+    def send(self, request):
+        self.requests.append(request)
+        chunks = (self.body[i:i + 100] for i in range(0, len(self.body), 100))
+        return Response(200, 'OK', {'Content-Type': 'application/json'}, None, chunks)
+
+
+# the responses of a transport are parsed as they stream in, the books are the same
+transport = ChunkedTransport(body)
+exchange = ccxt.Exchange({'id': 'test', 'transport': transport, 'streamingJson': {'threshold': 1000}})
+streamed = exchange.parse_order_book(exchange.fetch('https://api.example.com/depth'))
+expected = ccxt.Exchange().parse_order_book(depth)
+assert streamed['bids'] == expected['bids']
+assert streamed['asks'] == expected['asks']
+assert transport.requests[0].stream == 1000
+assert exchange.last_http_response == body[:1024].decode()
+
+# a real exchange, through its own parsing
+binance = ccxt.binance({'transport': ChunkedTransport(body), 'streamingJson': True})
+binance.set_markets([{'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'spot': True, 'future': False, 'delivery': False}])
+book = binance.fetch_order_book('BTC/USDT', 1000)
+assert book['bids'] == expected['bids']
+assert book['nonce'] == 1
+
+# levels of a zero amount are kept, as their strings were before the conversion
+zero = json.dumps({'bids': [['1.00000000', '0.00000000'], ['0.99000000', '2.00000000']], 'asks': []}).encode()
+for format in ('list', 'array'):
+    exchange = ccxt.Exchange({'id': 'test', 'transport': ChunkedTransport(zero), 'streamingJson': True, 'orderBookFormat': format})
+    book = exchange.parse_order_book(exchange.fetch('https://api.example.com/depth'))
+    assert [list(level) for level in book['bids']] == [[1.0, 0.0], [0.99, 2.0]]
+
+# an invalid document is handled like an invalid body, the response is returned as text
+exchange.transport = ChunkedTransport(b'{"bids": [[1, 2]], "asks": ' + b' ' * 2000)
+assert exchange.fetch('https://api.example.com/depth').startswith('{"bids": [[1, 2]]')
+
+# ------------------------------------------------------------------------------
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        payload = body if self.path == '/depth' else b'{"serverTime":1}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = 'http://127.0.0.1:' + str(server.server_address[1])
+
+# the default transport streams the large responses only
+exchange = ccxt.Exchange({'id': 'test', 'streamingJson': {'threshold': 10000}})
+assert exchange.parse_order_book(exchange.fetch(url + '/depth'))['asks'] == expected['asks']
+assert exchange.last_http_response == body[:1024].decode()
+assert exchange.fetch(url + '/time') == {'serverTime': 1}
+assert exchange.last_http_response == '{"serverTime":1}'
+server.shutdown()
+
+# ------------------------------------------------------------------------------
+
+
+async def depth_handler(request):
+    return web.Response(body=body, content_type='application/json')
+
+
+async def main():
+    app = web.Application()
+    app.router.add_get('/depth', depth_handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    url = 'http://127.0.0.1:' + str(site._server.sockets[0].getsockname()[1])
+
+    exchange = ccxt.async_support.Exchange({'id': 'test', 'streamingJson': {'threshold': 10000}})
+    response = await exchange.fetch(url + '/depth')
+    assert exchange.parse_order_book(response)['bids'] == expected['bids']
+    assert response['bids'][0] == [10000.0, 0.5]
+    await exchange.close()
+
+    # synchronous chunks from a transport of your own work in async_support too
+    exchange = ccxt.async_support.Exchange({'id': 'test', 'transport': ChunkedTransport(body), 'streamingJson': True})
+    assert (await exchange.fetch('https://api.example.com/depth'))['asks'][0] == [float(levels[-1][0]), float(levels[-1][1])]
+    await exchange.close()
+
+    await runner.cleanup()
+
+
+asyncio.get_event_loop().run_until_complete(main())
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+script = '''
+import sys
+import ccxt
+assert 'ccxt.binance' not in sys.modules
+assert 'binance' in ccxt.exchanges
+assert 'binance' in dir(ccxt)
+# binanceus imports binance as its parent, both must resolve to classes
+assert ccxt.binanceus().id == 'binanceus'
+assert isinstance(ccxt.binance, type)
+assert issubclass(ccxt.binanceus, ccxt.binance)
+assert 'ccxt.kraken' not in sys.modules
+try:
+    ccxt.foobar
+    assert False
+except AttributeError:
+    pass
+'''
+
+# a submodule imported before the class is accessed, the id is still bound to the class
+imported_first = '''
+import ccxt
+import ccxt.async_support
+from ccxt.kraken import kraken
+import ccxt.async_support.bitstamp
+assert ccxt.kraken is kraken and isinstance(ccxt.kraken, type)
+assert ccxt.kraken().id == 'kraken'
+assert isinstance(ccxt.async_support.bitstamp, type)
+assert ccxt.async_support.bitstamp.__module__ == 'ccxt.async_support.bitstamp'
+'''
+
+# the opt-in transports and their dependencies are imported on their first use
+optional = '''
+import sys
+import ccxt
+for module in ('httpx', 'h2', 'ccxt.base.http2', 'numpy'):
+    assert module not in sys.modules, module
+'''
+
+for lazy in ('', '1'):
+    subprocess.check_call([sys.executable, '-c', optional], env=dict(os.environ, PYTHONPATH=root, CCXT_LAZY_IMPORT=lazy), cwd=root)
+
+if sys.version_info >= (3, 7):
+    env = dict(os.environ, PYTHONPATH=root, CCXT_LAZY_IMPORT='1')
+    for source in (script, imported_first):
+        subprocess.check_call([sys.executable, '-c', source], env=env, cwd=root)
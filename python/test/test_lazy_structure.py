@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import json
+import os
+import pickle
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.lazy_structure import LazyStructure  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+markets = [
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'spot': True, 'future': False, 'delivery': False, 'precision': {'amount': 8, 'price': 8}},
+]
+trades = [{'id': i, 'price': '4.00000100', 'qty': '12.00000000', 'time': 1499865549590 + i * 137, 'isBuyerMaker': True, 'isBestMatch': True} for i in range(50)]
+orders = [{
+    'symbol': 'BTCUSDT', 'orderId': 28, 'clientOrderId': '6gCrw2kRUAF9CvJDGP16IP', 'transactTime': 1507725176595,
+    'price': '0.00000000', 'origQty': '10.00000000', 'executedQty': '10.00000000', 'cummulativeQuoteQty': '10.00000000',
+    'status': 'FILLED', 'timeInForce': 'GTC', 'type': 'MARKET', 'side': 'SELL',
+    'fills': [{'price': '4000.00000000', 'qty': '1.00000000', 'commission': '4.00000000', 'commissionAsset': 'USDT'}],
+}]
+deposits = [{'insertTime': 1508198532000, 'amount': 0.04670582, 'asset': 'ETH', 'address': '0x6915f16f8791d0a1cc2bf47c13a6b2a92000504b', 'txId': '0xdf33b22bdb2b28b1f75ccd201a4a4m6e7g83jy5fc5d5a9d1340961598cfcb0a1', 'status': 1}]
+
+
+def exchanges(config={}):
+    exchange = ccxt.binance(config)
+    exchange.set_markets(markets)
+    return exchange
+
+
+eager = exchanges()
+lazy = exchanges({'lazyStructures': True})
+lean = exchanges({'lazyStructures': {'info': False}})
+market = eager.market('BTC/USDT')
+
+# the same structures, with the same datetime
+for method, data, args in (('parse_trades', trades, (market,)), ('parse_orders', orders, ()), ('parse_transactions', deposits, ())):
+    expected = getattr(eager, method)(data, *args)
+    result = getattr(lazy, method)(data, *args)
+    assert all(type(structure) is LazyStructure for structure in result)
+    assert all(not dict.__contains__(structure, 'datetime') for structure in result)
+    assert result == expected
+    assert [structure['datetime'] for structure in result] == [structure['datetime'] for structure in expected]
+    assert [list(structure.keys()) for structure in result] == [list(structure.keys()) for structure in expected]
+    assert json.loads(json.dumps(result)) == json.loads(json.dumps(expected))
+    # without info
+    stripped = getattr(lean, method)(data, *args)
+    assert all(structure['info'] is None for structure in stripped)
+    assert [eager.omit(structure, ['info', 'trades']) for structure in stripped] == [eager.omit(structure, ['info', 'trades']) for structure in expected]
+
+# the nested trades of orders too
+assert type(lazy.parse_orders(orders)[0]['trades'][0]) is LazyStructure
+assert lean.parse_orders(orders)[0]['trades'][0]['info'] is None
+
+# since, limit and params as before
+assert lazy.parse_trades(trades, market, trades[10]['time'], 5) == eager.parse_trades(trades, market, trades[10]['time'], 5)
+assert lazy.parse_trades(trades, market, None, None, {'type': 'limit'}) == eager.parse_trades(trades, market, None, None, {'type': 'limit'})
+assert lazy.parse_trades(trades, market, None, None, {'datetime': 'given'})[0]['datetime'] == 'given'
+
+# a 'datetime' the exchange gives in another form than that of the timestamp is kept
+hollaex = [ccxt.hollaex(config) for config in ({}, {'lazyStructures': True})]
+for exchange in hollaex:
+    exchange.set_markets([{'id': 'btc-usdt', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT'}])
+raw = [{'symbol': 'btc-usdt', 'size': 0.5, 'price': 8830, 'side': 'buy', 'timestamp': timestamp} for timestamp in ('2020-03-03T04:44:33Z', '2020-03-03T04:44:33.034Z')]
+expected, result = [exchange.parse_trades(raw) for exchange in hollaex]
+assert result == expected and [trade['datetime'] for trade in result] == ['2020-03-03T04:44:33Z', '2020-03-03T04:44:33.034Z']
+assert dict.__contains__(result[0], 'datetime') and not dict.__contains__(result[1], 'datetime')
+assert lazy.lazy_structure({'id': 1})['id'] == 1 and 'datetime' not in lazy.lazy_structure({'id': 1})
+
+
+# ledger entries, one or several per item
+class Ledger(ccxt.Exchange):
+
+    def parse_ledger_entry(self, item, currency=None):
+        entry = {'id': item['id'], 'timestamp': item['time'], 'datetime': self.iso8601(item['time']), 'currency': 'BTC', 'amount': 1.0, 'info': item}
+        return [entry, self.extend(entry, {'id': item['id'] + 'b'})] if item['double'] else entry
+
+
+items = [{'id': 'a', 'time': 1601556386932, 'double': False}, {'id': 'b', 'time': 1601556386000, 'double': True}]
+assert Ledger({'lazyStructures': True}).parse_ledger(items) == Ledger().parse_ledger(items)
+assert len(Ledger({'lazyStructures': True}).parse_ledger(items)) == 3
+
+# a LazyStructure is read like a dict
+structure = lazy.parse_trades(trades, market)[0]
+expected = eager.parse_trades(trades, market)[0]
+assert 'datetime' in structure and len(structure) == len(expected)
+assert structure.get('datetime') == expected['datetime'] == dict(structure)['datetime'] == {**structure}['datetime']
+assert dict(structure.items()) == expected and list(structure.values()) == list(expected.values())
+assert copy.copy(structure) == copy.deepcopy(structure) == pickle.loads(pickle.dumps(structure)) == structure.copy() == expected
+assert type(copy.deepcopy(structure)) is LazyStructure
+assert structure.to_dict() == expected and type(structure.to_dict()) is dict
+assert repr(structure) == repr(expected)
+assert ccxt.Exchange.extend(structure, {'a': 1})['datetime'] == expected['datetime']
+assert LazyStructure({'id': 1})['datetime'] is None
+try:
+    structure['missing']
+    assert False
+except KeyError:
+    pass
+structure['datetime'] = 'set'
+assert structure['datetime'] == 'set' and len(structure) == len(expected)
+
+# the encoders of the codecs see the 'datetime' too, orjson included
+structure = lazy.parse_trades(trades, market)[0]
+expected = eager.parse_trades(trades, market)[0]
+for codec in ('json', 'orjson'):
+    exchange = exchanges({'jsonCodec': codec})
+    assert json.loads(exchange.json(structure)) == json.loads(json.dumps(expected)), codec
+    assert json.loads(exchange.dump_json([structure])) == json.loads(json.dumps([expected])), codec
+
+# pop(), setdefault(), popitem() and del treat the 'datetime' as the other keys
+structure = lazy.parse_trades(trades, market)[0]
+assert structure.setdefault('datetime', 'x') == expected['datetime'] and structure.virtual()
+assert structure.pop('datetime', 'none') == expected['datetime']
+assert 'datetime' not in structure and structure.get('datetime') is None and len(structure) == len(expected) - 1
+assert structure.pop('datetime', 'none') == 'none'
+assert structure.to_dict() == eager.omit(expected, 'datetime') and structure == eager.omit(expected, 'datetime')
+assert 'datetime' not in copy.copy(structure) and 'datetime' not in pickle.loads(pickle.dumps(structure)) and 'datetime' not in structure.copy()
+try:
+    structure['datetime']
+    assert False
+except KeyError:
+    pass
+assert structure.setdefault('datetime', 'x') == 'x' and structure['datetime'] == 'x'
+structure = lazy.parse_trades(trades, market)[0]
+del structure['datetime']
+assert 'datetime' not in structure and list(structure) == [key for key in expected if key != 'datetime']
+structure = LazyStructure({'id': 1, 'timestamp': 1499865549590})
+assert structure.popitem() == ('datetime', '2017-07-12T13:19:09.590Z')
+assert structure.popitem() == ('timestamp', 1499865549590)
+structure = LazyStructure({'timestamp': 1499865549590, 'id': 1})
+assert structure.popitem() == ('id', 1)
+assert structure.popitem() == ('datetime', '2017-07-12T13:19:09.590Z')
+assert structure.popitem() == ('timestamp', 1499865549590)
+try:
+    structure.popitem()
+    assert False
+except KeyError:
+    pass
+assert LazyStructure({'id': 1}).popitem() == ('datetime', None)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import threading
+
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class Session(object):
+    """Answers every request with the same body, and a Sequence header counting the requests"""
+
+    def __init__(self, body):
+        self.body = body
+        self.sequence = 0
+        self.cookies = CaseInsensitiveDict()
+
+    def request(self, method, url, **kwargs):
+        self.sequence += 1
+        response = Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = url
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/json', 'Sequence': str(self.sequence)})
+        response._content = self.body
+        return response
+
+    def close(self):
+        pass
+
+
+body = b'{"bid":[{"quantity":"0.0125","rate":"10718.56"}],"ask":[{"quantity":"0.051","rate":"10724.30"}]}'
+
+# ------------------------------------------------------------------------------
+
+# by default the last responses are kept on the instance
+exchange = ccxt.Exchange({'session': Session(body)})
+exchange.fetch('https://api.example.com')
+assert exchange.last_http_response == body.decode()
+assert exchange.last_json_response['bid'][0]['rate'] == '10718.56'
+assert exchange.last_response_headers['Sequence'] == '1'
+assert exchange.lastResponseHeaders['Sequence'] == '1'
+
+# lean instances keep none of them, the headers only reach the call that made the request
+lean = ccxt.Exchange({'session': Session(body), 'lean': True})
+assert lean.fetch('https://api.example.com')['ask'][0]['quantity'] == '0.051'
+assert lean.last_http_response is None
+assert lean.last_json_response is None
+assert lean.__dict__.get('_last_response_headers') is None
+assert lean.last_response_headers['Sequence'] == '1'
+
+other = ccxt.Exchange({'session': Session(body), 'lean': True})
+assert other.last_response_headers is None
+other.fetch('https://api.example.com')
+assert lean.last_response_headers is None
+
+seen = []
+thread = threading.Thread(target=lambda: seen.append(lean.last_response_headers))
+thread.start()
+thread.join()
+assert seen == [None]
+
+# bittrex takes the order book nonce from the Sequence header of its own response
+bittrex = ccxt.bittrex({'session': Session(body), 'lean': True})
+bittrex.set_markets([{'id': 'BTC-USD', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD'}])
+bittrex.session.sequence = 41
+orderbook = bittrex.fetch_order_book('BTC/USD')
+assert orderbook['nonce'] == 42
+assert orderbook['bids'] == [[10718.56, 0.0125]]
+assert bittrex.last_json_response is None
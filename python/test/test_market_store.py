@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.market_store import market_store  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class mockexchange(ccxt.Exchange):
+
+    fetches = 0
+
+    def describe(self):
+        return self.deep_extend(super(mockexchange, self).describe(), {
+            'id': 'mockexchange',
+            'urls': {'api': 'https://api.example.com'},
+            'options': {'defaultType': 'spot'},
+        })
+
+    def fetch_markets(self, params={}):
+        mockexchange.fetches += 1
+        return [
+            {'id': 'foobar', 'symbol': 'FOO/BAR', 'base': 'FOO', 'quote': 'BAR', 'precision': {'amount': 8, 'price': 8}},
+            {'id': 'bazbar', 'symbol': 'BAZ/BAR', 'base': 'BAZ', 'quote': 'BAR', 'precision': {'amount': 8, 'price': 8}},
+        ]
+
+
+# ------------------------------------------------------------------------------
+
+first = mockexchange({'shareMarkets': True})
+second = mockexchange({'shareMarkets': True})
+first.load_markets()
+second.load_markets()
+assert mockexchange.fetches == 1
+assert first.markets is second.markets
+assert first.currencies_by_id is second.currencies_by_id
+assert second.markets_version == 1
+
+key = first.market_store_key()
+assert market_store.count(key) == 2
+# the markets are applied after the structures derived from them
+assert list(market_store.get(key).values)[-1] == 'markets'
+
+# a reload swaps the snapshot for every attached instance
+first.load_markets(True)
+assert mockexchange.fetches == 2
+assert second.markets is first.markets
+assert second.markets_version == 2
+
+# other api types and unshared instances keep their own markets
+future = mockexchange({'shareMarkets': True, 'options': {'defaultType': 'future'}})
+future.load_markets()
+assert mockexchange.fetches == 3
+assert future.markets is not first.markets
+own = mockexchange()
+own.load_markets()
+assert own.markets is not first.markets
+
+# the snapshot is dropped with the last instance referencing it
+del first, second
+gc.collect()
+assert market_store.count(key) == 0
+assert market_store.get(key) is None
+
+# ------------------------------------------------------------------------------
+
+# the state an exchange derives from its markets is rebuilt on every instance
+
+
+class krakenmock(ccxt.kraken):
+
+    fetches = 0
+
+    def request(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        krakenmock.fetches += 1
+        return {'result': {'XXBTZUSD': {
+            'altname': 'XBTUSD', 'base': 'XXBT', 'quote': 'ZUSD', 'lot_decimals': 8, 'pair_decimals': 1,
+            'fees': [[0, 0.26]], 'fees_maker': [[0, 0.16]], 'ordermin': '0.0001',
+        }}}
+
+
+config = {'shareMarkets': True, 'has': {'fetchCurrencies': False}}
+first = krakenmock(config)
+second = krakenmock(config)
+first.load_markets()
+second.load_markets()
+assert krakenmock.fetches == 1
+assert second.find_market_by_altname_or_id('XBTUSD')['symbol'] == 'BTC/USD'
+first.load_markets(True)
+assert krakenmock.fetches == 2
+assert second.find_market_by_altname_or_id('XBTUSD') is second.markets['BTC/USD']
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.markets_cache import FileMarketsCache  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class mockexchange(ccxt.Exchange):
+
+    fetches = 0
+
+    def describe(self):
+        return self.deep_extend(super(mockexchange, self).describe(), {
+            'id': 'mockexchange',
+            'has': {'fetchCurrencies': True},
+            'urls': {
+                'api': 'https://api.example.com',
+                'test': 'https://testnet.example.com',
+            },
+            'options': {'defaultType': 'spot'},
+        })
+
+    def fetch_currencies(self, params={}):
+        return {'FOO': {'id': 'foo', 'code': 'FOO', 'precision': 8}}
+
+    def fetch_markets(self, params={}):
+        mockexchange.fetches += 1
+        return [
+            {'id': 'foobar', 'symbol': 'FOO/BAR', 'base': 'FOO', 'quote': 'BAR', 'precision': {'amount': 8, 'price': 8}},
+        ]
+
+
+# ------------------------------------------------------------------------------
+
+directory = tempfile.mkdtemp()
+try:
+    for format in ('json',):
+        mockexchange.fetches = 0
+        config = {'marketsCache': {'directory': directory, 'ttl': 60000, 'format': format}}
+        first = mockexchange(config)
+        first.load_markets()
+        second = mockexchange(config)
+        second.load_markets()
+        assert mockexchange.fetches == 1
+        assert second.markets == first.markets
+        assert second.currencies['FOO']['id'] == 'foo'
+        assert second.markets['FOO/BAR']['limits'] == first.markets['FOO/BAR']['limits']
+
+        # reload bypasses the cache, other options and the sandbox have their own entries
+        second.load_markets(True)
+        assert mockexchange.fetches == 2
+        mockexchange(ccxt.Exchange.extend(config, {'options': {'defaultType': 'future'}})).load_markets()
+        assert mockexchange.fetches == 3
+        sandbox = mockexchange(config)
+        sandbox.set_sandbox_mode(True)
+        sandbox.load_markets()
+        assert mockexchange.fetches == 4
+
+        # runtime state in the options keeps the same entry
+        runtime = mockexchange(config)
+        runtime.options['timeDifference'] = 1234
+        runtime.options['nonce'] = {'last': 1}
+        assert runtime.markets_cache_key() == first.markets_cache_key()
+        runtime.load_markets()
+        assert mockexchange.fetches == 4
+
+    # pickle is not a format, it would run the code of any file planted in the directory
+    try:
+        mockexchange({'marketsCache': {'directory': directory, 'format': 'pickle'}}).get_markets_cache()
+        assert False
+    except ValueError:
+        pass
+
+    # expired and corrupt entries are fetched again
+    mockexchange.fetches = 0
+    config = {'marketsCache': {'directory': directory, 'ttl': 1000}}
+    exchange = mockexchange(config)
+    path = exchange.get_markets_cache().path(exchange.markets_cache_key())
+    past = time.time() - 10
+    os.utime(path, (past, past))
+    exchange.load_markets()
+    assert mockexchange.fetches == 1
+    with open(path, 'w') as file:
+        file.write('{"markets": [')
+    mockexchange(config).load_markets()
+    assert mockexchange.fetches == 2
+
+    # entries and directories others can write to are not read, the default directory is private to the user
+    if hasattr(os, 'getuid'):
+        mockexchange.fetches = 0
+        shared = os.path.join(directory, 'shared')
+        config = {'marketsCache': {'directory': shared, 'ttl': 60000}}
+        exchange = mockexchange(config)
+        exchange.load_markets()
+        mockexchange(config).load_markets()
+        assert mockexchange.fetches == 1
+        os.chmod(exchange.get_markets_cache().path(exchange.markets_cache_key()), 0o666)
+        mockexchange(config).load_markets()
+        assert mockexchange.fetches == 2
+        os.chmod(shared, 0o777)
+        mockexchange(config).load_markets()
+        mockexchange(config).load_markets()
+        assert mockexchange.fetches == 4
+
+        assert FileMarketsCache().directory.endswith('ccxt-markets-' + str(os.getuid()))
+        private = os.path.join(directory, 'private')
+        FileMarketsCache(private).save({'id': 'foo'}, [])
+        assert os.stat(private).st_mode & 0o777 == 0o700
+        assert FileMarketsCache(private).load({'id': 'foo'}) == ([], None)
+
+    # the state an exchange derives from its markets is rebuilt from the cached ones
+    class krakenmock(ccxt.kraken):
+
+        fetches = 0
+
+        def request(self, path, api='public', method='GET', params={}, headers=None, body=None):
+            krakenmock.fetches += 1
+            return {'result': {'XXBTZUSD': {
+                'altname': 'XBTUSD', 'base': 'XXBT', 'quote': 'ZUSD', 'lot_decimals': 8, 'pair_decimals': 1,
+                'fees': [[0, 0.26]], 'fees_maker': [[0, 0.16]], 'ordermin': '0.0001',
+            }}}
+
+    config = {'marketsCache': {'directory': os.path.join(directory, 'kraken'), 'ttl': 60000}, 'has': {'fetchCurrencies': False}}
+    krakenmock(config).load_markets()
+    cached = krakenmock(config)
+    cached.load_markets()
+    assert krakenmock.fetches == 1
+    assert cached.find_market_by_altname_or_id('XBTUSD') is cached.markets['BTC/USD']
+
+    # without a cache nothing is written
+    fetches = mockexchange.fetches
+    mockexchange().load_markets()
+    mockexchange().load_markets()
+    assert mockexchange.fetches == fetches + 2
+finally:
+    shutil.rmtree(directory)
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+import os
+import random
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import numeric_book  # noqa: E402
+from ccxt.base.numeric_book import NumericBookSide  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+random.seed(1)
+prices = [round(random.uniform(9000, 11000), 1) for i in range(500)]  # with repeated prices
+raw = {
+    'bids': [['%.2f' % price, '%.8f' % random.uniform(0, 2)] for price in prices] + [['1.0', '0'], ['0', '1.0']],
+    'asks': [[price, random.uniform(0, 2)] for price in prices],
+}
+dicts = {
+    'bids': [{'price': '%.2f' % price, 'size': i + 1} for i, price in enumerate(prices)] + [{'price': '1.0'}],
+    'asks': [],
+}
+
+try:
+    numeric_book.require_numpy()  # numpy is imported on first use
+except ccxt.NotSupported:
+    pass
+
+lists = ccxt.Exchange()
+formats = ['array'] if numeric_book.numpy is None else ['array', 'numpy']
+
+if numeric_book.numpy is None:
+    # without numpy the format is refused rather than ignored
+    try:
+        ccxt.Exchange({'orderBookFormat': 'numpy'}).parse_order_book(raw)
+        assert False
+    except ccxt.NotSupported:
+        pass
+
+for orderbook_format in formats:
+    exchange = ccxt.Exchange({'orderBookFormat': orderbook_format})
+
+    # the same books as with lists of pairs
+    for data, args in ((raw, ()), (dicts, (None, 'bids', 'asks', 'price', 'size'))):
+        expected = lists.parse_order_book(data, *args)
+        book = exchange.parse_order_book(data, *args)
+        assert isinstance(book['bids'], NumericBookSide)
+        assert book['bids'] == expected['bids']
+        assert book['asks'] == expected['asks']
+        assert book['bids'].to_list() == expected['bids']
+        assert len(book['bids']) == len(expected['bids'])
+        assert list(book['asks']) == expected['asks']
+        # the sides are read like lists
+        assert book['bids'][0] == expected['bids'][0]
+        assert book['bids'][-1] == expected['bids'][-1]
+        assert book['bids'][:10] == expected['bids'][:10]
+        assert book['bids'][0][0] == max(prices)
+        # sorted and aggregated
+        for key in (0, 1):
+            for descending in (False, True):
+                assert exchange.sort_by(book['bids'], key, descending) == lists.sort_by(expected['bids'], key, descending)
+        assert exchange.sort_by(exchange.aggregate(book['bids']), 0, True) == lists.sort_by(lists.aggregate(expected['bids']), 0, True)
+        assert exchange.sort_by(exchange.aggregate(book['asks']), 0) == lists.sort_by(lists.aggregate(expected['asks']), 0)
+
+    # a sorted side is not copied
+    side = exchange.parse_order_book(raw)['asks']
+    assert exchange.sort_by(side, 0) is side
+
+    # exchanges with a parse_bid_ask() or a parse_bids_asks() of their own
+    kraken = ccxt.kraken({'orderBookFormat': orderbook_format})
+    levels = {'bids': [['10718.5', '0.0125', 1600000000], ['10719.5', '1.5', 1600000001]], 'asks': []}
+    assert kraken.parse_order_book(levels)['bids'] == [[10719.5, 1.5], [10718.5, 0.0125]]
+    btcalpha = ccxt.btcalpha({'orderBookFormat': orderbook_format})
+    levels = {'buy': [{'price': '10', 'amount': '1'}], 'sell': [{'price': '11', 'amount': '2'}]}
+    book = btcalpha.parse_order_book(levels, None, 'buy', 'sell', 'price', 'amount')
+    expected = ccxt.btcalpha().parse_order_book(levels, None, 'buy', 'sell', 'price', 'amount')
+    assert isinstance(book['asks'], NumericBookSide)
+    assert book['asks'] == expected['asks'] == [[11.0, 2.0]]
+
+    # fetch_l2_order_book() aggregates the fetched book
+    class Fetched(ccxt.Exchange):
+        def fetch_order_book(self, symbol, limit=None, params={}):
+            return self.parse_order_book(raw)
+
+    l2 = Fetched({'orderBookFormat': orderbook_format}).fetch_l2_order_book('BTC/USDT')
+    expected = Fetched().fetch_l2_order_book('BTC/USDT')
+    assert l2['bids'] == expected['bids']
+    assert l2['asks'] == expected['asks']
+
+    # empty books
+    book = exchange.parse_order_book({'bids': [], 'asks': []})
+    assert len(book['bids']) == 0 and book['bids'] == []
+    assert exchange.aggregate(book['asks']) == []
+
+# the backends hold the same values
+if numeric_book.numpy is not None:
+    side = NumericBookSide([3.0, 1.0, 2.0], [1.0, 2.0, 3.0])
+    vectorized = NumericBookSide([3.0, 1.0, 2.0], [1.0, 2.0, 3.0], True)
+    assert side == vectorized
+    assert side.sorted() == vectorized.sorted() == [[1.0, 2.0], [2.0, 3.0], [3.0, 1.0]]
+    assert type(vectorized[0][0]) is float
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import os
+import random
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import ohlcv_columns  # noqa: E402
+from ccxt.base.ohlcv_columns import OHLCVColumns  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+random.seed(1)
+start = 1591478520000
+# binance klines, with the close time, the quote volume and the other fields after the candle
+rows = [[start + i * 60000] + ['%.8f' % random.uniform(1, 2) for j in range(5)] + [start + i * 60000 + 59999, '0.5', 40, '1', '1', '0'] for i in range(1000)]
+shuffled = rows[:]
+random.shuffle(shuffled)
+okex = [['2018-12-17T20:%02d:00.000Z' % i, '0.1', '0.2', '0.05', '0.15', '10'] for i in range(60)]
+flat = [[start + i * 60000, '1.5', '1.5', '1.5', '1.5', '0'] for i in range(20)]
+empty = [[start + i * 60000, '1.5', '', None, '1.5', '0'] for i in range(20)]
+
+try:
+    ohlcv_columns.require_numpy()  # numpy is imported on first use
+except ccxt.NotSupported:
+    pass
+formats = ['array'] if ohlcv_columns.numpy is None else ['array', 'numpy']
+
+if ohlcv_columns.numpy is None:
+    # without numpy the format is refused rather than ignored
+    try:
+        ccxt.binance({'ohlcvFormat': 'numpy'}).parse_ohlcvs(rows)
+        assert False
+    except ccxt.NotSupported:
+        pass
+
+for ohlcv_format in formats:
+    for exchange_id in ('binance', 'bitfinex', 'okex'):
+        lists = getattr(ccxt, exchange_id)()
+        exchange = getattr(ccxt, exchange_id)({'ohlcvFormat': ohlcv_format})
+        # the same candles as with lists, sorted, from since and up to limit
+        for data in (rows, rows[::-1], shuffled, flat, empty):
+            for since, limit in ((None, None), (rows[500][0], None), (None, 100), (rows[500][0], 10)):
+                expected = lists.parse_ohlcvs(data, None, '1m', since, limit)
+                candles = exchange.parse_ohlcvs(data, None, '1m', since, limit)
+                assert isinstance(candles, OHLCVColumns)
+                assert candles == expected
+                assert len(candles) == len(expected)
+        # the candles are read like lists
+        expected = lists.parse_ohlcvs(rows)
+        candles = exchange.parse_ohlcvs(rows)
+        assert candles[0] == expected[0]
+        assert candles[-1] == expected[-1]
+        assert candles[10:20] == expected[10:20]
+        assert candles.to_list() == expected
+        assert type(candles[0][0]) is int and type(candles[0][1]) is float
+
+    # the layouts of the exchanges are inferred from their parse_ohlcv()
+    assert ccxt.binance().ohlcv_indexes(rows) == [0, 1, 2, 3, 4, 5]
+    assert ccxt.bitfinex().ohlcv_indexes(rows) == [0, 1, 3, 4, 2, 5]  # open, close, high, low
+    assert ccxt.okex().ohlcv_indexes(rows) == [0, 1, 2, 3, 4, 6]  # the base volume of futures
+    # or given, or converted one by one when they cannot be told apart
+    assert ccxt.bitfinex({'ohlcvColumns': [0, 1, 3, 4, 2, 5]}).ohlcv_indexes(flat) == [0, 1, 3, 4, 2, 5]
+    assert ccxt.bitfinex().ohlcv_indexes(flat) is None
+    assert ccxt.okex().ohlcv_indexes(okex) is None
+    exchange = ccxt.okex({'ohlcvFormat': ohlcv_format})
+    assert exchange.parse_ohlcvs(okex) == ccxt.okex().parse_ohlcvs(okex)
+    assert exchange.parse_ohlcvs([{'time': '2018-12-17T20:28:00.000Z', 'open': '1', 'high': '2', 'low': '0.5', 'close': '1.5', 'volume': '10'}]) == [[1545078480000, 1.0, 2.0, 0.5, 1.5, 10.0]]
+
+    # empty responses
+    assert len(ccxt.binance({'ohlcvFormat': ohlcv_format}).parse_ohlcvs([])) == 0
+    assert ccxt.binance({'ohlcvFormat': ohlcv_format}).parse_ohlcvs([]) == []
+
+# the backends hold the same values
+if ohlcv_columns.numpy is not None:
+    candles = OHLCVColumns.from_rows(shuffled)
+    vectorized = OHLCVColumns.from_rows(shuffled, vectorized=True)
+    assert candles == vectorized
+    assert type(vectorized[0][0]) is int and type(vectorized[0][1]) is float
+    assert vectorized.timestamps.dtype == ohlcv_columns.numpy.int64
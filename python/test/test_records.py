@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import json
+import os
+import pickle
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.records import Fee, Order, Trade  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+markets = [
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'spot': True, 'future': False, 'delivery': False, 'precision': {'amount': 8, 'price': 8}},
+]
+trades = [{
+    'id': i, 'orderId': 100 + i // 3, 'price': '4.00000100', 'qty': '12.00000000', 'commission': '0.1', 'commissionAsset': 'BNB',
+    'time': 1499865549590 + i * 137, 'isBuyer': True, 'isMaker': False, 'isBestMatch': True,
+} for i in range(50)]
+orders = [{
+    'symbol': 'BTCUSDT', 'orderId': 28, 'clientOrderId': '6gCrw2kRUAF9CvJDGP16IP', 'transactTime': 1507725176595,
+    'price': '0.00000000', 'origQty': '10.00000000', 'executedQty': '10.00000000', 'cummulativeQuoteQty': '10.00000000',
+    'status': 'FILLED', 'timeInForce': 'GTC', 'type': 'MARKET', 'side': 'SELL',
+    'fills': [{'price': '4000.00000000', 'qty': '1.00000000', 'commission': '4.00000000', 'commissionAsset': 'USDT'}],
+}]
+
+
+def exchanges(config={}):
+    exchange = ccxt.binance(config)
+    exchange.set_markets(markets)
+    return exchange
+
+
+plain = exchanges()
+records = exchanges({'structureRecords': True})
+lean = exchanges({'structureRecords': {'info': False}})
+market = plain.market('BTC/USDT')
+
+# the same structures, keys and datetime
+for method, data, args, record in (('parse_trades', trades, (market,), Trade), ('parse_orders', orders, (), Order)):
+    expected = getattr(plain, method)(data, *args)
+    result = getattr(records, method)(data, *args)
+    assert all(type(structure) is record for structure in result)
+    assert result == expected and expected == result
+    assert [structure.to_dict() for structure in result] == expected
+    assert [structure['datetime'] for structure in result] == [structure['datetime'] for structure in expected]
+    assert [sorted(structure.keys()) for structure in result] == [sorted(structure.keys()) for structure in expected]
+    assert json.loads(json.dumps([structure.to_dict() for structure in result])) == json.loads(json.dumps(expected))
+    # without info
+    stripped = getattr(lean, method)(data, *args)
+    assert all(structure['info'] is None for structure in stripped)
+    assert [plain.omit(structure.to_dict(), ['info', 'trades']) for structure in stripped] == [plain.omit(structure, ['info', 'trades']) for structure in expected]
+
+# the fees and the nested trades of orders too
+order = records.parse_orders(orders)[0]
+assert type(order['trades'][0]) is Trade and type(order['trades'][0]['fee']) is Fee
+assert type(records.parse_trades(trades, market)[0].fee) is Fee
+assert lean.parse_orders(orders)[0]['trades'][0]['info'] is None
+
+# since, limit and params as before
+assert records.parse_trades(trades, market, trades[10]['time'], 5) == plain.parse_trades(trades, market, trades[10]['time'], 5)
+assert records.parse_trades(trades, market, None, None, {'type': 'limit', 'extra': 1}) == plain.parse_trades(trades, market, None, None, {'type': 'limit', 'extra': 1})
+assert records.parse_trades(trades, market, None, None, {'datetime': 'given'})[0]['datetime'] == 'given'
+
+# a 'datetime' the exchange gives in another form than that of the timestamp is kept
+hollaex = [ccxt.hollaex(config) for config in ({}, {'structureRecords': True})]
+for exchange in hollaex:
+    exchange.set_markets([{'id': 'btc-usdt', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT'}])
+raw = [{'symbol': 'btc-usdt', 'size': 0.5, 'price': 8830, 'side': 'buy', 'timestamp': timestamp} for timestamp in ('2020-03-03T04:44:33Z', '2020-03-03T04:44:33.034Z')]
+expected, result = [exchange.parse_trades(raw) for exchange in hollaex]
+assert result == expected and [trade['datetime'] for trade in result] == ['2020-03-03T04:44:33Z', '2020-03-03T04:44:33.034Z']
+assert result[0].extra == {'datetime': '2020-03-03T04:44:33Z'} and result[1].extra is None
+assert list(result[0]) == list(expected[0]) and result[0].to_dict() == expected[0]
+assert Trade.from_dict(dict(expected[0], other=1))['datetime'] == '2020-03-03T04:44:33Z'
+assert Trade.from_dict(dict(expected[1], other=1)).extra == {'other': 1}
+
+# a record is read like a dict
+structure = records.parse_trades(trades, market)[0]
+expected = plain.parse_trades(trades, market)[0]
+assert 'datetime' in structure and 'missing' not in structure and len(structure) == len(expected)
+assert structure.get('datetime') == structure.datetime == expected['datetime'] == dict(structure)['datetime'] == {**structure}['datetime']
+assert structure.price == structure['price'] == expected['price'] and structure.get('missing', 1) == 1
+assert dict(structure.items()) == expected and sorted(structure.values(), key=repr) == sorted(expected.values(), key=repr)
+assert copy.copy(structure) == copy.deepcopy(structure) == pickle.loads(pickle.dumps(structure)) == expected
+assert type(pickle.loads(pickle.dumps(structure))) is Trade
+assert structure.to_dict() == expected and type(structure.to_dict()) is dict and type(structure.to_dict()['fee']) is dict
+assert repr(structure) == repr(structure.to_dict())
+assert ccxt.Exchange.extend(structure, {'a': 1})['datetime'] == expected['datetime']
+assert Trade.from_dict({'id': 1})['datetime'] is None and len(Trade.from_dict({'id': 1})) == 2
+assert structure != [] and structure != dict(expected, price=0)
+for key in ('missing', 'to_dict', '__class__'):
+    try:
+        structure[key]
+        assert False
+    except KeyError:
+        pass
+structure['price'] = 5.0
+structure['other'] = 'set'
+structure['datetime'] = 'set'
+assert structure.price == 5.0 and structure['other'] == 'set' and structure['datetime'] == 'set' and len(structure) == len(expected) + 1
+try:
+    structure.unknown = 1
+    assert False
+except AttributeError:
+    pass
+
+# the helpers of the exchange take records as the dicts they replace
+result = records.parse_trades(trades, market)
+expected = plain.parse_trades(trades, market)
+fee = {'cost': 1.0, 'currency': 'USDT'}
+assert ccxt.Exchange.deep_extend(result[0], {'fee': fee}) == ccxt.Exchange.deep_extend(expected[0], {'fee': fee})
+assert ccxt.Exchange.deep_extend(result[0], {'fee': fee})['price'] == expected[0]['price']
+assert ccxt.Exchange.deep_extend({'a': 1}, result[0])['fee'] == expected[0]['fee']
+assert ccxt.Exchange.omit(result[0], 'info', ['fee']) == ccxt.Exchange.omit(expected[0], 'info', ['fee'])
+assert 'info' not in ccxt.Exchange.omit(result[0], 'info') and 'info' in result[0]
+assert json.loads(plain.json(result)) == json.loads(plain.json(expected))
+assert json.loads(ccxt.Exchange.json(result[0])) == json.loads(ccxt.Exchange.json(expected[0]))
+for codec in ('json', 'orjson'):
+    encoder = exchanges({'jsonCodec': codec})
+    assert json.loads(encoder.json(result)) == json.loads(encoder.dump_json(result)) == json.loads(plain.json(expected))
+assert json.loads(plain.json(records.parse_orders(orders))) == json.loads(plain.json(plain.parse_orders(orders)))
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+import collections
+import os
+import sys
+from decimal import Decimal
+from numbers import Number
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+# the accessors as they were before the dict and list paths, the reference of their semantics
+
+
+def key_exists(dictionary, key):
+    if dictionary is None or key is None:
+        return False
+    if isinstance(dictionary, list):
+        if isinstance(key, int) and 0 <= key and key < len(dictionary):
+            return dictionary[key] is not None
+        else:
+            return False
+    if key in dictionary:
+        return dictionary[key] is not None
+    return False
+
+
+def safe_float(dictionary, key, default_value=None):
+    value = default_value
+    try:
+        if key_exists(dictionary, key):
+            value = float(dictionary[key])
+    except ValueError:
+        value = default_value
+    return value
+
+
+def safe_string(dictionary, key, default_value=None):
+    return str(dictionary[key]) if key_exists(dictionary, key) else default_value
+
+
+def safe_string_lower(dictionary, key, default_value=None):
+    return str(dictionary[key]).lower() if key_exists(dictionary, key) else default_value
+
+
+def safe_string_upper(dictionary, key, default_value=None):
+    return str(dictionary[key]).upper() if key_exists(dictionary, key) else default_value
+
+
+def safe_integer(dictionary, key, default_value=None):
+    if not key_exists(dictionary, key):
+        return default_value
+    value = dictionary[key]
+    if isinstance(value, Number) or (isinstance(value, str) and value.isnumeric()):
+        return int(value)
+    return default_value
+
+
+def safe_integer_product(dictionary, key, factor, default_value=None):
+    if not key_exists(dictionary, key):
+        return default_value
+    value = dictionary[key]
+    if isinstance(value, Number):
+        return int(value * factor)
+    elif isinstance(value, str):
+        try:
+            return int(float(value) * factor)
+        except ValueError:
+            pass
+    return default_value
+
+
+def safe_timestamp(dictionary, key, default_value=None):
+    return safe_integer_product(dictionary, key, 1000, default_value)
+
+
+def safe_value(dictionary, key, default_value=None):
+    return dictionary[key] if key_exists(dictionary, key) else default_value
+
+
+reference = {
+    'safe_float': safe_float,
+    'safe_string': safe_string,
+    'safe_string_lower': safe_string_lower,
+    'safe_string_upper': safe_string_upper,
+    'safe_integer': safe_integer,
+    'safe_timestamp': safe_timestamp,
+    'safe_value': safe_value,
+}
+
+# ------------------------------------------------------------------------------
+
+values = [None, '', '1.5', '-2', '42', 'abc', 'ABC', 0, 7, -3, 1.25, 0.0, True, False, Decimal('2.5'), [], {}, [1], {'a': 1}]
+containers = []
+for value in values:
+    containers.append({'key': value, 0: value, 1: value, True: value})
+    containers.append([value, value])
+    containers.append(collections.OrderedDict([('key', value)]))
+    containers.append(ccxt.Exchange.extend({}, {'key': value}))
+containers.extend([None, {}, [], (1, 2), 'key', {None: 1}])
+keys = ['key', 'missing', 0, 1, 2, -1, True, None]
+
+
+def outcome(function, *args):
+    try:
+        return ('value', function(*args))
+    except Exception as e:
+        return ('error', type(e))
+
+
+def same(a, b):
+    return a == b and type(a[1]) is type(b[1])
+
+
+# the same results, errors and types as before, for any container, key and default
+for name, function in reference.items():
+    accessor = getattr(Exchange, name)
+    for container in containers:
+        for key in keys:
+            for default in (None, 'default'):
+                expected = outcome(function, container, key, default)
+                assert same(outcome(accessor, container, key, default), expected), (name, container, key, default)
+                # and through an instance and the camelCase alias
+                assert same(outcome(getattr(ccxt.Exchange(), name), container, key, default), expected)
+
+# the _2 accessors fall back to the second key
+for name in ('safe_float', 'safe_string', 'safe_string_lower', 'safe_string_upper', 'safe_integer', 'safe_timestamp', 'safe_value'):
+    accessor = getattr(Exchange, name + '_2')
+    for container in containers:
+        for key1, key2 in (('key', 'missing'), ('missing', 'key'), ('missing', 'other'), (0, 1), (5, 1)):
+            first = outcome(reference[name], container, key1)
+            expected = first if first[0] == 'error' or first[1] is not None else outcome(reference[name], container, key2, 'default')
+            assert same(outcome(accessor, container, key1, key2, 'default'), expected), (name, container, key1, key2)
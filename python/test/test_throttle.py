@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import threading
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.throttle import TokenBucket  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def timed(function, *args):
+    start = time.monotonic()
+    function(*args)
+    return time.monotonic() - start
+
+
+# one request per rateLimit by default, the first one goes immediately
+exchange = ccxt.Exchange({'rateLimit': 50})
+assert timed(exchange.throttle) < 0.01
+assert 0.03 < timed(exchange.throttle) < 0.1
+
+# a larger capacity allows bursts, costs are taken per call
+exchange = ccxt.Exchange({'rateLimit': 50, 'tokenBucket': {'capacity': 4}})
+assert timed(lambda: [exchange.throttle() for i in range(4)]) < 0.01
+assert 0.03 < timed(exchange.throttle) < 0.1
+exchange = ccxt.Exchange({'rateLimit': 20, 'tokenBucket': {'capacity': 5}})
+assert timed(exchange.throttle, 5) < 0.01
+assert 0.08 < timed(exchange.throttle, 5) < 0.2
+
+# threads sharing an instance are spaced as a whole
+exchange = ccxt.Exchange({'rateLimit': 20})
+stamps = []
+
+
+def worker():
+    for i in range(5):
+        exchange.throttle()
+        stamps.append(time.monotonic())
+
+
+threads = [threading.Thread(target=worker) for i in range(4)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+stamps.sort()
+assert stamps[-1] - stamps[0] > 0.3
+
+# refunds and disabled limits
+bucket = TokenBucket({'refillRate': 0.001})
+assert bucket.reserve() == 0
+bucket.refund()
+assert bucket.reserve() == 0
+assert 0.9 < bucket.reserve() < 1.1
+assert TokenBucket({'refillRate': float('inf')}).reserve(100) == 0
+assert timed(ccxt.Exchange({'rateLimit': 0}).throttle) < 0.01
+
+# ------------------------------------------------------------------------------
+
+
+class weighted(ccxt.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(weighted, self).describe(), {
+            'id': 'weighted',
+            'enableRateLimit': True,
+            'api': {
+                'public': {
+                    'get': {
+                        'time': 1,
+                        'depth': {'cost': 1, 'byLimit': [[100, 1], [500, 5], [1000, 10], [5000, 50]]},
+                    },
+                    'post': ['order'],
+                },
+                'sapi': {
+                    'margin': {
+                        'get': {'loan': 5},
+                    },
+                },
+            },
+        })
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return {'url': path, 'method': method, 'headers': headers, 'body': body}
+
+    def fetch(self, url, method='GET', headers=None, body=None):
+        return {}
+
+
+exchange = weighted()
+costs = []
+exchange.throttle = lambda cost, rate_limit=None: costs.append(cost)
+exchange.public_get_time()
+exchange.publicGetDepth()
+exchange.public_get_depth({'limit': 500})
+exchange.public_get_depth({'limit': '5000'})
+exchange.public_get_depth({'limit': 10000})
+exchange.public_post_order()
+exchange.sapi_margin_get_loan()
+assert costs == [1, 1, 5, 50, 50, None, 5]
+
+# the request weights binance declares, its rateLimit is one weight
+binance = ccxt.binance()
+costs = []
+binance.throttle = lambda cost, rate_limit=None: costs.append(cost)
+binance.sign = lambda path, api='public', method='GET', params={}, headers=None, body=None: {'url': path, 'method': method, 'headers': headers, 'body': body}
+binance.fetch = lambda url, method='GET', headers=None, body=None: {}
+binance.enableRateLimit = True
+binance.public_get_depth({'limit': 100})
+binance.public_get_depth({'limit': 5000})
+binance.fapiPublicGetDepth({'limit': 1000})
+binance.dapiPublicGetDepth()
+binance.public_get_time()
+binance.private_get_account()
+binance.publicGetTicker24hr()
+binance.publicGetTicker24hr({'symbol': 'BTCUSDT'})
+binance.privateGetOpenOrders({'symbol': 'BTCUSDT'})
+binance.sapiGetMarginLoan()
+assert costs == [1, 50, 20, 10, 1, 10, 40, 1, 3, None]
+# a light request is paced by 50 ms, the undeclared ones by 500 ms as before
+assert binance.rateLimit == 50 and binance.tokenBucket['defaultCost'] == 10
+assert binance.calculate_rate_limiter_cost('public', 'GET', 'ticker/24hr', {}) == 40
+binance = ccxt.binance({'enableRateLimit': True})
+assert timed(binance.throttle, 1) < 0.01
+assert 0.03 < timed(binance.throttle, 1) < 0.1
+assert 0.4 < timed(binance.throttle) < 0.6
+assert exchange.calculate_rate_limiter_cost('public', 'GET', 'unknown', {}) is None
+assert ccxt.Exchange().calculate_rate_limiter_cost('public', 'GET', 'time', {}) is None
+
+# ------------------------------------------------------------------------------
+
+from requests.structures import CaseInsensitiveDict  # noqa: E402
+
+# the bucket follows the budget reported by the exchange
+exchange = ccxt.Exchange({'rateLimit': 10, 'adaptiveRateLimit': True, 'tokenBucket': {'capacity': 10}})
+bucket = exchange.throttle.bucket
+exchange.handle_rate_limit_headers(CaseInsensitiveDict({'x-ratelimit-remaining': '3'}))
+assert bucket.tokens == 3
+# a window ending in 1 s refills 100 tokens, 30 remaining leave a debt of 70, 0.7 s
+exchange.handle_rate_limit_headers(CaseInsensitiveDict({'X-RateLimit-Remaining': '30', 'X-RateLimit-Reset': '1'}))
+assert -71 < bucket.tokens < -69
+assert 0.65 < timed(exchange.throttle) < 0.9
+exchange.handle_rate_limit_headers(CaseInsensitiveDict({'Retry-After': '0.2'}))
+assert 0.15 < timed(exchange.throttle) < 0.4
+time.sleep(0.05)
+exchange.handle_rate_limit_headers(CaseInsensitiveDict({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}))
+assert timed(exchange.throttle) < 0.01
+
+# usage headers are turned into the remaining budget of a window
+binance = ccxt.binance({'adaptiveRateLimit': True})
+bucket = binance.throttle.bucket
+binance.handle_rate_limit_headers(CaseInsensitiveDict({'x-mbx-used-weight-1m': '1199'}))
+assert bucket.tokens <= 1
+binance.handle_rate_limit_headers(CaseInsensitiveDict({'x-mbx-used-weight-1m': '1200'}))
+assert bucket.tokens <= 0
+assert binance.rateLimitHeaders['remaining'] == 'X-RateLimit-Remaining'
+
+# 200 weights left 30 s before the end of the minute, the next request waits until they are spread over the window
+binance = ccxt.binance({'adaptiveRateLimit': True})
+binance.milliseconds = lambda: 1599999990000
+binance.handle_rate_limit_headers(CaseInsensitiveDict({'x-mbx-used-weight-1m': '1000'}))
+assert 19 < binance.throttle.bucket.reserve(0) < 21
+# and so do 20 tokens of 10 weights each, with a rateLimit of one token per 500 ms
+exchange = ccxt.Exchange({'rateLimit': 500, 'adaptiveRateLimit': True, 'rateLimitHeaders': {'used': 'used', 'limit': 1200, 'window': 60000, 'weight': 10}})
+exchange.milliseconds = lambda: 1599999990000
+exchange.handle_rate_limit_headers(CaseInsensitiveDict({'used': '1000'}))
+assert 19 < exchange.throttle.bucket.reserve(0) < 21
+
+# ------------------------------------------------------------------------------
+
+import shutil  # noqa: E402
+import subprocess  # noqa: E402
+import tempfile  # noqa: E402
+
+from ccxt.base.shared_throttle import FileBucketStore, FileTokenBucket  # noqa: E402
+
+directory = tempfile.mkdtemp()
+try:
+    # instances with the same api key draw from one budget, other keys have their own
+    config = {'rateLimit': 50, 'apiKey': 'key', 'sharedRateLimit': {'directory': directory}}
+    first = ccxt.Exchange(dict(config, id='shared'))
+    second = ccxt.Exchange(dict(config, id='shared'))
+    other = ccxt.Exchange(dict(config, id='shared', apiKey='other'))
+    assert isinstance(first.throttle.bucket, FileTokenBucket)
+    assert first.rate_limit_key() == second.rate_limit_key() != other.rate_limit_key()
+    assert 'key' not in first.rate_limit_key()
+    assert timed(first.throttle) < 0.01
+    assert 0.03 < timed(second.throttle) < 0.1
+    assert timed(other.throttle) < 0.01
+
+    # and so do processes, this one leaves a debt of 1.2 s to the next
+    FileBucketStore(directory).bucket('shared-ip', {'refillRate': 1 / 20}).reserve(61)
+    script = """
+import sys
+import time
+sys.path.append({root!r})
+import ccxt
+exchange = ccxt.Exchange({{'id': 'shared', 'rateLimit': 20, 'sharedRateLimit': {{'directory': {directory!r}}}}})
+start = time.monotonic()
+exchange.throttle()
+print(time.monotonic() - start)
+""".format(root=root, directory=directory)
+    waited = float(subprocess.check_output([sys.executable, '-c', script]))
+    assert 0.5 < waited < 1.3
+
+    # any store handing out buckets can be plugged in
+    class Store(object):
+        def __init__(self):
+            self.keys = []
+
+        def bucket(self, key, config):
+            self.keys.append(key)
+            return TokenBucket(config)
+
+    store = Store()
+    exchange = ccxt.Exchange({'id': 'shared', 'sharedRateLimit': store})
+    assert store.keys == ['shared-ip']
+    assert exchange.sharedRateLimit is store
+    assert FileBucketStore(directory).bucket('test', {'capacity': 3}).reserve(3) == 0
+finally:
+    shutil.rmtree(directory)
+
+# a rateLimit changed after the construction applies from the next request on, as with the async throttle
+
+
+class Paced(ccxt.Exchange):
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return {'url': 'https://api.example.com/' + path, 'method': method, 'headers': headers, 'body': body}
+
+    def fetch(self, url, method='GET', headers=None, body=None):
+        return {}
+
+
+exchange = Paced({'rateLimit': 1000, 'enableRateLimit': True})
+exchange.rateLimit = 20
+assert timed(exchange.fetch2, 'time') < 0.01
+assert 0.01 < timed(exchange.fetch2, 'time') < 0.1
+exchange.rateLimit = 60
+exchange.fetch2('time')
+assert 0.04 < timed(exchange.fetch2, 'time') < 0.15
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.transport import RecordingTransport, ReplayTransport, Request, Response, Transport  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class StubTransport(Transport):
+    """Answers with a fixed response and keeps the requests"""
+
+    def __init__(self, status=200, headers=None, body=b'{"serverTime":1600000000000}'):
+        self.response = Response(status, 'OK' if status < 400 else 'Error', headers or {'Content-Type': 'application/json'}, body)
+        self.requests = []
+
+    def send(self, request):
+        self.requests.append(request)
+        return self.response
+
+
+class FailingTransport(Transport):
+
+    def send(self, request):
+        raise ccxt.RequestTimeout(request.method + ' ' + request.url)
+
+
+class ClientTimeout(ccxt.RequestTimeout):
+    """An error of an http client library, built from other arguments than a message"""
+
+    def __init__(self, request, seconds):
+        super(ClientTimeout, self).__init__(request.method + ' ' + request.url + ' after ' + str(seconds) + 's')
+
+
+class ClientFailingTransport(Transport):
+
+    def send(self, request):
+        raise ClientTimeout(request, request.timeout)
+
+
+# ------------------------------------------------------------------------------
+
+# a transport of your own receives the prepared request, the response goes through the usual post-processing
+stub = StubTransport(headers={'content-type': 'application/json', 'X-Sequence': '1'})
+exchange = ccxt.Exchange({'id': 'test', 'transport': stub, 'timeout': 2500, 'headers': {'X-Custom': 'yes'}})
+assert exchange.fetch('https://api.example.com/time', 'POST', None, '{"a":1}') == {'serverTime': 1600000000000}
+request = stub.requests[0]
+assert request.method == 'POST'
+assert request.url == 'https://api.example.com/time'
+assert request.body == b'{"a":1}'
+assert request.timeout == 2.5
+assert request.headers['X-Custom'] == 'yes'
+assert exchange.last_http_response == '{"serverTime":1600000000000}'
+assert exchange.last_json_response == {'serverTime': 1600000000000}
+assert exchange.last_response_headers['Content-Type'] == 'application/json'  # case-insensitive
+assert exchange.last_response_headers['x-sequence'] == '1'
+
+# text and binary responses
+exchange.transport = StubTransport(headers={'Content-Type': 'text/plain'}, body=b'pong')
+assert exchange.fetch('https://api.example.com/ping') == 'pong'
+exchange.transport = StubTransport(headers={'Content-Type': 'application/octet-stream'}, body=b'\x00\x01')
+assert exchange.fetch('https://api.example.com/blob') == b'\x00\x01'
+
+# text is decoded with the charset of the response, utf-8 without one
+exchange.transport = StubTransport(headers={'Content-Type': 'text/plain; charset=ISO-8859-1'}, body=b'caf\xe9')
+assert exchange.fetch('https://api.example.com/ping') == u'caf\xe9'
+assert Response(200, 'OK', {'Content-Type': 'text/plain; Charset="utf-16"'}, u'ok'.encode('utf-16')).text() == 'ok'
+assert Response(200, 'OK', {'Content-Type': 'text/plain; charset=unknown'}, b'caf\xc3\xa9').text() == u'caf\xe9'
+assert Response(200, 'OK', {}, b'caf\xc3\xa9').text() == u'caf\xe9'
+
+# http errors are handled by the exchange, whatever the transport
+exchange.transport = StubTransport(503, body=b'{"code":503}')
+try:
+    exchange.fetch('https://api.example.com/time')
+    assert False
+except ccxt.ExchangeNotAvailable:
+    pass
+
+exchange.transport = StubTransport(402, body=b'{"code":402}')
+try:
+    exchange.fetch('https://api.example.com/time')
+    assert False
+except ccxt.ExchangeError as e:
+    assert str(e).startswith('test GET https://api.example.com/time 402')
+
+# network errors of the transport keep their type and get the id of the exchange
+exchange.transport = FailingTransport()
+try:
+    exchange.fetch('https://api.example.com/time')
+    assert False
+except ccxt.RequestTimeout as e:
+    assert str(e) == 'test GET https://api.example.com/time'
+
+# errors of other constructors are wrapped in the ccxt class they derive from
+exchange.transport = ClientFailingTransport()
+try:
+    exchange.fetch('https://api.example.com/time')
+    assert False
+except ccxt.RequestTimeout as e:
+    assert type(e) is ccxt.RequestTimeout
+    assert str(e) == 'test GET https://api.example.com/time after 2.5s'
+    assert isinstance(e.__cause__, ClientTimeout)
+anonymous = ccxt.Exchange({'transport': FailingTransport()})
+try:
+    anonymous.fetch('https://api.example.com/time')
+    assert False
+except ccxt.RequestTimeout as e:
+    assert str(e) == 'GET https://api.example.com/time'
+
+# the default transport is rebuilt when the session is replaced
+exchange = ccxt.Exchange()
+default = exchange.get_transport()
+assert default.client is exchange.session
+assert exchange.get_transport() is default
+exchange.session = type(exchange.session)()
+assert exchange.get_transport() is not default
+assert exchange.get_transport().client is exchange.session
+
+# ------------------------------------------------------------------------------
+
+# responses recorded once are replayed without a network
+directory = tempfile.mkdtemp()
+path = os.path.join(directory, 'binance.json')
+recorder = RecordingTransport(StubTransport(body=b'{"serverTime":1600000000000}'))
+binance = ccxt.binance({'transport': recorder})
+assert binance.fetch_time() == 1600000000000
+recorder.save(path)
+
+replay = ReplayTransport.load(path)
+binance = ccxt.binance({'transport': replay})
+assert binance.fetch_time() == 1600000000000
+assert binance.fetch_time() == 1600000000000  # the last response is repeated
+try:
+    binance.fetch('https://api.binance.com/api/v3/ping')
+    assert False
+except ccxt.ExchangeError as e:
+    assert 'no recorded response for GET https://api.binance.com/api/v3/ping' in str(e)
+
+# recorded responses are served in order
+replay = ReplayTransport()
+replay.add(Request('GET', 'https://api.example.com/n'), Response(200, 'OK', {'Content-Type': 'application/json'}, b'1'))
+replay.add(Request('GET', 'https://api.example.com/n'), Response(200, 'OK', {'Content-Type': 'application/json'}, b'2'))
+exchange = ccxt.Exchange({'id': 'test', 'transport': replay})
+assert exchange.fetch('https://api.example.com/n') == '1'
+assert exchange.fetch('https://api.example.com/n') == '2'
+assert exchange.fetch('https://api.example.com/n') == '2'
+
+# ------------------------------------------------------------------------------
+
+
+class AsyncStubTransport(StubTransport):
+
+    async def send(self, request):
+        await asyncio.sleep(0)
+        return StubTransport.send(self, request)
+
+
+async def main():
+    # synchronous transports serve async instances too, no aiohttp session is opened for them
+    exchange = ccxt.async_support.binance({'transport': ReplayTransport.load(path)})
+    assert await exchange.fetch_time() == 1600000000000
+    assert exchange.session is None
+    await exchange.close()
+
+    stub = AsyncStubTransport()
+    recorder = RecordingTransport(stub)
+    exchange = ccxt.async_support.Exchange({'id': 'test', 'transport': recorder, 'aiohttp_proxy': 'http://proxy:3128'})
+    assert await exchange.fetch('https://api.example.com/time') == {'serverTime': 1600000000000}
+    assert stub.requests[0].proxy == 'http://proxy:3128'
+    assert recorder.records[0]['url'] == 'https://api.example.com/time'
+
+    # unlike the sync client, the body of an error status the exchange does not map is returned
+    exchange.transport = StubTransport(402, body=b'{"code":402}')
+    assert await exchange.fetch('https://api.example.com/time') == {'code': 402}
+
+    exchange.transport = StubTransport(429, body=b'{}')
+    try:
+        await exchange.fetch('https://api.example.com/time')
+        assert False
+    except ccxt.RateLimitExceeded:
+        pass
+    await exchange.close()
+
+
+asyncio.get_event_loop().run_until_complete(main())
+
+shutil.rmtree(directory)